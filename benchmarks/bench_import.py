@@ -0,0 +1,127 @@
+"""
+Import-time benchmark for the component package.
+
+Runs each import statement in a fresh interpreter with `python -X importtime`,
+keeps the best cumulative time over several runs and compares it against
+the committed baseline. Exits non-zero when an import regresses by more
+than the threshold.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--threshold 0.25] [--update]
+
+Run with --update after intentional changes (or on a new machine) to
+refresh benchmarks/import_baseline.json.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'import_baseline.json')
+
+# Import statements whose cost is tracked
+IMPORTS = [
+    'import src.components',
+    'import src.components.base',
+    'from src.components import Text',
+    'from src.components import JSONDisplay',
+    'from src import *',
+]
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)\S')
+
+
+def measure(statement: str) -> int:
+    """
+    Measure the import time of one statement in a fresh interpreter.
+
+    The cost is the sum of the cumulative times of the top-level imports the
+    statement triggers, so work done by any package on the way is included.
+
+    Args:
+        statement (str): Import statement to execute
+
+    Returns:
+        int: Import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        # Top-level imports have a single space before the module name
+        if match and len(match.group(3)) == 1:
+            total += int(match.group(2))
+    return total
+
+
+def run(runs: int) -> Dict[str, int]:
+    """
+    Measure every statement, keeping the best of several runs.
+
+    Args:
+        runs (int): Fresh interpreters per statement
+
+    Returns:
+        Dict[str, int]: Best microseconds per statement, net of startup
+    """
+    # Interpreter startup imports (site, encodings, ...) are reported as
+    # top-level imports too; subtract them from every statement.
+    startup = min(measure('pass') for _ in range(runs))
+    return {
+        statement: max(0, min(measure(statement) for _ in range(runs)) - startup)
+        for statement in IMPORTS
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='fresh interpreters per statement')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown relative to the baseline')
+    parser.add_argument('--min-delta', type=int, default=2000,
+                        help='ignore slowdowns smaller than this many microseconds')
+    parser.add_argument('--update', action='store_true',
+                        help='write the measurements as the new baseline')
+    args = parser.parse_args()
+
+    results = run(args.runs)
+
+    if args.update or not os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"Baseline written to {BASELINE_PATH}")
+
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    regressions = 0
+    print(f"{'statement':<42}{'baseline (us)':>15}{'now (us)':>12}{'change':>9}")
+    for statement, now in results.items():
+        before = baseline.get(statement)
+        if not before:
+            print(f"{statement:<42}{'-':>15}{now:>12}{'new':>9}")
+            continue
+        change = now / before - 1
+        flag = ''
+        if change > args.threshold and now - before > args.min_delta:
+            regressions += 1
+            flag = '  REGRESSION'
+        print(f"{statement:<42}{before:>15}{now:>12}{change:>9.0%}{flag}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
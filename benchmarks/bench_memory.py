@@ -0,0 +1,153 @@
+"""
+Memory footprint benchmark for the component classes.
+
+Reports the bytes allocated per component instance and per 1k-node
+Container tree, comparing the slotted classes against equivalent
+dict-backed subclasses (the layout before __slots__ was introduced).
+
+Usage:
+    python benchmarks/bench_memory.py [--count N] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.components import (  # noqa: E402
+    Button, Container, Header, ImageDisplay, JSONDisplay,
+    Layout, Sidebar, Text
+)
+
+
+@lru_cache(maxsize=None)
+def _with_dict(cls: type) -> type:
+    """
+    Create a subclass of cls that carries a per-instance __dict__.
+
+    Args:
+        cls (type): Slotted component class
+
+    Returns:
+        type: Dict-backed equivalent used as the "before" measurement
+    """
+    return type(f"{cls.__name__}WithDict", (cls,), {})
+
+
+def _measure(factory: Callable[[], Any], count: int) -> float:
+    """
+    Measure the average bytes allocated per object built by factory.
+
+    Args:
+        factory (Callable[[], Any]): Builds one object
+        count (int): Number of objects to build
+
+    Returns:
+        float: Average bytes per object
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # Exclude the list holding the objects themselves
+    allocated -= sys.getsizeof(objects)
+    return allocated / count
+
+
+def _factories(variant: Callable[[type], type]) -> Dict[str, Callable[[], Any]]:
+    """
+    Build one factory per component class for the given class variant.
+
+    Args:
+        variant (Callable[[type], type]): Maps a class to the class to measure
+
+    Returns:
+        Dict[str, Callable[[], Any]]: Factories keyed by component name
+    """
+    def sidebar() -> Sidebar:
+        bar = variant(Sidebar)()
+        bar.add_section("Home")
+        bar.add_section("About")
+        return bar
+
+    return {
+        'Text': lambda: variant(Text)("Hello"),
+        'Header': lambda: variant(Header)("Hello"),
+        'Button': lambda: variant(Button)("Click"),
+        'JSONDisplay': lambda: variant(JSONDisplay)({}),
+        'ImageDisplay': lambda: variant(ImageDisplay)("image.png"),
+        'Container': lambda: variant(Container)(),
+        'Layout': lambda: variant(Layout)(),
+        'Sidebar (2 items)': sidebar,
+    }
+
+
+def _tree(variant: Callable[[type], type], nodes: int = 1000) -> Container:
+    """
+    Build a Container holding nodes Text components.
+
+    Args:
+        variant (Callable[[type], type]): Maps a class to the class to measure
+        nodes (int): Number of child components
+
+    Returns:
+        Container: Populated tree
+    """
+    text_cls = variant(Text)
+    container = variant(Container)()
+    for i in range(nodes):
+        container.add(text_cls("item"))
+    return container
+
+
+def run(count: int) -> Dict[str, Dict[str, float]]:
+    """
+    Run the benchmark for slotted and dict-backed classes.
+
+    Args:
+        count (int): Instances built per component class
+
+    Returns:
+        Dict[str, Dict[str, float]]: Bytes per object keyed by name then variant
+    """
+    variants = {
+        'dict': _with_dict,
+        'slots': lambda cls: cls,
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for variant_name, variant in variants.items():
+        for name, factory in _factories(variant).items():
+            results.setdefault(name, {})[variant_name] = _measure(factory, count)
+        tree_bytes = _measure(lambda: _tree(variant), max(1, count // 1000))
+        results.setdefault('1k-node tree', {})[variant_name] = tree_bytes
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=10000,
+                        help='instances built per component class')
+    parser.add_argument('--json', action='store_true',
+                        help='print machine-readable JSON')
+    args = parser.parse_args()
+
+    results = run(args.count)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'component':<20}{'dict (B)':>12}{'slots (B)':>12}{'saved':>8}")
+    for name, row in results.items():
+        saved = 1 - row['slots'] / row['dict'] if row['dict'] else 0.0
+        print(f"{name:<20}{row['dict']:>12.0f}{row['slots']:>12.0f}{saved:>8.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""
+Headless render benchmark for the components and the example app.
+
+Each case rebuilds and renders its components into a recording fake of the
+Streamlit API (test/recording.py), the way a script rerun would.
+It reports the best wall time over several runs, plus the elements,
+layout blocks and payload bytes emitted. Results are compared against the
+committed baseline. The script exits non-zero when a case regresses by
+more than the threshold, in time or in bytes sent.
+
+Usage:
+    python benchmarks/bench_render.py [--runs N] [--threshold 0.25] [--update] [--json]
+
+Run with --update after intentional changes (or on a new machine) to
+refresh benchmarks/render_baseline.json.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'render_baseline.json')
+
+sys.path.insert(0, ROOT)
+# app.py imports the package as `components`
+sys.path.insert(1, os.path.join(ROOT, 'src'))
+# The recording fake lives with the tests; `test` itself would resolve to
+# the standard library package
+sys.path.insert(2, os.path.join(ROOT, 'test'))
+
+from src.components import (  # noqa: E402
+    Button, Container, Gallery, Header, ImageDisplay, JSONDisplay,
+    Layout, Sidebar, Text
+)
+from recording import RecordingStreamlit  # noqa: E402
+
+# A 1x1 PNG, so image cases measure the components and not decoding
+PIXEL = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082'
+)
+
+
+def _container(count: int) -> Callable[[], Any]:
+    def rerun() -> None:
+        Container([Text(f"Item {i}") for i in range(count)], key='items').render()
+    return rerun
+
+
+def _layout() -> None:
+    layout = Layout(key='layout')
+    layout.columns([1, 2, 1])
+    layout.with_columns([Text("left"), lambda: Header("middle").render(), None])
+    layout.spacer(3)
+
+
+def _sidebar() -> None:
+    sidebar = Sidebar()
+    for name in ("Home", "Features", "Pricing", "Docs", "Contact"):
+        sidebar.add_section(name)
+    sidebar.render()
+
+
+def _app() -> None:
+    import app
+    app.main()
+
+
+# Case name -> rerun callable
+CASES: Dict[str, Callable[[], Any]] = {
+    'text': lambda: Text("Hello, world").render(),
+    'text_styled': lambda: Text("Hello, world").render(style={'color': 'red'}),
+    'header': lambda: Header("Section").render(level=2),
+    'button': lambda: Button("Go", key='go').render(),
+    'json': lambda: JSONDisplay({'users': [{'id': i, 'name': f"user {i}"} for i in range(100)]}).render(),
+    'image': lambda: ImageDisplay(PIXEL).render(),
+    'gallery_12': lambda: Gallery([PIXEL] * 12, key='gallery').render(),
+    'layout': _layout,
+    'sidebar': _sidebar,
+    'container_10': _container(10),
+    'container_1k': _container(1000),
+    'container_100k': _container(100000),
+    'app_main': _app,
+}
+
+
+def measure(rerun: Callable[[], Any], runs: int) -> Dict[str, Any]:
+    """
+    Run one case repeatedly against a fresh recording session.
+
+    Args:
+        rerun (Callable[[], Any]): Builds and renders the case
+        runs (int): Reruns to time
+
+    Returns:
+        Dict[str, Any]: Best microseconds and the last run's element stats
+    """
+    recording = RecordingStreamlit()
+    timings: List[float] = []
+    with recording:
+        for _ in range(runs):
+            recording.rerun()
+            start = time.perf_counter()
+            rerun()
+            timings.append(time.perf_counter() - start)
+    return {'us': round(min(timings) * 1e6), **recording.stats()}
+
+
+def run(runs: int, only: Tuple[str, ...] = ()) -> Dict[str, Dict[str, Any]]:
+    """
+    Measure every case (or the selected ones).
+
+    Args:
+        runs (int): Reruns per case
+        only (Tuple[str, ...]): Case names to run; all when empty
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Results per case
+    """
+    return {
+        name: measure(rerun, runs)
+        for name, rerun in CASES.items()
+        if not only or name in only
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='reruns per case')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown or payload growth relative to the baseline')
+    parser.add_argument('--min-delta', type=int, default=200,
+                        help='ignore slowdowns smaller than this many microseconds')
+    parser.add_argument('--only', nargs='*', default=(),
+                        help='case names to run')
+    parser.add_argument('--update', action='store_true',
+                        help='write the measurements as the new baseline')
+    parser.add_argument('--json', action='store_true',
+                        help='print results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.runs, tuple(args.only))
+
+    if args.update or not os.path.exists(BASELINE_PATH):
+        baseline = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        print(f"Baseline written to {BASELINE_PATH}", file=sys.stderr)
+
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        slower = now['us'] / max(before['us'], 1) - 1
+        if slower > args.threshold and now['us'] - before['us'] > args.min_delta:
+            regressions.append((name, 'time'))
+        if now['bytes'] > before['bytes'] * (1 + args.threshold):
+            regressions.append((name, 'bytes'))
+
+    if args.json:
+        print(json.dumps({'results': results, 'regressions': regressions}, indent=2))
+    else:
+        print(f"{'case':<16}{'baseline (us)':>15}{'now (us)':>12}{'change':>9}"
+              f"{'elements':>10}{'blocks':>8}{'bytes':>10}")
+        flagged = {name for name, _ in regressions}
+        for name, now in results.items():
+            before = baseline.get(name)
+            change = f"{now['us'] / max(before['us'], 1) - 1:.0%}" if before else 'new'
+            flag = '  REGRESSION' if name in flagged else ''
+            print(f"{name:<16}{before['us'] if before else '-':>15}{now['us']:>12}{change:>9}"
+                  f"{now['elements']:>10}{now['blocks']:>8}{now['bytes']:>10}{flag}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,328 @@
+"""
+Concurrent-session load test for src/app.py.
+
+Runs N simulated sessions against the app with Streamlit's app-testing
+harness (streamlit.testing.v1.AppTest). Each session count runs in a
+fresh worker process with one thread per session, as one server worker
+would serve them; all sessions start together once each is ready. Each
+session loads the page, then performs a seeded, scripted mix of sidebar
+and call to action clicks and plain reruns.
+
+AppTest installs a mock Streamlit runtime for every run and removes it
+afterwards, which breaks concurrent runs in one process. The worker pins
+the first runtime for the life of the process instead, matching the
+single runtime a real server worker shares between its sessions.
+
+The report is printed as JSON: rerun latency p50/p95/p99 (overall and per
+action), throughput, errors, and the worker's baseline and peak RSS.
+Exceptions raised by the app are counted as errors; failures of the
+harness itself (a lookup or rerun that AppTest could not perform) are
+counted separately as harness errors.
+
+Usage:
+    python benchmarks/loadtest.py [--sessions 1 4 16] [--interactions 20] [--seed 0] [--output FILE]
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, 'src', 'app.py')
+
+# Scripted interaction mix: (action, button key, weight)
+MIX: Tuple[Tuple[str, Optional[str], int], ...] = (
+    ('rerun', None, 2),
+    ('sidebar', 'sidebar/0', 1),
+    ('sidebar', 'sidebar/1', 1),
+    ('sidebar', 'sidebar/2', 1),
+    ('button', 'get_started', 2),
+    ('button', 'view_demo', 2),
+)
+
+# Seconds a single rerun may take before it counts as an error
+RERUN_TIMEOUT = 60
+
+# Outcome of one rerun
+OK, APP_ERROR, HARNESS_ERROR = 'ok', 'app_error', 'harness_error'
+
+
+def current_rss() -> int:
+    """
+    Resident set size of this process.
+
+    Returns:
+        int: Bytes, or 0 where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def peak_rss() -> int:
+    """
+    Peak resident set size of this process.
+
+    Returns:
+        int: Bytes
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values (Sequence[float]): Sorted samples
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: Sample at the percentile, or 0.0 without samples
+    """
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """
+    Latency distribution in milliseconds.
+
+    Args:
+        latencies (List[float]): Rerun latencies in seconds
+
+    Returns:
+        Dict[str, float]: Count, mean, p50, p95, p99 and max
+    """
+    ordered = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        'count': len(ordered),
+        'mean': ms(sum(ordered) / len(ordered)) if ordered else 0.0,
+        'p50': ms(percentile(ordered, 50)),
+        'p95': ms(percentile(ordered, 95)),
+        'p99': ms(percentile(ordered, 99)),
+        'max': ms(ordered[-1]) if ordered else 0.0,
+    }
+
+
+def pin_runtime() -> None:
+    """
+    Keep one Streamlit runtime for the rest of this process.
+
+    The first runtime an AppTest run installs is returned from then on,
+    even after that run removes it, config lookups keep the app-test
+    overrides, and every run shares one script cache, so runs on several
+    threads do not tear down each other's environment.
+    """
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    pinned: List[Any] = []
+    lock = threading.Lock()
+
+    def instance(cls: type) -> Any:
+        with lock:
+            if not pinned:
+                if cls._instance is None:
+                    raise RuntimeError("Runtime hasn't been created!")
+                pinned.append(cls._instance)
+            return pinned[0]
+
+    # Compile the script once for all sessions, as the server's shared
+    # script cache does; CPython's parser is not safe to run on several
+    # threads at once
+    shared_cache = ScriptCache()
+    get_bytecode = ScriptCache.get_bytecode
+    ScriptCache.get_bytecode = lambda self, script_path: get_bytecode(shared_cache, script_path)
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: bool(pinned) or cls._instance is not None)
+    config.get_option = build_mock_config_get_option({'global.appTest': True})
+
+
+def session(
+    app: Any,
+    index: int,
+    interactions: int,
+    seed: int,
+    start: threading.Barrier,
+    samples: List[Tuple[str, float, str]]
+) -> None:
+    """
+    Drive one simulated session on the calling thread.
+
+    Args:
+        app (Any): The session's AppTest
+        index (int): Session number, mixed into the seed
+        interactions (int): Interactions after the initial page load
+        seed (int): Base seed of the scripted mix
+        start (threading.Barrier): Released when every session is ready
+        samples (List[Tuple[str, float, str]]): Receives (action, seconds,
+            outcome) per rerun
+    """
+    rng = random.Random(seed * 100003 + index)
+    actions = [(action, key) for action, key, _ in MIX]
+    weights = [weight for _, _, weight in MIX]
+    start.wait()
+
+    plan = [('load', None)] + rng.choices(actions, weights, k=interactions)
+    for action, key in plan:
+        began = time.perf_counter()
+        try:
+            if key is not None:
+                app.button(key=key).click()
+            app.run()
+        except Exception:
+            outcome = HARNESS_ERROR
+        else:
+            outcome = APP_ERROR if app.exception else OK
+        samples.append((action, time.perf_counter() - began, outcome))
+
+
+def worker(sessions: int, interactions: int, seed: int, results: Any) -> None:
+    """
+    Serve one session count from this process, one thread per session.
+
+    Args:
+        sessions (int): Concurrent sessions
+        interactions (int): Interactions per session after the page load
+        seed (int): Seed of the scripted mix
+        results (Any): Queue receiving the samples, wall time and RSS
+    """
+    from streamlit import config
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+
+    # Keep bare-mode warnings out of the report; parsing the config first
+    # stops it from resetting the level later
+    config.get_config_options()
+    set_log_level('error')
+    pin_runtime()
+    # One unmeasured load imports the app and pins the runtime
+    AppTest.from_file(APP_PATH, default_timeout=RERUN_TIMEOUT).run()
+    baseline = current_rss()
+
+    apps = [AppTest.from_file(APP_PATH, default_timeout=RERUN_TIMEOUT) for _ in range(sessions)]
+    start = threading.Barrier(sessions + 1)
+    samples: List[Tuple[str, float, str]] = []
+    threads = [
+        threading.Thread(
+            target=session,
+            args=(app, index, interactions, seed, start, samples),
+            name=f"session-{index}"
+        )
+        for index, app in enumerate(apps)
+    ]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - began
+
+    results.put({'samples': samples, 'wall': wall, 'baseline': baseline, 'peak': peak_rss()})
+
+
+def run_level(sessions: int, interactions: int, seed: int) -> Dict[str, Any]:
+    """
+    Run one session count in a fresh worker process.
+
+    Args:
+        sessions (int): Concurrent sessions
+        interactions (int): Interactions per session after the page load
+        seed (int): Seed of the scripted mix
+
+    Returns:
+        Dict[str, Any]: Latency, throughput, error and memory report
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(
+        target=worker,
+        args=(sessions, interactions, seed, results),
+        name=f"worker-{sessions}"
+    )
+    process.start()
+    # Read the report before joining so the worker never blocks on a full pipe
+    report = results.get()
+    process.join()
+
+    samples = report['samples']
+    wall = report['wall']
+    by_action: Dict[str, List[float]] = {}
+    for action, seconds, _ in samples:
+        by_action.setdefault(action, []).append(seconds)
+    return {
+        'sessions': sessions,
+        'reruns': len(samples),
+        'errors': sum(1 for _, _, outcome in samples if outcome == APP_ERROR),
+        'harness_errors': sum(1 for _, _, outcome in samples if outcome == HARNESS_ERROR),
+        'wall_seconds': round(wall, 3),
+        'throughput_rps': round(len(samples) / wall, 2) if wall else 0.0,
+        'latency_ms': summarize([seconds for _, seconds, _ in samples]),
+        'latency_ms_by_action': {
+            action: summarize(values) for action, values in sorted(by_action.items())
+        },
+        'rss_bytes': {
+            'baseline': report['baseline'],
+            'peak': report['peak'],
+            'per_session': max(0, report['peak'] - report['baseline']) // sessions,
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 4, 16],
+                        help='concurrent session counts to test')
+    parser.add_argument('--interactions', type=int, default=20,
+                        help='interactions per session after the page load')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the scripted interaction mix')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    args = parser.parse_args()
+
+    levels = []
+    for count in args.sessions:
+        level = run_level(count, args.interactions, args.seed)
+        levels.append(level)
+        latency = level['latency_ms']
+        print(
+            f"{count:>4} sessions: p50 {latency['p50']} ms, p95 {latency['p95']} ms, "
+            f"p99 {latency['p99']} ms, {level['throughput_rps']} reruns/s, "
+            f"{level['errors']} errors, {level['harness_errors']} harness errors",
+            file=sys.stderr
+        )
+
+    report = {
+        'app': os.path.relpath(APP_PATH, ROOT),
+        'interactions': args.interactions,
+        'seed': args.seed,
+        'mix': [{'action': a, 'key': k, 'weight': w} for a, k, w in MIX],
+        'levels': levels,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
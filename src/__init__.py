@@ -1,5 +1,10 @@
-# Import key components or modules to make them easily accessible
-from .components import *
+# Key components are exposed lazily: `from src import Text` only imports
+# the text module, not the whole component package.
+from typing import TYPE_CHECKING, Any
+from .components import __all__ as _component_names
+
+if TYPE_CHECKING:
+    from .components import *
 
 # Optional: Define package-level metadata
 __version__ = "1.0.0"
@@ -11,6 +16,15 @@ DEFAULT_CONFIG = {
     "debug_mode": True
 }
 
+__all__ = [*_component_names, 'DEFAULT_CONFIG', 'init_app']
+
+
+def __getattr__(name: str) -> Any:
+    if name in _component_names:
+        from . import components
+        return getattr(components, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Optional: Any package-level initialization logic
 def init_app():
     """
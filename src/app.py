@@ -1,170 +1,202 @@
+import os
 import streamlit as st
 from components import (
-    Layout, 
-    Container, 
     Text, 
     Header, 
     Button, 
     Sidebar, 
-    ImageDisplay
+    CallNode,
+    ColumnsNode,
+    FragmentNode,
+    ComponentNode,
+    build_once,
+    style_registry
 )
+from components.persistence import enable_persistence
 
-def main():
-    # Create layout
-    layout = Layout()
+# Set to a SQLite file path to keep cached outputs across restarts and
+# deploys; persistence is off when unset. Bump the version whenever the
+# page's cached output changes.
+CACHE_PATH_ENV = "COMPONENTS_CACHE_PATH"
+CACHE_VERSION = "1"
+
+# Card styles are interned once as CSS classes shared by every card
+CARD_STYLE = {
+    "border": "1px solid #e1e4e8",
+    "border-radius": "6px",
+    "padding": "20px",
+    "text-align": "center"
+}
+FEATURE_CARD_STYLE = {**CARD_STYLE, "transition": "all 0.3s ease"}
+PRICING_CARD_STYLE = {**CARD_STYLE, "background-color": "#f6f8fa"}
+FEATURED_PRICING_CARD_STYLE = {**CARD_STYLE, "background-color": "#e1e4e8"}
+PRICE_UNIT_STYLE = {"font-size": "0.5em"}
+FEATURE_LIST_STYLE = {"list-style-type": "none", "padding": "0"}
+SELECT_BUTTON_STYLE = {
+    "background-color": "#2ea44f",
+    "color": "white",
+    "border": "none",
+    "padding": "10px 20px",
+    "border-radius": "6px",
+    "cursor": "pointer"
+}
+FEATURED_SELECT_BUTTON_STYLE = {**SELECT_BUTTON_STYLE, "background-color": "#0366d6"}
+
+@build_once
+def landing_page():
+    """
+    Build the landing page tree once per process.
     
+    The page is static, so every session renders the same frozen tree
+    instead of rebuilding its components on each rerun.
+    """
     # Sidebar Navigation
     sidebar = Sidebar()
     sidebar.add_section("Home")
     sidebar.add_section("Features")
     sidebar.add_section("Pricing")
-    sidebar.render()
     
-    # Hero Section
-    layout.columns([1, 2, 1])
-    layout.with_columns([
-        lambda: None,  # Empty left column
-        lambda: _render_hero_section(),
-        lambda: None   # Empty right column
-    ])
-    
-    # Features Section
-    layout.divider()
-    _render_features_section(layout)
-    
-    # Pricing Section
-    layout.divider()
-    _render_pricing_section(layout)
+    return [
+        ComponentNode(sidebar),
+        # Hero Section
+        ColumnsNode([1, 2, 1], [
+            [],  # Empty left column
+            _hero_section(),
+            []   # Empty right column
+        ]),
+        # Features Section
+        CallNode(st.divider),
+        *_features_section(),
+        # Pricing Section
+        CallNode(st.divider),
+        *_pricing_section()
+    ]
+
+def main():
+    # Caches load lazily from disk, so a restarted worker starts warm
+    cache_path = os.environ.get(CACHE_PATH_ENV)
+    if cache_path:
+        enable_persistence(cache_path, CACHE_VERSION)
+    # One <style> block for every class the page references
+    with style_registry.page():
+        landing_page().render()
 
-def _render_hero_section():
+def _hero_section():
     """
-    Render the hero section of the landing page.
+    Build the hero section of the landing page.
     """
-    # Container for hero content
-    hero_container = Container()
-    
-    # Header
-    hero_header = Header("Revolutionize Your Workflow")
-    hero_header.render(level=1)
-    
-    # Subheader
-    Text("Streamline your projects with cutting-edge components").render()
-    
-    # Call to Action Buttons
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        start_button = Button(
-            text="Get Started", 
-            action=lambda: st.success("Welcome aboard!")
-        )
-        start_button.render()
+    return [
+        # Header
+        ComponentNode(Header("Revolutionize Your Workflow"), level=1),
+        # Subheader
+        ComponentNode(Text("Streamline your projects with cutting-edge components")),
+        # Call to Action Buttons: clicks rerun only this section
+        FragmentNode([CallNode(_call_to_action)])
+    ]
+
+def _call_to_action():
+    """
+    Render the call to action buttons.
     
-    with col2:
-        demo_button = Button(
-            text="View Demo", 
-            action=lambda: st.info("Launching demo...")
-        )
-        demo_button.render()
+    Runs inside a fragment, so the confirmation is shown in the fragment
+    body rather than from the click callback.
+    """
+    get_started, view_demo = st.columns(2)
+    with get_started:
+        if Button(text="Get Started", key="get_started").render():
+            st.success("Welcome aboard!")
+    with view_demo:
+        if Button(text="View Demo", key="view_demo").render():
+            st.info("Launching demo...")
 
-def _render_features_section(layout):
+def _features_section():
     """
-    Render the features section with a grid layout.
+    Build the features section with a grid layout.
     """
-    # Features Header
-    Header("Why Choose Our Solution").render(level=2)
-    Text("Powerful features designed to supercharge your productivity").render()
-    
-    # Create 3 columns for features
-    layout.columns(3)
-    layout.with_columns([
-        lambda: _feature_card(
-            "🚀 Lightning Fast", 
-            "Optimized components for maximum performance"
-        ),
-        lambda: _feature_card(
-            "🔧 Highly Customizable", 
-            "Flexible design that adapts to your unique needs"
-        ),
-        lambda: _feature_card(
-            "📊 Data-Driven", 
-            "Seamless integration with your data workflows"
-        )
-    ])
+    return [
+        # Features Header
+        ComponentNode(Header("Why Choose Our Solution"), level=2),
+        ComponentNode(Text("Powerful features designed to supercharge your productivity")),
+        # Create 3 columns for features
+        ColumnsNode(3, [
+            [CallNode(
+                _feature_card,
+                "🚀 Lightning Fast", 
+                "Optimized components for maximum performance"
+            )],
+            [CallNode(
+                _feature_card,
+                "🔧 Highly Customizable", 
+                "Flexible design that adapts to your unique needs"
+            )],
+            [CallNode(
+                _feature_card,
+                "📊 Data-Driven", 
+                "Seamless integration with your data workflows"
+            )]
+        ])
+    ]
 
 def _feature_card(title: str, description: str):
     """
     Create a feature card with title and description.
     """
     st.markdown(f"""
-    <div style="
-        border: 1px solid #e1e4e8;
-        border-radius: 6px;
-        padding: 20px;
-        text-align: center;
-        transition: all 0.3s ease;
-    " onmouseover="this.style.transform='scale(1.05)'"
+    <div {style_registry.attribute(FEATURE_CARD_STYLE)} onmouseover="this.style.transform='scale(1.05)'"
     onmouseout="this.style.transform='scale(1)'">
         <h3>{title}</h3>
         <p>{description}</p>
     </div>
     """, unsafe_allow_html=True)
 
-def _render_pricing_section(layout):
+def _pricing_section():
     """
-    Render the pricing section with different tiers.
+    Build the pricing section with different tiers.
     """
-    # Pricing Header
-    Header("Simple, Transparent Pricing").render(level=2)
-    Text("Choose the plan that fits your needs").render()
-    
-    # Create 3 columns for pricing tiers
-    layout.columns(3)
-    layout.with_columns([
-        lambda: _pricing_card(
-            "Starter", 
-            "$0", 
-            ["Basic Components", "Community Support", "Limited Access"]
-        ),
-        lambda: _pricing_card(
-            "Pro", 
-            "$29", 
-            ["Advanced Components", "Priority Support", "Regular Updates"]
-        ),
-        lambda: _pricing_card(
-            "Enterprise", 
-            "Custom", 
-            ["Full Access", "Dedicated Support", "Custom Solutions"]
-        )
-    ])
+    return [
+        # Pricing Header
+        ComponentNode(Header("Simple, Transparent Pricing"), level=2),
+        ComponentNode(Text("Choose the plan that fits your needs")),
+        # Create 3 columns for pricing tiers
+        ColumnsNode(3, [
+            [CallNode(
+                _pricing_card,
+                "Starter", 
+                "$0", 
+                ["Basic Components", "Community Support", "Limited Access"]
+            )],
+            [CallNode(
+                _pricing_card,
+                "Pro", 
+                "$29", 
+                ["Advanced Components", "Priority Support", "Regular Updates"]
+            )],
+            [CallNode(
+                _pricing_card,
+                "Enterprise", 
+                "Custom", 
+                ["Full Access", "Dedicated Support", "Custom Solutions"]
+            )]
+        ])
+    ]
 
 def _pricing_card(title: str, price: str, features: list):
     """
     Create a pricing card with different tiers.
     """
+    featured = title == 'Pro'
+    card_style = FEATURED_PRICING_CARD_STYLE if featured else PRICING_CARD_STYLE
+    button_style = FEATURED_SELECT_BUTTON_STYLE if featured else SELECT_BUTTON_STYLE
     st.markdown(f"""
-    <div style="
-        border: 1px solid #e1e4e8;
-        border-radius: 6px;
-        padding: 20px;
-        text-align: center;
-        background-color: {'#f6f8fa' if title != 'Pro' else '#e1e4e8'};
-    ">
+    <div {style_registry.attribute(card_style)}>
         <h3>{title}</h3>
-        <h1>{price} <small style="font-size: 0.5em;">{'/month' if price != 'Custom' else ''}</small></h1>
-        <ul style="list-style-type: none; padding: 0;">
+        <h1>{price} <small {style_registry.attribute(PRICE_UNIT_STYLE)}>{'/month' if price != 'Custom' else ''}</small></h1>
+        <ul {style_registry.attribute(FEATURE_LIST_STYLE)}>
             {''.join(f'<li>✓ {feature}</li>' for feature in features)}
         </ul>
-        <button style="
-            background-color: {'#0366d6' if title == 'Pro' else '#2ea44f'};
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 6px;
-            cursor: pointer;
-        ">Select {title}</button>
+        <button {style_registry.attribute(button_style)}>Select {title}</button>
     </div>
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
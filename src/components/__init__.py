@@ -1,16 +1,88 @@
-from .base import BaseComponent
-from .button import Button
-from .container import Container
-from .data_display import JSONDisplay
-from .header import Header
-from .image import ImageDisplay
-from .layout import Layout
-from .navigation import Sidebar
-from .text import Text
-from .title import Title
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Component classes are loaded on first attribute access so that importing
+# one component does not pay for every module (and Streamlit) up front.
+_LAZY_ATTRS = {
+    'BaseComponent': '.base',
+    'Button': '.button',
+    'Container': '.container',
+    'DataCache': '.cache',
+    'DiskStore': '.persistence',
+    'enable_persistence': '.persistence',
+    'prewarm': '.persistence',
+    'cached': '.cache',
+    'data_cache': '.cache',
+    'JSONDisplay': '.data_display',
+    'Gallery': '.gallery',
+    'Header': '.header',
+    'ImageDisplay': '.image',
+    'Layout': '.layout',
+    'LiveView': '.container',
+    'Markdown': '.optimizer',
+    'Spacer': '.optimizer',
+    'optimize': '.optimizer',
+    'optimizer_stats': '.optimizer',
+    'RenderProfiler': '.profiling',
+    'profiler': '.profiling',
+    'Router': '.navigation',
+    'StyleRegistry': '.styles',
+    'style_registry': '.styles',
+    'Sidebar': '.navigation',
+    'Text': '.text',
+    'Title': '.title',
+    'CallNode': '.tree',
+    'ColumnsNode': '.tree',
+    'ComponentNode': '.tree',
+    'FragmentNode': '.tree',
+    'FrozenTree': '.tree',
+    'Node': '.tree',
+    'build_once': '.tree',
+    'freeze': '.tree',
+}
+
+if TYPE_CHECKING:
+    from .base import BaseComponent
+    from .button import Button
+    from .cache import DataCache, cached, data_cache
+    from .persistence import DiskStore, enable_persistence, prewarm
+    from .container import Container, LiveView
+    from .data_display import JSONDisplay
+    from .gallery import Gallery
+    from .header import Header
+    from .image import ImageDisplay
+    from .layout import Layout
+    from .navigation import Router, Sidebar
+    from .optimizer import Markdown, Spacer, optimize, optimizer_stats
+    from .profiling import RenderProfiler, profiler
+    from .styles import StyleRegistry, style_registry
+    from .text import Text
+    from .title import Title
+    from .tree import (
+        CallNode, ColumnsNode, ComponentNode, FragmentNode, FrozenTree,
+        Node, build_once, freeze
+    )
 
 __all__ = [
     'BaseComponent', 'Button', 'Container', 'JSONDisplay',
-    'Header', 'ImageDisplay', 'Layout', 'Sidebar',
-    'Text', 'Title'
+    'Header', 'ImageDisplay', 'Gallery', 'Layout', 'Sidebar', 'Router',
+    'Text', 'Title', 'Node', 'ComponentNode', 'CallNode',
+    'ColumnsNode', 'FragmentNode', 'FrozenTree', 'freeze', 'build_once',
+    'StyleRegistry', 'style_registry', 'Markdown', 'Spacer', 'optimize',
+    'optimizer_stats', 'LiveView', 'RenderProfiler', 'profiler',
+    'DataCache', 'data_cache', 'cached', 'DiskStore', 'enable_persistence',
+    'prewarm'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
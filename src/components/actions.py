@@ -0,0 +1,135 @@
+import streamlit as st
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Callable, Optional
+from .base import KEY_SEPARATOR
+from .concurrency import submit_action
+from .fragments import render_fragment
+
+# Seconds between progress checks while a background action runs
+POLL_INTERVAL = 0.5
+
+
+class ActionResult:
+    """
+    Outcome of a finished background action.
+    """
+
+    __slots__ = ('value', 'error')
+
+    def __init__(self, value: Any = None, error: Optional[BaseException] = None):
+        """
+        Initialize the result.
+
+        Args:
+            value (Any): Return value of the action
+            error (Optional[BaseException]): Exception raised by the action
+        """
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the action completed without raising."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"ActionResult(value={self.value!r}, error={self.error!r})"
+
+
+def _task_key(key: str) -> str:
+    return f"{key}{KEY_SEPARATOR}task"
+
+
+def _result_key(key: str) -> str:
+    return f"{key}{KEY_SEPARATOR}result"
+
+
+def start_action(key: str, action: Callable[[], Any]) -> Future:
+    """
+    Submit a widget's action unless one is already running for its key.
+
+    Repeated clicks while the action runs return the running future, so a
+    double-click never starts the action twice.
+
+    Args:
+        key (str): Widget key
+        action (Callable[[], Any]): Action to run; must not call Streamlit
+
+    Returns:
+        Future: The running action
+    """
+    running = st.session_state.get(_task_key(key))
+    if running is not None and not running.done():
+        return running
+    st.session_state.pop(_result_key(key), None)
+    future = submit_action(action)
+    st.session_state[_task_key(key)] = future
+    return future
+
+
+def action_running(key: str) -> bool:
+    """
+    Check whether a widget's action is still running.
+
+    Finished actions have their outcome moved to session state, where
+    action_result picks it up.
+
+    Args:
+        key (str): Widget key
+
+    Returns:
+        bool: True while the action runs
+    """
+    future = st.session_state.get(_task_key(key))
+    if future is None:
+        return False
+    if not future.done():
+        return True
+    del st.session_state[_task_key(key)]
+    error = future.exception()
+    st.session_state[_result_key(key)] = ActionResult(
+        None if error else future.result(), error
+    )
+    return False
+
+
+def action_result(key: str) -> Optional[ActionResult]:
+    """
+    Outcome of a widget's last finished action.
+
+    Args:
+        key (str): Widget key
+
+    Returns:
+        Optional[ActionResult]: Result, or None if none has finished yet
+    """
+    action_running(key)
+    return st.session_state.get(_result_key(key))
+
+
+def _poll(key: str, label: str) -> None:
+    """Progress fragment body: rerun the app once the action has finished."""
+    future = st.session_state.get(_task_key(key))
+    if future is None or future.done():
+        st.rerun()
+    st.caption(f"⏳ {label}…")
+
+
+def render_action_status(key: str, label: str) -> None:
+    """
+    Show progress for a widget's background action.
+
+    While the action runs, a small fragment polls it and triggers a full
+    rerun once it finishes; a failed action shows its error.
+
+    Args:
+        key (str): Widget key
+        label (str): Widget label shown in the progress text
+    """
+    if action_running(key):
+        render_fragment(partial(_poll, key, label), run_every=POLL_INTERVAL)
+        return
+    result = st.session_state.get(_result_key(key))
+    if result is not None and not result.ok:
+        st.error(f"{label} failed: {result.error}")
@@ -1,34 +1,502 @@
+import hashlib
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict, Callable
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Callable, Hashable, Iterator, List, Tuple, Union
+from .profiling import profiled
+
+# Sentinel for cache lookups where None is a valid value
+_MISSING = object()
+
+# Joins a parent key and a child's sibling index into the child's key
+KEY_SEPARATOR = '/'
+
+
+class DuplicateKeyError(ValueError):
+    """Raised when two components in one tree resolve to the same key."""
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Compute a stable content fingerprint for a value.
+
+    Args:
+        value (Any): Value to fingerprint (str, bytes or any repr-able object)
+
+    Returns:
+        str: Hex digest identifying the value's content
+    """
+    if isinstance(value, str):
+        data = value.encode('utf-8', 'surrogatepass')
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = value
+    else:
+        data = repr(value).encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def payload_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a prepared render payload.
+
+    Args:
+        value (Any): Prepared payload
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class RenderCache:
+    """
+    Thread-safe, size-bounded LRU cache for prepared render payloads.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the render cache.
+
+        Args:
+            max_bytes (int): Total payload size to keep before evicting
+        """
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._backing: Optional[Tuple[Any, str]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached payload for key, or default on a miss.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any): Value returned on a miss
+
+        Returns:
+            Any: Cached payload or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        if self._backing is not None:
+            return self._restore(key, default)
+        return default
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """
+        Return the cached payload for key, building it on a miss.
+
+        Args:
+            key (Hashable): Cache key
+            builder (Callable[[], Any]): Produces the payload on a miss
+
+        Returns:
+            Any: Cached or freshly built payload
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        if self._backing is not None:
+            value = self._restore(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        value = builder()
+        self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        """
+        Store a payload, evicting least recently used entries if needed.
+
+        With a backing store, the payload is also written there.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Payload to store
+            size (Optional[int]): Payload size in bytes, estimated if omitted
+        """
+        size = payload_size(value) if size is None else size
+        if size > self._max_bytes:
+            return
+        self._insert(key, value, size)
+        if self._backing is not None:
+            store, namespace = self._backing
+            store.save(namespace, key, value)
+
+    def _insert(self, key: Hashable, value: Any, size: int) -> None:
+        """Add an entry to memory only, evicting as needed."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def _restore(self, key: Hashable, default: Any) -> Any:
+        """Load a missing entry from the backing store into memory."""
+        store, namespace = self._backing
+        loaded = store.load(namespace, key)
+        if loaded is None:
+            return default
+        value = loaded[0]
+        size = payload_size(value)
+        if size <= self._max_bytes:
+            self._insert(key, value, size)
+        return value
+
+    def persist(self, store: Any, namespace: str) -> None:
+        """
+        Back the cache with a persistent store (see persistence.DiskStore).
+
+        Misses are looked up in the store, one entry at a time, and new
+        entries are written through to it, so entries survive restarts.
+
+        Args:
+            store (Any): Store with load, save, discard and clear methods;
+                None detaches the current one
+            namespace (str): Namespace of this cache's entries in the store
+        """
+        self._backing = None if store is None else (store, namespace)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key (Hashable): Cache key
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+        if self._backing is not None:
+            store, namespace = self._backing
+            store.discard(namespace, key)
+
+    def clear(self) -> None:
+        """Drop all entries, persisted ones included, and reset the counters."""
+        if self._backing is not None:
+            store, namespace = self._backing
+            store.clear(namespace)
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, entry count and stored bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self._max_bytes
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache shared by all components created with cache=True
+render_cache = RenderCache()
+
+
+# Guards the per-run root key tables held on each session's run context
+_root_keys_lock = threading.Lock()
+
+
+def root_key(component: Any) -> str:
+    """
+    Key an unkeyed root component by its position among same-class roots.
+
+    The first root of a class in a script run is keyed by the class name,
+    later ones by the class name and a counter ('container', 'container-1',
+    ...), so sibling roots never share widget keys or session state. The
+    key is remembered on the component, which lets fragment reruns of an
+    earlier run's component keep it. Outside a script run the class name
+    is used as is.
+
+    Args:
+        component (Any): Root component without an explicit key
+
+    Returns:
+        str: Root key
+    """
+    # Imported here so that importing base does not pull in Streamlit
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return component._root_key or type(component).__name__.lower()
+
+    with _root_keys_lock:
+        # ctx.cursors is replaced at the start of every run, full or fragment
+        table = getattr(ctx, '_component_root_keys', None)
+        if table is None or table[0] is not ctx.cursors:
+            table = (ctx.cursors, {}, set())
+            ctx._component_root_keys = table
+        _, assigned, used = table
+
+        entry = assigned.get(id(component))
+        if entry is not None:
+            return entry[1]
+        key = component._root_key
+        if key is None or key in used:
+            name = type(component).__name__.lower()
+            key, count = name, 0
+            while key in used:
+                count += 1
+                key = f"{name}-{count}"
+        # Holding the component keeps its id unique for the rest of the run
+        assigned[id(component)] = (component, key)
+        used.add(key)
+        component._root_key = key
+        return key
+
+
+def attach(child: Any, parent: Any, index: int) -> None:
+    """
+    Bind a child to its position in the component tree.
+
+    Children without an explicit key derive theirs from the parent key and
+    their index among siblings, so keys stay stable across reruns.
+
+    Args:
+        child (Any): Component being added (plain values are ignored)
+        parent (Any): Owning container component
+        index (int): Position among the parent's children
+    """
+    if hasattr(child, '_parent'):
+        child._parent = parent
+        child._index = index
+
+
+def iter_tree(root: Any) -> Iterator[Any]:
+    """
+    Walk a component tree depth-first, yielding every keyed component.
+
+    Args:
+        root (Any): Root component
+
+    Yields:
+        Any: Components with a key, root first
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if not hasattr(node, '_parent'):
+            continue
+        yield node
+        children = getattr(node, 'children', None)
+        if children is not None:
+            stack.extend(reversed(children()))
+
+
+def check_keys(root: Any) -> Dict[str, Any]:
+    """
+    Verify that every component in a tree has a distinct key.
+
+    Args:
+        root (Any): Root component
+
+    Returns:
+        Dict[str, Any]: Mapping of key to component
+
+    Raises:
+        DuplicateKeyError: If two components resolve to the same key
+    """
+    seen: Dict[str, Any] = {}
+    for node in iter_tree(root):
+        key = node.key
+        if key is None:
+            continue
+        if key in seen:
+            raise DuplicateKeyError(f"Duplicate component key: {key!r}")
+        seen[key] = node
+    return seen
+
+
+# Plain values whose repr fully describes what st.write shows
+_PLAIN_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def content_signature(item: Any) -> Optional[str]:
+    """
+    Fingerprint everything an item would display, children included.
+
+    Args:
+        item (Any): Component or plain value
+
+    Returns:
+        Optional[str]: Signature, or None if the item cannot be fingerprinted
+        (such items are always treated as changed)
+    """
+    if isinstance(item, _PLAIN_TYPES):
+        return fingerprint(item)
+    children = getattr(item, 'children', None)
+    if children is not None and children():
+        parts = [content_signature(child) for child in children()]
+        if None in parts:
+            return None
+        return fingerprint((type(item).__name__, tuple(parts)))
+    own = getattr(item, '_fingerprint', None)
+    if own is None:
+        return None
+    return fingerprint((type(item).__name__, own()))
+
 
 class BaseComponent(ABC):
     """
     Abstract base class for all Streamlit components.
     Provides a consistent interface and common functionality.
     """
-    
-    def __init__(self, content: Any, key: Optional[str] = None):
+
+    # Components are created by the thousand on every rerun; slots keep
+    # each instance free of a per-instance __dict__.
+    __slots__ = ('_content', '_key', '_parent', '_index', '_cache', '_root_key')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every concrete render is visible to the render profiler
+        if 'render' in cls.__dict__:
+            cls.render = profiled(cls.render)
+
+    def __init__(
+        self,
+        content: Any,
+        key: Optional[str] = None,
+        cache: Union[bool, Hashable] = False
+    ):
         """
         Initialize the base component.
-        
+
         Args:
             content (Any): The content to be displayed
-            key (Optional[str]): Optional unique key for the component
+            key (Optional[str]): Optional unique key for the component;
+                derived from the component's tree position when omitted
+            cache (Union[bool, Hashable]): Reuse prepared render payloads
+                through the render cache. True keys payloads on the content;
+                any other value is a version token that stands for the
+                content (e.g. a dataset id and revision), so the content is
+                never hashed
         """
         self._content = content
-        self._key = key or f"component_{id(self)}"
-    
+        self._key = key
+        self._parent = None
+        self._index = 0
+        self._cache = cache
+        self._root_key = None
+
     @property
     def key(self) -> str:
-        """Unique identifier for the component."""
-        return self._key
-    
+        """
+        Unique identifier for the component.
+
+        Explicit keys win; otherwise the key is the parent path plus the
+        index among siblings, or a per-run root key (see root_key) for a
+        root component.
+        """
+        if self._key:
+            return self._key
+        if self._parent is not None:
+            return f"{self._parent.key}{KEY_SEPARATOR}{self._index}"
+        return root_key(self)
+
+    def children(self) -> List[Any]:
+        """
+        Child components owned by this component.
+
+        Returns:
+            List[Any]: Children in render order (empty for leaf components)
+        """
+        return []
+
+    def _fingerprint(self) -> str:
+        """
+        Fingerprint the component content for render cache lookups.
+
+        Returns:
+            str: Content fingerprint
+        """
+        return fingerprint(self._content)
+
+    def _cache_token(self) -> Optional[Hashable]:
+        """
+        Identify the content in render cache keys.
+
+        Runs on every render of a cached component, so it must be cheap
+        next to _prepare.
+
+        Returns:
+            Optional[Hashable]: The explicit token, else the content
+            fingerprint; None bypasses the cache
+        """
+        if self._cache is True:
+            return self._fingerprint()
+        return self._cache
+
+    def _prepare(self, **kwargs) -> Any:
+        """
+        Build the payload handed to Streamlit by render.
+
+        Returns:
+            Any: Render payload (the raw content by default)
+        """
+        return self._content
+
+    def _payload(self, **kwargs) -> Any:
+        """
+        Return the prepared render payload, reusing a cached one when enabled.
+
+        Returns:
+            Any: Render payload
+        """
+        token = self._cache_token() if self._cache is not False else None
+        if token is None:
+            return self._prepare(**kwargs)
+
+        cache_key = (
+            type(self),
+            token,
+            fingerprint(sorted(kwargs.items()))
+        )
+        return render_cache.get_or_build(
+            cache_key,
+            lambda: self._prepare(**kwargs)
+        )
+
     @abstractmethod
     def render(self, **kwargs) -> Any:
         """
         Abstract method to render the component.
-        
+
         Raises:
             NotImplementedError if not implemented by subclass.
         """
-        raise NotImplementedError("Subclasses must implement render method")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement render method")
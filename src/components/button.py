@@ -1,19 +1,30 @@
 # button.py
 import streamlit as st
 from typing import Callable, Any, Optional
+from .actions import ActionResult, action_result, render_action_status, start_action
+from .base import KEY_SEPARATOR, fingerprint
+from .interaction import Throttle
+from .profiling import profiled
 
 class Button:
     """
     Streamlit button component with advanced configuration options.
     """
     
+    __slots__ = (
+        'text', 'action', '_key', '_parent', '_index',
+        'help', 'use_container_width', 'background', 'throttle'
+    )
+    
     def __init__(
         self, 
         text: str, 
         action: Optional[Callable] = None,
         key: Optional[str] = None,
         help: Optional[str] = None,
-        use_container_width: bool = False
+        use_container_width: bool = False,
+        background: bool = False,
+        throttle: Optional[Throttle] = None
     ) -> None:
         """
         Initialize a Streamlit button.
@@ -24,13 +35,56 @@ class Button:
             key (Optional[str]): Unique key for the button.
             help (Optional[str]): Tooltip text for the button.
             use_container_width (bool): Whether to expand button to container width.
+            background (bool): Run action on the background pool instead of
+                the script thread; its outcome is available from result.
+            throttle (Optional[Throttle]): Rate policy for clicks; suppressed
+                clicks neither run the action nor report a click.
         """
         self.text = text
         self.action = action
-        self.key = key
+        self._key = key
+        self._parent = None
+        self._index = 0
         self.help = help
         self.use_container_width = use_container_width
+        self.background = background
+        self.throttle = throttle
     
+    @property
+    def key(self) -> Optional[str]:
+        """
+        Widget key for the button.
+        
+        Explicit keys win; inside a container the key is derived from the
+        container path so it stays stable across reruns.
+        """
+        if self._key:
+            return self._key
+        if self._parent is not None:
+            return f"{self._parent.key}{KEY_SEPARATOR}{self._index}"
+        return None
+    
+    @key.setter
+    def key(self, value: Optional[str]) -> None:
+        self._key = value
+    
+    @property
+    def result(self) -> Optional[ActionResult]:
+        """
+        Outcome of the last finished background action, if any.
+        """
+        return action_result(self.key or self.text)
+    
+    def _fingerprint(self) -> str:
+        """
+        Fingerprint what the button displays.
+        
+        Returns:
+            str: Fingerprint of the label and options
+        """
+        return fingerprint((self.text, self.help, self.use_container_width))
+    
+    @profiled
     def render(self) -> Any:
         """
         Render the button in Streamlit.
@@ -48,7 +102,47 @@ class Button:
         # Remove None values
         button_kwargs = {k: v for k, v in button_kwargs.items() if v is not None}
         
+        if self.throttle is not None:
+            return self._render_throttled(button_kwargs)
+        
+        if self.action and self.background:
+            # The click callback only submits the action, so a slow action
+            # never blocks the script thread; repeated clicks are ignored
+            # while it runs.
+            task_key = self.key or self.text
+            clicked = st.button(
+                **button_kwargs,
+                on_click=start_action,
+                args=(task_key, self.action)
+            )
+            render_action_status(task_key, self.text)
+            return clicked
+        
         if self.action:
             return st.button(**button_kwargs, on_click=self.action)
         return st.button(**button_kwargs)
-
+    
+    def _render_throttled(self, button_kwargs: dict) -> bool:
+        """
+        Render the button with its click gated by the throttle policy.
+        
+        The action runs during the script run rather than as a click
+        callback, since the policy decides on the click first.
+        
+        Args:
+            button_kwargs (dict): Arguments for st.button
+        
+        Returns:
+            bool: Whether the click was admitted in this run
+        """
+        task_key = self.key or self.text
+        clicked = self.throttle.gate(task_key, st.button(**button_kwargs))
+        if clicked and self.action:
+            if self.background:
+                start_action(task_key, self.action)
+            else:
+                self.action()
+        self.throttle.render_pending(task_key)
+        if self.action and self.background:
+            render_action_status(task_key, self.text)
+        return clicked
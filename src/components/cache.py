@@ -0,0 +1,296 @@
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from .base import RenderCache, fingerprint
+
+_MISS = object()
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estimate the memory held by a data value, following containers.
+
+    Args:
+        value (Any): Data to measure
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return sys.getsizeof(value)
+    # DataFrames and Series report their own deep usage; arrays their buffer
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(getattr(usage, 'sum', lambda: usage)())
+        except TypeError:
+            pass
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, seen) + estimate_size(v, seen)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in value)
+    return size
+
+
+class DataCache:
+    """
+    Process-wide cache for loaded data, shared by every session.
+
+    Entries expire after their TTL, and the least recently used entries are
+    evicted once the stored data exceeds the byte budget. Concurrent misses
+    for the same key are single-flighted: one caller loads, the others wait
+    for its result.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): Total estimated data size before LRU eviction
+            ttl (Optional[float]): Default seconds an entry stays fresh;
+                None keeps entries until evicted
+        """
+        self._store = RenderCache(max_bytes=max_bytes)
+        self._ttl = ttl
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._backing: Optional[Tuple[Any, str]] = None
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.deduplicated = 0
+        self.loads = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return a fresh cached value, or default.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any): Value returned on a miss or for an expired entry
+
+        Returns:
+            Any: Cached value or default
+        """
+        entry = self._store.get(key)
+        if entry is None and self._backing is not None:
+            entry = self._restore(key)
+        if entry is not None:
+            value, expires = entry
+            if expires is None or time.monotonic() < expires:
+                self.hits += 1
+                return value
+            self._store.discard(key)
+            self.expired += 1
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Data to cache
+            ttl (Optional[float]): Seconds the entry stays fresh; the cache
+                default when omitted
+        """
+        ttl = self._ttl if ttl is None else ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._store.put(key, (value, expires), size=estimate_size(value))
+        if self._backing is not None:
+            store, namespace = self._backing
+            # The store outlives this process, so it keeps wall-clock expiry
+            store.save(namespace, key, value, None if ttl is None else time.time() + ttl)
+
+    def _restore(self, key: Hashable) -> Optional[Tuple[Any, Optional[float]]]:
+        """Load a missing entry from the backing store into memory."""
+        store, namespace = self._backing
+        loaded = store.load(namespace, key)
+        if loaded is None:
+            return None
+        value, expires = loaded
+        if expires is not None:
+            expires = time.monotonic() + (expires - time.time())
+        entry = (value, expires)
+        self._store.put(key, entry, size=estimate_size(value))
+        return entry
+
+    def persist(self, store: Any, namespace: str = 'data') -> None:
+        """
+        Back the cache with a persistent store (see persistence.DiskStore).
+
+        Misses are looked up in the store before loading, and loaded values
+        are written through to it with their expiry.
+
+        Args:
+            store (Any): Store with load, save, discard and clear methods;
+                None detaches the current one
+            namespace (str): Namespace of the entries in the store
+        """
+        self._backing = None if store is None else (store, namespace)
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Return the cached value for key, loading it once on a miss.
+
+        Args:
+            key (Hashable): Cache key
+            loader (Callable[[], Any]): Produces the value on a miss
+            ttl (Optional[float]): Seconds the loaded value stays fresh
+
+        Returns:
+            Any: Cached or freshly loaded value
+
+        Raises:
+            Exception: Whatever the loader raised, for every waiting caller
+        """
+        value = self.get(key, _MISS)
+        if value is not _MISS:
+            return value
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self.deduplicated += 1
+        if not owner:
+            return future.result()
+
+        try:
+            # Another caller may have finished loading since our miss
+            value = self._store.get(key)
+            value = _MISS if value is None or _expired(value[1]) else value[0]
+            if value is _MISS:
+                value = loader()
+                self.loads += 1
+                self.put(key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop an entry so the next access reloads it.
+
+        Args:
+            key (Hashable): Cache key
+        """
+        self._store.discard(key)
+        if self._backing is not None:
+            store, namespace = self._backing
+            store.discard(namespace, key)
+
+    def clear(self) -> None:
+        """Drop all entries, persisted ones included, and reset the counters."""
+        if self._backing is not None:
+            store, namespace = self._backing
+            store.clear(namespace)
+        self._store.clear()
+        self.hits = self.misses = self.expired = self.deduplicated = self.loads = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, expirations, deduplicated misses,
+            loads, entry count and stored bytes
+        """
+        store = self._store.stats()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'deduplicated': self.deduplicated,
+            'loads': self.loads,
+            'entries': store['entries'],
+            'bytes': store['bytes'],
+            'max_bytes': store['max_bytes'],
+        }
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+def _expired(expires: Optional[float]) -> bool:
+    return expires is not None and time.monotonic() >= expires
+
+
+# Process-wide data cache used by @cached
+data_cache = DataCache()
+
+
+def cached(
+    func: Optional[Callable] = None,
+    *,
+    ttl: Optional[float] = None,
+    cache: Optional[DataCache] = None
+) -> Callable:
+    """
+    Cache a data-producing function across sessions.
+
+    Calls are keyed by the function and a fingerprint of its arguments, so
+    arguments should have a stable repr (strings, numbers, tuples, ...).
+    The decorated function can be passed to components as a data source.
+
+    Args:
+        func (Optional[Callable]): Function to decorate
+        ttl (Optional[float]): Seconds a result stays fresh
+        cache (Optional[DataCache]): Cache to use; the process-wide one by
+            default
+
+    Returns:
+        Callable: Cached function, with an invalidate(*args, **kwargs)
+        method that drops one result
+    """
+    def decorate(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def cache_key(args: tuple, kwargs: dict) -> Hashable:
+            return (name, fingerprint((args, sorted(kwargs.items()))))
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            store = cache or data_cache
+            return store.get_or_load(
+                cache_key(args, kwargs),
+                lambda: func(*args, **kwargs),
+                ttl=ttl
+            )
+
+        wrapper.invalidate = lambda *args, **kwargs: (cache or data_cache).invalidate(
+            cache_key(args, kwargs)
+        )
+        return wrapper
+
+    return decorate if func is None else decorate(func)
@@ -0,0 +1,115 @@
+import asyncio
+import inspect
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Worker threads shared by every component that offloads work
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Worker threads for background button actions; a separate pool, so long
+# actions never hold up render work
+MAX_ACTION_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_action_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide, bounded worker pool, creating it on first use.
+
+    Work submitted here runs off the script thread, so it must not call
+    Streamlit APIs.
+
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MAX_WORKERS,
+                    thread_name_prefix='component-worker'
+                )
+    return _executor
+
+
+def get_action_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide, bounded pool for background actions.
+
+    Returns:
+        ThreadPoolExecutor: Shared action executor
+    """
+    global _action_executor
+    if _action_executor is None:
+        with _executor_lock:
+            if _action_executor is None:
+                _action_executor = ThreadPoolExecutor(
+                    max_workers=MAX_ACTION_WORKERS,
+                    thread_name_prefix='component-action'
+                )
+    return _action_executor
+
+
+def submit_action(action: Callable[[], Any]) -> Future:
+    """
+    Run a zero-argument action in the background.
+
+    Coroutine functions get their own event loop on the worker thread.
+    Actions must not call Streamlit APIs.
+
+    Args:
+        action (Callable[[], Any]): Action to run
+
+    Returns:
+        Future: Completes with the action's result or exception
+    """
+    if inspect.iscoroutinefunction(action):
+        return get_action_executor().submit(lambda: asyncio.run(action()))
+    return get_action_executor().submit(action)
+
+
+async def _gather(tasks: Dict[int, Callable[[], Any]]) -> Dict[int, Any]:
+    results = await asyncio.gather(*(task() for task in tasks.values()))
+    return dict(zip(tasks, results))
+
+
+def run_concurrently(tasks: Sequence[Optional[Callable[[], Any]]]) -> List[Any]:
+    """
+    Run independent callables concurrently and collect their results in order.
+
+    Plain callables run on the shared worker pool; coroutine functions are
+    awaited together on an event loop in the calling thread. Entries that
+    are None produce None.
+
+    Args:
+        tasks (Sequence[Optional[Callable[[], Any]]]): Zero-argument callables
+
+    Returns:
+        List[Any]: Results in the same order as tasks
+
+    Raises:
+        Exception: The first exception raised by any task
+    """
+    futures: Dict[int, Future] = {}
+    coroutines: Dict[int, Callable[[], Any]] = {}
+    for index, task in enumerate(tasks):
+        if task is None:
+            continue
+        if inspect.iscoroutinefunction(task):
+            coroutines[index] = task
+        else:
+            futures[index] = get_executor().submit(task)
+
+    results: List[Any] = [None] * len(tasks)
+    if coroutines:
+        for index, value in asyncio.run(_gather(coroutines)).items():
+            results[index] = value
+    for index, future in futures.items():
+        results[index] = future.result()
+    return results
@@ -1,12 +1,62 @@
 import streamlit as st
-from typing import Any, Optional, List, Callable
-from .base import BaseComponent
+from functools import lru_cache, partial
+from typing import Any, Optional, List, Callable, Tuple
+from .base import (
+    BaseComponent, KEY_SEPARATOR, DuplicateKeyError, attach, content_signature
+)
+from .fragments import RunEvery, render_fragment
+from .optimizer import optimize as optimize_items
+
+# Items per page when layout='virtual' is used without an explicit page_size
+DEFAULT_PAGE_SIZE = 50
+
+# Widest grid row before items wrap onto the next row
+MAX_GRID_COLUMNS = 12
+
+
+@lru_cache(maxsize=256)
+def grid_plan(count: int, columns: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Split items into row-major grid rows.
+    
+    Plans are cached by (count, columns) since the same grid shapes recur
+    on every rerun.
+    
+    Args:
+        count (int): Number of items
+        columns (int): Maximum items per row
+    
+    Returns:
+        Tuple[Tuple[int, int], ...]: (start, stop) item range for each row
+    """
+    return tuple(
+        (start, min(start + columns, count))
+        for start in range(0, count, columns)
+    )
+
+
+def _render_item(item: Any) -> None:
+    """
+    Render a component, call a render function, or write a plain value.
+    
+    Args:
+        item (Any): Component, render function or content
+    """
+    if hasattr(item, 'render'):
+        item.render()
+    elif callable(item):
+        item()
+    else:
+        st.write(item)
+
 
 class Container(BaseComponent):
     """
     Advanced container component for Streamlit with flexible rendering options.
     """
     
+    __slots__ = ('_child_keys',)
+    
     def __init__(
         self, 
         content: Optional[List[Any]] = None, 
@@ -20,63 +70,320 @@ class Container(BaseComponent):
             key (Optional[str]): Unique key for the container
         """
         super().__init__(content, key)
-        self._content = content or []
+        self._content = []
+        self._child_keys = set()
+        for component in content or []:
+            self.add(component)
     
     def add(self, component: Any) -> None:
         """
         Add a component to the container.
         
+        Components without an explicit key are keyed by their position,
+        so the key stays stable across reruns.
+        
         Args:
             component (Any): Component or content to add
+        
+        Raises:
+            DuplicateKeyError: If a sibling already uses the component's key
         """
+        explicit_key = getattr(component, '_key', None)
+        if explicit_key:
+            if explicit_key in self._child_keys:
+                raise DuplicateKeyError(
+                    f"Duplicate component key in {self.key!r}: {explicit_key!r}"
+                )
+            self._child_keys.add(explicit_key)
+        
+        attach(component, self, len(self._content))
         self._content.append(component)
     
+    def children(self) -> List[Any]:
+        """
+        Components held by the container.
+        
+        Returns:
+            List[Any]: Container items in render order
+        """
+        return self._content
+    
     def render(
         self, 
         layout: str = 'vertical', 
         columns: Optional[int] = None,
-        style: Optional[dict] = None
+        style: Optional[dict] = None,
+        page_size: Optional[int] = None,
+        optimize: bool = False,
+        fragment: bool = False,
+        run_every: Optional[RunEvery] = None,
+        form: bool = False,
+        submit_label: str = "Submit",
+        on_submit: Optional[Callable] = None
     ) -> Any:
         """
         Render the container with various layout options.
         
+        With page_size (or layout='virtual') only the current page of items
+        is rendered, followed by pager controls; the page cursor is kept in
+        session state so render cost tracks page size, not collection size.
+        
+        With optimize, a vertical layout is coalesced before emission:
+        adjacent text, markdown and spacer items become single elements.
+        
+        With fragment (or run_every), the container renders as a Streamlit
+        fragment: widgets inside it, including the pager, rerun only the
+        container instead of the whole page.
+        
+        With form, the items render inside an st.form: input widgets in it
+        do not rerun the script, and all of their values arrive together in
+        the single rerun triggered by the submit button.
+        
         Args:
-            layout (str): Rendering layout ('vertical', 'horizontal', 'columns')
+            layout (str): Rendering layout ('vertical', 'horizontal', 'columns',
+                or 'virtual' for a paginated vertical layout)
             columns (Optional[int]): Number of columns for column layout
             style (Optional[dict]): Additional styling options
+            page_size (Optional[int]): Number of items rendered per page
+            optimize (bool): Merge adjacent compatible items in a vertical
+                layout (see optimizer.optimize)
+            fragment (bool): Rerun only this container on interaction
+            run_every (Optional[RunEvery]): Refresh the container on this
+                interval (implies fragment)
+            form (bool): Batch the items' inputs into one submission
+            submit_label (str): Label of the form's submit button
+            on_submit (Optional[Callable]): Callback run on submission,
+                before the rerun
         
         Returns:
             Any: Rendered Streamlit components
         """
+        if fragment or run_every is not None:
+            render_fragment(
+                partial(
+                    self.render, layout=layout, columns=columns, style=style,
+                    page_size=page_size, optimize=optimize, form=form,
+                    submit_label=submit_label, on_submit=on_submit
+                ),
+                run_every=run_every
+            )
+            return self
+        
+        if form:
+            if page_size or layout == 'virtual':
+                raise ValueError("Paged containers cannot be rendered as a form")
+            with st.form(f"{self.key}{KEY_SEPARATOR}form"):
+                self.render(layout=layout, columns=columns, style=style, optimize=optimize)
+                st.form_submit_button(submit_label, on_click=on_submit)
+            return self
+        
+        if layout == 'virtual':
+            layout = 'vertical'
+            page_size = page_size or DEFAULT_PAGE_SIZE
+        
+        items = self._content
+        if page_size:
+            state_key = f"{self.key}{KEY_SEPARATOR}page"
+            page, pages = self._current_page(state_key, page_size)
+            items = self._content[page * page_size:(page + 1) * page_size]
+        
         # Vertical layout (default)
         if layout == 'vertical':
-            for item in self._content:
-                if hasattr(item, 'render'):
-                    item.render()
-                else:
-                    st.write(item)
+            if optimize:
+                items, _ = optimize_items(items)
+            for item in items:
+                _render_item(item)
         
-        # Horizontal layout
+        # Horizontal layout: one row, wrapping past MAX_GRID_COLUMNS
         elif layout == 'horizontal':
-            cols = st.columns(len(self._content))
-            for col, item in zip(cols, self._content):
-                with col:
-                    if hasattr(item, 'render'):
-                        item.render()
-                    else:
-                        st.write(item)
+            self._render_grid(items, min(len(items), MAX_GRID_COLUMNS))
         
-        # Column layout
+        # Column layout: row-major grid of at most `columns` per row
         elif layout == 'columns':
             if not columns:
-                columns = len(self._content)
-            
+                columns = len(items)
+            self._render_grid(items, min(columns, MAX_GRID_COLUMNS))
+        
+        if page_size and pages > 1:
+            self._render_pager(state_key, page, pages)
+        
+        return self
+    
+    def live(self, columns: Optional[int] = None) -> 'LiveView':
+        """
+        Render the container into per-item placeholders for in-place updates.
+        
+        Call update() on the returned view after changing items (e.g. on
+        each tick of a monitoring loop within the run) to redraw only the
+        items whose key or content changed since the last draw. Each new
+        run draws every item again.
+        
+        Args:
+            columns (Optional[int]): Lay items out in a grid of this many
+                columns instead of vertically
+        
+        Returns:
+            LiveView: View bound to the current script run
+        """
+        view = LiveView(self, columns)
+        view.update()
+        return view
+    
+    def _render_grid(self, items: List[Any], columns: int) -> None:
+        """
+        Render items as a row-major grid.
+        
+        Each row creates its own set of columns and enters every column
+        exactly once, so items keep their order and rows stay aligned.
+        
+        Args:
+            items (List[Any]): Items to render
+            columns (int): Maximum number of items per row
+        """
+        if not items:
+            return
+        
+        for start, stop in grid_plan(len(items), columns):
             cols = st.columns(columns)
-            for i, item in enumerate(self._content):
-                with cols[i % columns]:
-                    if hasattr(item, 'render'):
-                        item.render()
-                    else:
-                        st.write(item)
-        
-        return self
\ No newline at end of file
+            for col, item in zip(cols, items[start:stop]):
+                with col:
+                    _render_item(item)
+    
+    def _current_page(self, state_key: str, page_size: int) -> Tuple[int, int]:
+        """
+        Resolve the page cursor from session state, clamped to the item count.
+        
+        Args:
+            state_key (str): Session state key holding the cursor
+            page_size (int): Number of items per page
+        
+        Returns:
+            Tuple[int, int]: Current page index and total page count
+        """
+        pages = max(1, -(-len(self._content) // page_size))
+        page = min(max(st.session_state.get(state_key, 0), 0), pages - 1)
+        st.session_state[state_key] = page
+        return page, pages
+    
+    def _render_pager(self, state_key: str, page: int, pages: int) -> None:
+        """
+        Render previous/next controls for a paginated container.
+        
+        Args:
+            state_key (str): Session state key holding the cursor
+            page (int): Current page index
+            pages (int): Total page count
+        """
+        prev_col, info_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            st.button(
+                "‹ Prev",
+                key=f"{state_key}{KEY_SEPARATOR}prev",
+                disabled=page == 0,
+                on_click=_turn_page,
+                args=(state_key, -1)
+            )
+        with info_col:
+            st.caption(f"Page {page + 1} of {pages}")
+        with next_col:
+            st.button(
+                "Next ›",
+                key=f"{state_key}{KEY_SEPARATOR}next",
+                disabled=page >= pages - 1,
+                on_click=_turn_page,
+                args=(state_key, 1)
+            )
+
+
+def _turn_page(state_key: str, delta: int) -> None:
+    """
+    Move a paginated container's cursor (pager button callback).
+    
+    Args:
+        state_key (str): Session state key holding the cursor
+        delta (int): Pages to move by
+    """
+    st.session_state[state_key] = st.session_state.get(state_key, 0) + delta
+
+
+class LiveView:
+    """
+    Placeholder-backed rendering of a container within one script run.
+    
+    Each item owns an st.empty() slot. The view keeps the (key, signature)
+    pair drawn in every slot; update() diffs the container against it and
+    redraws changed slots only.
+    
+    Placeholders belong to the run that created them, and Streamlit drops
+    every element a run does not emit, so a new view starts with nothing
+    drawn and the first update() draws every item. Only later updates within
+    the same run, such as a loop polling for changes, are incremental; a
+    rerun, including each run_every fragment tick, calls Container.live()
+    again and redraws everything once. Items holding widgets should not
+    change between updates: a redrawn widget would repeat its key within
+    the run.
+    """
+    
+    __slots__ = ('_container', '_columns', '_outer', '_slots', '_previous')
+    
+    def __init__(self, container: Container, columns: Optional[int] = None):
+        """
+        Initialize the view and its outer Streamlit container.
+        
+        Args:
+            container (Container): Container to render
+            columns (Optional[int]): Grid width, or None for a vertical layout
+        """
+        self._container = container
+        self._columns = min(columns, MAX_GRID_COLUMNS) if columns else None
+        self._outer = st.container()
+        self._slots: List[Any] = []
+        self._previous: Tuple[Tuple[Any, Optional[str]], ...] = ()
+    
+    def _slot(self, index: int) -> Any:
+        """
+        Return the placeholder for an item index, creating it if needed.
+        
+        Args:
+            index (int): Item position
+        
+        Returns:
+            Any: st.empty() placeholder
+        """
+        while len(self._slots) <= index:
+            if self._columns:
+                row = self._outer.columns(self._columns)
+                self._slots.extend(col.empty() for col in row)
+            else:
+                self._slots.append(self._outer.empty())
+        return self._slots[index]
+    
+    def update(self) -> int:
+        """
+        Redraw the items that changed since the last draw.
+        
+        Returns:
+            int: Number of slots redrawn or cleared
+        """
+        items = self._container.children()
+        previous = self._previous
+        current = tuple(
+            (getattr(item, 'key', None), content_signature(item))
+            for item in items
+        )
+        
+        changed = 0
+        for index, (item, node) in enumerate(zip(items, current)):
+            if index < len(previous) and previous[index] == node and node[1] is not None:
+                continue
+            with self._slot(index).container():
+                _render_item(item)
+            changed += 1
+        
+        # Clear slots left over from items that were removed
+        for slot in self._slots[len(items):len(previous)]:
+            slot.empty()
+            changed += 1
+        
+        self._previous = current
+        return changed
@@ -1,53 +1,632 @@
 import streamlit as st
 import json
-from typing import Any, Dict, Union
-from .base import BaseComponent
+import mmap
+import os
+import sys
+import threading
+from itertools import chain, islice
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, Optional, Tuple, Union
+from .base import BaseComponent, KEY_SEPARATOR, RenderCache, fingerprint
+
+try:
+    import orjson  # optional fast parser
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import pandas as pd  # optional, imported on first use by table mode
+
+# Appended when serialization stops at the byte budget
+TRUNCATION_MARKER = "\n... truncated at {limit} bytes ..."
+
+# Serialized subtrees memoized by object identity, bounded by the size of
+# the text plus the data each entry keeps alive
+SERIALIZED_MEMO_BYTES = 32 * 1024 * 1024
+_serialized = RenderCache(max_bytes=SERIALIZED_MEMO_BYTES)
+
+# Files at least this large are read through mmap instead of read()
+MMAP_THRESHOLD = 1024 * 1024
+
+# Parsed JSON files keyed by (path, mtime, size), bounded by file size
+_parsed_files = RenderCache(max_bytes=256 * 1024 * 1024)
+
+# Placeholder for a source that has not been parsed yet
+_UNPARSED = object()
+
+# Guards the one-time parse and release of JSONDisplay sources, which may
+# be shared between sessions in frozen trees
+_source_lock = threading.RLock()
+
+INVALID_JSON = {"error": "Invalid JSON"}
+
+# Rows per page in table mode
+DEFAULT_TABLE_PAGE_SIZE = 50
+
+# Record arrays flattened to frames (and their sorted/filtered views),
+# keyed by the identity of the records and bounded by the frame memory
+# plus the records each entry keeps alive
+FRAME_MEMO_BYTES = 256 * 1024 * 1024
+_frames = RenderCache(max_bytes=FRAME_MEMO_BYTES)
+
+
+def parse_json(data: Union[str, bytes, memoryview], fast: bool = False) -> Any:
+    """
+    Parse JSON text the way json.loads does.
+
+    With fast=True orjson is used when it is installed. orjson is stricter
+    and lossier than json.loads: it rejects NaN and Infinity, and parses
+    integers beyond 64 bits as floats. Documents orjson rejects are
+    re-parsed with json.loads, but big integers silently lose precision, so
+    only file sources (see load_json_file) take the fast path.
+
+    Args:
+        data (Union[str, bytes, memoryview]): JSON document
+        fast (bool): Try orjson first
+
+    Returns:
+        Any: Parsed data, or the invalid-JSON marker dict
+    """
+    if fast and orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+    except ValueError:
+        return dict(INVALID_JSON)
+
+
+def load_json_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Parse a JSON file, cached by path, modification time and size.
+
+    Large files are mapped into memory rather than read into a string, and
+    files are parsed with orjson when it is installed (see parse_json).
+
+    Args:
+        path (Union[str, os.PathLike]): JSON file path
+
+    Returns:
+        Any: Parsed data
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    data = _parsed_files.get(cache_key, _UNPARSED)
+    if data is not _UNPARSED:
+        return data
+
+    with open(path, 'rb') as f:
+        if stat.st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    data = parse_json(view, fast=True)
+                finally:
+                    view.release()
+        else:
+            data = parse_json(f.read(), fast=True)
+
+    _parsed_files.put(cache_key, data, size=stat.st_size)
+    return data
+
+
+def load_json_source(source: Any) -> Any:
+    """
+    Resolve a JSONDisplay source to parsed data.
+
+    Args:
+        source (Any): Parsed data, JSON text, a path (os.PathLike), a
+            readable buffer, or a zero-argument data source returning one
+
+    Returns:
+        Any: Parsed data
+    """
+    if callable(source):
+        return load_json_source(source())
+    if isinstance(source, os.PathLike):
+        return load_json_file(source)
+    if isinstance(source, (str, bytes, bytearray)):
+        return parse_json(source)
+    if hasattr(source, 'read'):
+        return parse_json(source.read())
+    return source
+
+
+def _key_text(key: Any) -> str:
+    """Encode a mapping key the way json.dumps would."""
+    if isinstance(key, str):
+        return json.dumps(key)
+    if key is None or isinstance(key, (bool, float)):
+        return json.dumps(json.dumps(key))
+    return json.dumps(str(key))
+
+
+def iter_json(
+    data: Any,
+    indent: int = 2,
+    max_nodes: Optional[int] = None,
+    max_depth: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Serialize data incrementally as pretty-printed JSON chunks.
+
+    Output matches json.dumps(data, indent=indent) until a budget is hit:
+    once max_nodes values have been emitted the remaining items of each
+    container are replaced by a truncation marker, and containers deeper
+    than max_depth are collapsed to a summary marker.
+
+    Args:
+        data (Any): JSON-compatible data
+        indent (int): Spaces per nesting level
+        max_nodes (Optional[int]): Maximum number of values to serialize
+        max_depth (Optional[int]): Maximum container nesting to expand
+
+    Yields:
+        str: Consecutive chunks of the serialized text
+    """
+    remaining = [max_nodes]
+
+    def walk(value: Any, level: int) -> Iterator[str]:
+        if isinstance(value, dict):
+            items, opener, closer = value.items(), '{', '}'
+        elif isinstance(value, (list, tuple)):
+            items, opener, closer = enumerate(value), '[', ']'
+        else:
+            yield json.dumps(value)
+            return
+
+        if not value:
+            yield opener + closer
+            return
+        if max_depth is not None and level >= max_depth:
+            yield json.dumps(f"{opener}... {len(value)} items{closer}")
+            return
+
+        pad = '\n' + ' ' * (indent * (level + 1))
+        yield opener
+        for position, (name, child) in enumerate(items):
+            separator = ',' if position else ''
+            if remaining[0] is not None:
+                if remaining[0] <= 0:
+                    omitted = len(value) - position
+                    yield f"{separator}{pad}" + json.dumps(f"... {omitted} more items truncated")
+                    break
+                remaining[0] -= 1
+            yield separator + pad
+            if closer == '}':
+                yield _key_text(name) + ': '
+            yield from walk(child, level + 1)
+        yield '\n' + ' ' * (indent * level) + closer
+
+    return walk(data, 0)
+
+
+def serialize(
+    data: Any,
+    max_bytes: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    max_depth: Optional[int] = None
+) -> str:
+    """
+    Serialize data within a byte and node budget.
+
+    Args:
+        data (Any): JSON-compatible data
+        max_bytes (Optional[int]): Stop (with a marker) once this many
+            characters have been produced
+        max_nodes (Optional[int]): Maximum number of values to serialize
+        max_depth (Optional[int]): Maximum container nesting to expand
+
+    Returns:
+        str: Pretty-printed, possibly truncated JSON
+    """
+    chunks = iter_json(data, max_nodes=max_nodes, max_depth=max_depth)
+    if max_bytes is None:
+        return ''.join(chunks)
+
+    parts = []
+    size = 0
+    for chunk in chunks:
+        if size + len(chunk) > max_bytes:
+            parts.append(chunk[:max_bytes - size])
+            parts.append(TRUNCATION_MARKER.format(limit=max_bytes))
+            break
+        parts.append(chunk)
+        size += len(chunk)
+    return ''.join(parts)
+
+
+def _footprint(data: Any, limit: int) -> int:
+    """
+    Estimate the memory held by a JSON-like object graph.
+
+    Objects referenced more than once are counted every time, so the
+    estimate errs high. The walk stops as soon as limit is exceeded, so
+    its cost is bounded by limit rather than by the size of data.
+
+    Args:
+        data (Any): Parsed JSON data
+        limit (int): Size beyond which the exact total does not matter
+
+    Returns:
+        int: Estimated bytes (more than limit if the walk stopped early)
+    """
+    total = 0
+    stack = [iter((data,))]
+    while stack:
+        for value in stack[-1]:
+            total += sys.getsizeof(value)
+            if total > limit:
+                return total
+            if isinstance(value, dict):
+                stack.append(chain.from_iterable(value.items()))
+                break
+            if isinstance(value, (list, tuple)):
+                stack.append(iter(value))
+                break
+        else:
+            stack.pop()
+    return total
+
+
+def serialize_cached(data: Any, **budget) -> str:
+    """
+    Serialize data, memoized by object identity and budget.
+
+    The memo holds a reference to the serialized object, so its id cannot
+    be reused by another object while the entry is alive. That object
+    counts toward the memo budget along with the text, and objects too
+    large to fit are serialized without being memoized. Mutating the
+    object in place is not detected.
+
+    Args:
+        data (Any): JSON-compatible data
+        **budget: max_bytes, max_nodes and max_depth for serialize()
+
+    Returns:
+        str: Serialized text
+    """
+    memo_key = (id(data), tuple(sorted(budget.items())))
+    entry = _serialized.get(memo_key)
+    if entry is None or entry[0] is not data:
+        text = serialize(data, **budget)
+        size = len(text) + _footprint(data, SERIALIZED_MEMO_BYTES - len(text))
+        entry = (data, text)
+        _serialized.put(memo_key, entry, size=size)
+    return entry[1]
+
+
+def _memo_frame(memo_key: Tuple, owner: Any, build: Callable[[], Any]) -> Any:
+    """
+    Look up or build a frame memoized against the identity of owner.
+
+    The entry pins owner, so owner counts toward the memo budget along with
+    the frame, as in serialize_cached.
+
+    Args:
+        memo_key (Tuple): Cache key (starting with id(owner))
+        owner (Any): Object whose identity the entry is tied to
+        build (Callable[[], DataFrame]): Builds the frame on a miss
+
+    Returns:
+        DataFrame: Memoized frame
+    """
+    entry = _frames.get(memo_key)
+    if entry is None or entry[0] is not owner:
+        frame = build()
+        size = int(frame.memory_usage(index=True).sum())
+        size += _footprint(owner, FRAME_MEMO_BYTES - size)
+        entry = (owner, frame)
+        _frames.put(memo_key, entry, size=size)
+    return entry[1]
+
+
+def _pandas() -> Any:
+    """
+    Import pandas on first use, keeping it off the package import path.
+
+    Returns:
+        Any: The pandas module
+
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError("JSONDisplay table mode requires pandas") from None
+    return pandas
+
+
+def records_frame(records: list) -> 'pd.DataFrame':
+    """
+    Flatten an array of records into a columnar frame in one pass.
+
+    Nested objects become dotted column names. Frames are memoized by the
+    identity of the records list.
+
+    Args:
+        records (list): Homogeneous list of JSON objects
+
+    Returns:
+        pd.DataFrame: One row per record
+    """
+    pd = _pandas()
+    return _memo_frame((id(records),), records, lambda: pd.json_normalize(records))
+
+
+def table_view(
+    records: list,
+    query: str = '',
+    sort_by: Optional[str] = None,
+    descending: bool = False
+) -> 'pd.DataFrame':
+    """
+    Filter and sort a record frame, memoizing the resulting view.
+
+    Args:
+        records (list): Records previously flattened by records_frame
+        query (str): Case-insensitive substring matched against every column
+        sort_by (Optional[str]): Column to sort by
+        descending (bool): Sort in descending order
+
+    Returns:
+        pd.DataFrame: Filtered and sorted view
+    """
+    frame = records_frame(records)
+    if not query and sort_by is None:
+        return frame
+
+    def build() -> 'pd.DataFrame':
+        view = frame
+        if query:
+            mask = _pandas().Series(False, index=view.index)
+            for column in view.columns:
+                mask |= view[column].astype(str).str.contains(
+                    query, case=False, regex=False
+                )
+            view = view[mask]
+        if sort_by is not None:
+            try:
+                view = view.sort_values(sort_by, ascending=not descending, kind='stable')
+            except TypeError:
+                # Mixed-type column: fall back to lexical order
+                view = view.sort_values(
+                    sort_by, ascending=not descending, kind='stable',
+                    key=lambda column: column.astype(str)
+                )
+        return view
+
+    return _memo_frame((id(records), query, sort_by, descending), records, build)
+
 
 class JSONDisplay(BaseComponent):
     """
     Component for displaying JSON data with syntax highlighting.
     """
-    
+
+    __slots__ = ('_expanded', '_source', '_data', '_token')
+
     def __init__(
-        self, 
-        data: Union[Dict, str], 
+        self,
+        data: Union[Dict, str, os.PathLike, IO, Callable[[], Any]],
         key: str = None,
-        expanded: bool = False
+        expanded: Union[bool, int] = False,
+        cache: Union[bool, Hashable] = False
     ):
         """
         Initialize JSON display.
-        
+
+        Nothing is parsed or read here; the source is resolved the first
+        time the data is needed (normally at render).
+
         Args:
-            data (Union[Dict, str]): JSON data to display
+            data (Union[Dict, str, os.PathLike, IO, Callable]): JSON data to
+                display, as parsed data, JSON text, a file path, a readable
+                buffer, or a data source such as a @cached function, which
+                is called on every render so its TTL applies
             key (Optional[str]): Unique key
-            expanded (bool): Whether to expand the JSON view
+            expanded (Union[bool, int]): Whether to expand the JSON view; in
+                collapsible mode, the number of levels initially expanded
+                (True expands the top level)
+            cache (Union[bool, Hashable]): Reuse the serialized JSON across
+                reruns. With True, file path sources are keyed by path,
+                modification time and size, and JSON text by its hash; other
+                sources need an explicit version token here, since hashing
+                parsed data costs about as much as serializing it
+
+        Raises:
+            ValueError: If cache is True for a source that has no cheap key
         """
-        # Convert string to dict if needed
-        if isinstance(data, str):
-            try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
-                data = {"error": "Invalid JSON"}
-        
-        super().__init__(data, key)
+        if cache is True and not isinstance(data, (os.PathLike, str, bytes, bytearray)):
+            raise ValueError(
+                f"cache=True cannot key a {type(data).__name__} source; "
+                "pass a version token as cache instead"
+            )
+        super().__init__(data, key, cache)
         self._expanded = expanded
-    
+
+    @property
+    def _content(self) -> Any:
+        """Parsed JSON data, loaded from the source on first access."""
+        if callable(self._source):
+            return load_json_source(self._source)
+        data = self._data
+        if data is _UNPARSED:
+            with _source_lock:
+                # Another thread may have parsed and released the source
+                data = self._data
+                if data is _UNPARSED:
+                    data = load_json_source(self._source)
+                    # Paths stay as the render cache token; text and buffers
+                    # are released once their token is taken
+                    release = not isinstance(self._source, os.PathLike)
+                    if release and self._cache is True:
+                        self._cache_token()
+                    self._data = data
+                    if release:
+                        self._source = None
+        return data
+
+    @_content.setter
+    def _content(self, source: Any) -> None:
+        self._source = source
+        self._data = _UNPARSED
+        self._token = None
+
     def render(
-        self, 
-        theme: str = 'default', 
-        language: str = 'json'
+        self,
+        theme: str = 'default',
+        language: str = 'json',
+        max_bytes: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        collapsible: bool = False,
+        table: bool = False,
+        page_size: int = DEFAULT_TABLE_PAGE_SIZE
     ) -> Any:
         """
         Render JSON with syntax highlighting.
-        
+
+        Large payloads can be bounded with max_bytes/max_nodes, which stop
+        serialization early and mark the truncation. In collapsible mode
+        each subtree gets a toggle and only expanded subtrees are
+        serialized. Table mode shows a list of records as a paged table
+        with filter and sort controls; only the visible page is sent.
+
         Args:
             theme (str): Syntax highlighting theme
             language (str): Code language
-        
+            max_bytes (Optional[int]): Maximum characters of JSON to emit
+            max_nodes (Optional[int]): Maximum number of values to emit
+            collapsible (bool): Render subtrees behind per-subtree toggles
+            table (bool): Render a list of records as a paged table
+            page_size (int): Rows per page in table mode
+
+        Returns:
+            Streamlit code block (or dataframe in table mode)
+        """
+        if table:
+            return self._render_table(page_size)
+        if collapsible:
+            return self._render_subtree(self._content, self.key, 0, max_bytes, max_nodes)
+        if max_bytes is not None or max_nodes is not None:
+            text = serialize_cached(self._content, max_bytes=max_bytes, max_nodes=max_nodes)
+            return st.code(text, language=language)
+        return st.code(self._payload(), language=language)
+
+    def _cache_token(self) -> Optional[Hashable]:
+        """
+        Identify the source in render cache keys without touching the data.
+
         Returns:
-            Streamlit code block
+            Optional[Hashable]: Explicit token, (path, mtime, size) for a
+            file source, or the hash of JSON text (taken once, before the
+            text is released)
         """
-        return st.code(
-            json.dumps(self._content, indent=2), 
-            language=language
-        )
\ No newline at end of file
+        if self._cache is not True:
+            return self._cache
+        if isinstance(self._source, os.PathLike):
+            stat = os.stat(self._source)
+            return (os.path.realpath(self._source), stat.st_mtime_ns, stat.st_size)
+        if self._token is None:
+            with _source_lock:
+                if self._token is None:
+                    self._token = fingerprint(self._source)
+        return self._token
+
+    def _prepare(self) -> str:
+        """
+        Serialize the JSON data for display.
+
+        Returns:
+            str: Pretty-printed JSON
+        """
+        return json.dumps(self._content, indent=2)
+
+    def _render_table(self, page_size: int) -> Any:
+        """
+        Render the records as a filtered, sorted, paged table.
+
+        Args:
+            page_size (int): Rows per page
+
+        Returns:
+            Streamlit dataframe for the visible page
+        """
+        records = self._content
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records[:1]):
+            raise TypeError("JSONDisplay table mode requires a list of records")
+
+        prefix = f"{self.key}{KEY_SEPARATOR}"
+        frame = records_frame(records)
+        query = st.text_input("Filter", key=f"{prefix}filter")
+        sort_by = st.selectbox("Sort by", [None, *frame.columns], key=f"{prefix}sort")
+        descending = st.toggle("Descending", key=f"{prefix}descending")
+        view = table_view(records, query, sort_by, descending)
+
+        pages = max(1, -(-len(view) // page_size))
+        page_key = f"{prefix}page"
+        if st.session_state.get(page_key, 1) > pages:
+            st.session_state[page_key] = pages
+        page = st.number_input("Page", min_value=1, max_value=pages, key=page_key)
+        start = (int(page) - 1) * page_size
+
+        result = st.dataframe(view.iloc[start:start + page_size], use_container_width=True)
+        st.caption(f"{len(view)} of {len(frame)} records · page {page} of {pages}")
+        return result
+
+    def _initial_depth(self) -> int:
+        """Number of levels expanded before the user toggles anything."""
+        if isinstance(self._expanded, bool):
+            return int(self._expanded)
+        return self._expanded
+
+    def _render_subtree(
+        self,
+        value: Any,
+        path: str,
+        depth: int,
+        max_bytes: Optional[int],
+        max_nodes: Optional[int]
+    ) -> Any:
+        """
+        Render one expanded node: its direct values, then a toggle per child
+        container. Collapsed children are never serialized.
+
+        Args:
+            value (Any): Node to render
+            path (str): Key path of the node, used for widget keys
+            depth (int): Nesting level of the node
+            max_bytes (Optional[int]): Byte budget for the node's own listing
+            max_nodes (Optional[int]): Node budget for the node's own listing
+
+        Returns:
+            Streamlit code block for the node
+        """
+        result = st.code(
+            serialize_cached(value, max_bytes=max_bytes, max_nodes=max_nodes, max_depth=1),
+            language='json'
+        )
+
+        children: Iterator[Tuple[Any, Any]]
+        if isinstance(value, dict):
+            children = iter(value.items())
+        elif isinstance(value, (list, tuple)):
+            children = enumerate(value)
+        else:
+            return result
+        if max_nodes is not None:
+            children = islice(children, max_nodes)
+
+        for name, child in children:
+            if not isinstance(child, (dict, list, tuple)) or not child:
+                continue
+            child_path = f"{path}{KEY_SEPARATOR}{name}"
+            label = f"{child_path} ({len(child)} items)"
+            if st.toggle(label, value=depth < self._initial_depth(), key=child_path):
+                self._render_subtree(child, child_path, depth + 1, max_bytes, max_nodes)
+        return result
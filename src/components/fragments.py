@@ -0,0 +1,44 @@
+import streamlit as st
+from datetime import timedelta
+from typing import Any, Callable, Optional, Union
+
+# Accepted by st.fragment: seconds, a timedelta, or a string such as "10s"
+RunEvery = Union[int, float, timedelta, str]
+
+
+def _render_section(render: Callable[[], Any]) -> Any:
+    """
+    Body shared by every component fragment.
+
+    Streamlit identifies a fragment by its function and its position in the
+    page, so one module-level body serves any number of sections.
+
+    Args:
+        render (Callable[[], Any]): Renders the section's content
+
+    Returns:
+        Any: Result of render
+    """
+    return render()
+
+
+def render_fragment(
+    render: Callable[[], Any],
+    run_every: Optional[RunEvery] = None
+) -> Any:
+    """
+    Render a section as a Streamlit fragment.
+
+    Widget interaction inside the section reruns only the section, not the
+    whole script. render is kept by Streamlit and called again on every
+    fragment rerun, so it should read current state rather than capture it.
+
+    Args:
+        render (Callable[[], Any]): Renders the section's content
+        run_every (Optional[RunEvery]): Also rerun the section on this
+            interval while the session is active
+
+    Returns:
+        Any: Result of render on a full run
+    """
+    return st.fragment(_render_section, run_every=run_every)(render)
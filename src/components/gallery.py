@@ -0,0 +1,85 @@
+import streamlit as st
+from functools import partial
+from typing import Any, List, Optional, Sequence, Union
+from .base import BaseComponent, attach
+from .concurrency import run_concurrently
+from .container import MAX_GRID_COLUMNS, grid_plan
+from .image import ImageDisplay
+
+
+class Gallery(BaseComponent):
+    """
+    Grid of images built from ImageDisplay tiles.
+
+    All tiles are loaded (and resized) concurrently before the grid is
+    emitted; identical images share bytes through the process-wide image
+    store.
+    """
+
+    __slots__ = ('_columns',)
+
+    def __init__(
+        self,
+        images: Sequence[Union[str, bytes]],
+        key: Optional[str] = None,
+        columns: int = 4
+    ):
+        """
+        Initialize the gallery.
+
+        Args:
+            images (Sequence[Union[str, bytes]]): Image paths, URLs or bytes
+            key (Optional[str]): Unique key
+            columns (int): Images per row
+        """
+        tiles = [ImageDisplay(image, cache=True) for image in images]
+        super().__init__(tiles, key)
+        for index, tile in enumerate(tiles):
+            attach(tile, self, index)
+        self._columns = min(max(1, columns), MAX_GRID_COLUMNS)
+
+    def children(self) -> List[Any]:
+        """
+        Image tiles in display order.
+
+        Returns:
+            List[Any]: ImageDisplay tiles
+        """
+        return self._content
+
+    def render(
+        self,
+        width: Optional[int] = None,
+        captions: Optional[Sequence[str]] = None,
+        dpr: float = 2.0
+    ) -> 'Gallery':
+        """
+        Render the gallery as a row-major grid.
+
+        Args:
+            width (Optional[int]): Tile width; tiles are resized to it
+            captions (Optional[Sequence[str]]): Caption for each image
+            dpr (float): Device pixel ratio resized tiles target
+
+        Returns:
+            Gallery instance
+        """
+        tiles = self._content
+        if not tiles:
+            return self
+
+        # Load every tile on the worker pool; the results land in the render
+        # cache, so each tile's render below only emits the element.
+        if width:
+            prepare = partial(ImageDisplay._payload, width=width, dpr=dpr, format=None)
+        else:
+            prepare = ImageDisplay._payload
+        run_concurrently([partial(prepare, tile) for tile in tiles])
+
+        for start, stop in grid_plan(len(tiles), self._columns):
+            cols = st.columns(self._columns)
+            for offset, (col, tile) in enumerate(zip(cols, tiles[start:stop])):
+                caption = captions[start + offset] if captions else None
+                with col:
+                    tile.render(caption=caption, width=width, dpr=dpr)
+        return self
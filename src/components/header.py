@@ -1,16 +1,20 @@
 import streamlit as st
 from typing import Any, Optional
 from .base import BaseComponent
+from .styles import style_registry
 
 class Header(BaseComponent):
     """
     Streamlit header component with text transformation capabilities.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self, 
         text: str, 
-        key: Optional[str] = None
+        key: Optional[str] = None,
+        cache: bool = False
     ):
         """
         Initialize the Header component.
@@ -18,8 +22,9 @@ class Header(BaseComponent):
         Args:
             text (str): Header text
             key (Optional[str]): Unique key for the component
+            cache (bool): Reuse the styled HTML across reruns
         """
-        super().__init__(text, key)
+        super().__init__(text, key, cache)
     
     def render(self, level: int = 1, style: Optional[dict] = None) -> Any:
         """
@@ -32,17 +37,37 @@ class Header(BaseComponent):
         Returns:
             Streamlit header rendering result
         """
-        # Select appropriate rendering method based on header level
-        render_method = getattr(st, f'header{level}' if level > 1 else 'header')
+        # Streamlit headers render as h2 (header) and h3 (subheader); styled
+        # and deeper headers use the equivalent markdown heading
+        heading = '#' * min(level + 1, 6)
         
         # If style is provided, use markdown for more flexible styling
         if style:
-            style_str = '; '.join(f"{k}: {v}" for k, v in style.items())
-            styled_text = f'<span style="{style_str}">{self._content}</span>'
-            return render_method(styled_text, unsafe_allow_html=True)
+            attribute = style_registry.attribute(style)
+            return st.markdown(
+                f"{heading} {self._payload(attribute=attribute)}",
+                unsafe_allow_html=True
+            )
         
         # Default rendering
-        return render_method(self._content)
+        if level <= 1:
+            return st.header(self._content)
+        if level == 2:
+            return st.subheader(self._content)
+        return st.markdown(f"{heading} {self._content}")
+    
+    def _prepare(self, attribute: str) -> str:
+        """
+        Wrap the header in a styled span.
+        
+        Args:
+            attribute (str): HTML attribute applying the style (a registry
+                class inside a styled page, inline CSS otherwise)
+        
+        Returns:
+            str: Styled HTML span
+        """
+        return f'<span {attribute}>{self._content}</span>'
     
     def upper(self) -> str:
         """
@@ -1,46 +1,156 @@
+import os
 import streamlit as st
-from typing import Union, Optional, Any
-from .base import BaseComponent
+from typing import Callable, Union, Optional, Any
+from .base import BaseComponent, fingerprint, render_cache
+from . import media
 
 class ImageDisplay(BaseComponent):
     """
     Advanced image display component with multiple rendering options.
     """
     
+    __slots__ = ('_source',)
+    
     def __init__(
         self, 
-        image: Union[str, bytes], 
-        key: Optional[str] = None
+        image: Union[str, bytes, Callable[[], Union[str, bytes]]], 
+        key: Optional[str] = None,
+        cache: bool = False
     ):
         """
         Initialize image display.
         
         Args:
-            image (Union[str, bytes]): Image source (path or bytes)
+            image (Union[str, bytes, Callable]): Image source (path or
+                bytes), or a data source such as a @cached function that
+                returns one, called whenever the image is needed
             key (Optional[str]): Unique key
+            cache (bool): Reuse the resolved image bytes across reruns
         """
-        super().__init__(image, key)
+        super().__init__(image, key, cache)
+
+    @property
+    def _content(self) -> Union[str, bytes]:
+        """Image source, resolved from a data source callable if given."""
+        source = self._source
+        return source() if callable(source) else source
+
+    @_content.setter
+    def _content(self, source: Any) -> None:
+        self._source = source
     
     def render(
         self, 
         caption: Optional[str] = None, 
         width: Optional[int] = None,
-        use_column_width: bool = False
+        use_column_width: bool = False,
+        dpr: float = 2.0,
+        format: Optional[str] = None
     ) -> Any:
         """
         Render image with flexible configuration.
         
+        With a width, local and in-memory images are downscaled to
+        width * dpr pixels (cached on disk) before being sent, instead of
+        shipping the full-resolution original.
+        
         Args:
             caption (Optional[str]): Image caption
             width (Optional[int]): Image width
             use_column_width (bool): Expand to column width
+            dpr (float): Device pixel ratio the resized image targets
+            format (Optional[str]): Re-encode format (e.g. 'WEBP')
         
         Returns:
             Streamlit image component
         """
+        if width and not use_column_width:
+            payload = self._payload(width=width, dpr=dpr, format=format)
+        else:
+            payload = self._payload()
         return st.image(
-            self._content, 
+            payload, 
             caption=caption, 
             width=width, 
             use_column_width=use_column_width
-        )
\ No newline at end of file
+        )
+    
+    def _payload(self, **kwargs) -> Any:
+        """
+        Return the prepared image, reusing a cached one when enabled.
+        
+        The source is resolved once here and handed to _fingerprint and
+        _prepare, so a data source callable runs once per render.
+        
+        Returns:
+            Any: Image source for st.image
+        """
+        image = self._content
+        if self._cache is False:
+            return self._prepare(image, **kwargs)
+        token = self._fingerprint(image) if self._cache is True else self._cache
+        cache_key = (
+            type(self),
+            token,
+            fingerprint(sorted(kwargs.items()))
+        )
+        return render_cache.get_or_build(
+            cache_key,
+            lambda: self._prepare(image, **kwargs)
+        )
+    
+    def _fingerprint(self, image: Optional[Union[str, bytes]] = None) -> str:
+        """
+        Fingerprint the image source, including the mtime of local files.
+        
+        Args:
+            image (Optional[Union[str, bytes]]): Resolved source; resolved
+                from the component when omitted
+        
+        Returns:
+            str: Source fingerprint
+        """
+        if image is None:
+            image = self._content
+        if isinstance(image, str) and os.path.isfile(image):
+            return fingerprint((image, os.stat(image).st_mtime_ns))
+        return fingerprint(image)
+    
+    def _prepare(
+        self,
+        image: Optional[Union[str, bytes]] = None,
+        width: Optional[int] = None,
+        dpr: float = 1.0,
+        format: Optional[str] = None
+    ) -> Union[str, bytes]:
+        """
+        Resolve the image for st.image.
+        
+        Local paths and bytes resolve to deduplicated bytes from the shared
+        image store, downscaled to the display width when one is given and
+        Pillow is available; URLs pass through.
+        
+        Args:
+            image (Optional[Union[str, bytes]]): Resolved source; resolved
+                from the component when omitted
+            width (Optional[int]): Display width to downscale to
+            dpr (float): Device pixel ratio the resized image targets
+            format (Optional[str]): Re-encode format
+        
+        Returns:
+            Union[str, bytes]: Image source for st.image
+        """
+        if image is None:
+            image = self._content
+        is_file = isinstance(image, str) and os.path.isfile(image)
+        if not is_file and not isinstance(image, bytes):
+            return image
+        
+        if width and media.Image is not None:
+            try:
+                return media.thumbnail_cache.thumbnail(image, width, dpr, format)
+            except OSError:
+                # Not a decodable image: send the original untouched
+                pass
+        
+        return media.image_store.load(image)
@@ -0,0 +1,149 @@
+import threading
+import time
+import streamlit as st
+from collections import Counter
+from functools import partial
+from typing import Dict
+from .base import KEY_SEPARATOR
+from .fragments import render_fragment
+
+# Clicks admitted and suppressed per widget key, across all sessions
+_counts: Dict[str, Counter] = {}
+_counts_lock = threading.Lock()
+
+
+def _count(key: str, outcome: str) -> None:
+    with _counts_lock:
+        _counts.setdefault(key, Counter())[outcome] += 1
+
+
+class Throttle:
+    """
+    Per-key rate policy for clicks on interactive components.
+
+    As a throttle, the first click runs and further clicks within interval
+    seconds are suppressed. As a debounce (trailing=True), clicks only
+    restart the timer, and the click counts once, after interval seconds
+    without further clicks.
+
+    Policies hold no session state, so one instance can be shared by any
+    number of widgets and sessions; per-key state lives in session state
+    under '<key>/throttle'.
+    """
+
+    __slots__ = ('interval', 'trailing')
+
+    def __init__(self, interval: float = 1.0, trailing: bool = False):
+        """
+        Initialize the policy.
+
+        Args:
+            interval (float): Window in seconds
+            trailing (bool): Debounce instead of throttle
+        """
+        self.interval = interval
+        self.trailing = trailing
+
+    def _state(self, key: str) -> list:
+        """Last click time and whether a debounced click is pending."""
+        return st.session_state.setdefault(f"{key}{KEY_SEPARATOR}throttle", [None, False])
+
+    def gate(self, key: str, clicked: bool) -> bool:
+        """
+        Decide whether a widget counts as clicked in this run.
+
+        Args:
+            key (str): Widget key
+            clicked (bool): Whether the widget reported a click
+
+        Returns:
+            bool: True if the click's work should run now
+        """
+        state = self._state(key)
+        now = time.monotonic()
+
+        if not clicked:
+            # A debounced click fires once the widget has been quiet long enough
+            if state[1] and now - state[0] >= self.interval:
+                state[1] = False
+                _count(key, 'allowed')
+                return True
+            return False
+
+        if self.trailing:
+            if state[1]:
+                _count(key, 'suppressed')
+            state[0], state[1] = now, True
+            return False
+
+        if state[0] is not None and now - state[0] < self.interval:
+            _count(key, 'suppressed')
+            return False
+        state[0] = now
+        _count(key, 'allowed')
+        return True
+
+    def pending(self, key: str) -> bool:
+        """
+        Check whether a debounced click is waiting to fire.
+
+        Args:
+            key (str): Widget key
+
+        Returns:
+            bool: True while a click is pending
+        """
+        return bool(self._state(key)[1])
+
+    def render_pending(self, key: str) -> None:
+        """
+        Schedule the rerun that fires a pending debounced click.
+
+        Args:
+            key (str): Widget key
+        """
+        if self.pending(key):
+            render_fragment(partial(_fire_when_quiet, self, key), run_every=self.interval)
+
+
+def debounce(interval: float = 1.0) -> Throttle:
+    """
+    Build a debounce policy.
+
+    Args:
+        interval (float): Quiet period in seconds before a click counts
+
+    Returns:
+        Throttle: Trailing-edge policy
+    """
+    return Throttle(interval, trailing=True)
+
+
+def _fire_when_quiet(policy: Throttle, key: str) -> None:
+    """Fragment body: rerun the app once a debounced click is due."""
+    last, pending = policy._state(key)
+    if pending and time.monotonic() - last >= policy.interval:
+        st.rerun()
+
+
+def interaction_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Report admitted and suppressed clicks.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Counts per widget key, plus a 'total' entry
+    """
+    with _counts_lock:
+        stats = {key: {'allowed': c['allowed'], 'suppressed': c['suppressed']}
+                 for key, c in _counts.items()}
+    stats['total'] = {
+        outcome: sum(entry[outcome] for entry in stats.values())
+        for outcome in ('allowed', 'suppressed')
+    }
+    return stats
+
+
+def reset_interaction_stats() -> None:
+    """Clear the click counters."""
+    with _counts_lock:
+        _counts.clear()
@@ -1,6 +1,10 @@
 import streamlit as st
 from typing import Any, Optional, List, Union, Callable
 from .base import BaseComponent
+from .concurrency import run_concurrently
+from .fragments import RunEvery, render_fragment
+from .optimizer import Spacer
+from .profiling import profiled
 
 class Layout(BaseComponent):
     """
@@ -8,6 +12,8 @@ class Layout(BaseComponent):
     Provides flexible column, row, and container-based layouts.
     """
     
+    __slots__ = ('_columns', '_rows')
+    
     def __init__(self, key: Optional[str] = None):
         """
         Initialize the Layout component.
@@ -45,27 +51,52 @@ class Layout(BaseComponent):
         
         return self
     
+    @profiled
     def with_columns(
         self, 
-        content: List[Union[Callable, Any]]
+        content: List[Union[Callable, Any]],
+        prepare: Optional[List[Optional[Callable]]] = None
     ) -> 'Layout':
         """
         Populate columns with content.
         
+        When prepare is given, rendering happens in two phases: every
+        column's prepare callable (e.g. a slow query or fetch) runs
+        concurrently on the shared worker pool (coroutine functions on an
+        event loop), then each column's render callable is called with its
+        prepared value on the script thread. Prepare callables must not
+        call Streamlit.
+        
+        Components are rendered where they are, without being recorded or
+        re-parented, so a layout and its content can be reused across
+        reruns and sessions; unkeyed components keep their own keys.
+        
         Args:
             content (List[Union[Callable, Any]]): 
-            List of components or render functions for each column
+            List of components or render functions for each column; None
+            leaves the column empty without entering it
+            prepare (Optional[List[Optional[Callable]]]):
+            Data loaders for each column; None entries skip preparation
         
         Returns:
             Layout instance
         """
         if len(content) > len(self._columns):
             raise ValueError("More content than columns")
+        if prepare is not None and len(prepare) != len(content):
+            raise ValueError("prepare must have one entry per column of content")
+        
+        prepared = run_concurrently(prepare) if prepare is not None else None
         
-        for col, item in zip(self._columns, content):
+        for index, (col, item) in enumerate(zip(self._columns, content)):
+            if item is None:
+                continue
             with col:
                 if callable(item):
-                    item()
+                    if prepared is not None and prepare[index] is not None:
+                        item(prepared[index])
+                    else:
+                        item()
                 elif hasattr(item, 'render'):
                     item.render()
                 else:
@@ -99,6 +130,31 @@ class Layout(BaseComponent):
         """
         return st.container()
     
+    def fragment(
+        self,
+        content: Union[Callable, Any],
+        run_every: Optional[RunEvery] = None
+    ) -> 'Layout':
+        """
+        Render a section that reruns on its own.
+        
+        Widget interaction inside the section reruns only the section, so
+        its latency does not depend on the size of the rest of the page.
+        
+        Args:
+            content (Union[Callable, Any]): Render function or component
+            run_every (Optional[RunEvery]): Also rerun the section on this
+                interval (seconds, timedelta or a string such as "10s")
+        
+        Returns:
+            Layout instance
+        """
+        if hasattr(content, 'render'):
+            render_fragment(content.render, run_every=run_every)
+        else:
+            render_fragment(content, run_every=run_every)
+        return self
+    
     def divider(self) -> 'Layout':
         """
         Add a horizontal divider.
@@ -111,7 +167,7 @@ class Layout(BaseComponent):
     
     def spacer(self, height: int = 1) -> 'Layout':
         """
-        Add vertical space.
+        Add vertical space as a single sized element.
         
         Args:
             height (int): Number of vertical spaces to add
@@ -119,8 +175,7 @@ class Layout(BaseComponent):
         Returns:
             Layout instance
         """
-        for _ in range(height):
-            st.write("")
+        Spacer(height).render()
         return self
     
     def render(self) -> 'Layout':
@@ -0,0 +1,288 @@
+import hashlib
+import io
+import os
+import threading
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Union
+from .base import RenderCache
+from .concurrency import run_concurrently
+
+try:
+    from PIL import Image  # optional, required for resizing
+except ImportError:
+    Image = None
+
+# Where resized images are kept between reruns and restarts
+DEFAULT_THUMBNAIL_DIR = os.path.join(
+    os.path.expanduser('~'), '.cache', 'streamlit-components', 'thumbnails'
+)
+
+# Formats re-encoded as-is; anything else is re-encoded as PNG
+_KEEP_FORMATS = frozenset({'JPEG', 'PNG', 'WEBP', 'GIF'})
+
+
+def source_id(source: Union[str, bytes]) -> str:
+    """
+    Identify an image source for cache keys.
+
+    Local files are identified by path, modification time and size; raw
+    bytes by a hash of their content.
+
+    Args:
+        source (Union[str, bytes]): Image path or encoded image bytes
+
+    Returns:
+        str: Stable source identifier
+    """
+    if isinstance(source, str):
+        path = os.path.realpath(source)
+        stat = os.stat(path)
+        return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+class ImageStore:
+    """
+    Process-wide, content-addressed store of encoded image bytes.
+
+    Identical images (the same logo used by many components and sessions)
+    are held once and every caller gets the same bytes object. Local files
+    are re-read only when their path, mtime or size changes.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the image store.
+
+        Args:
+            max_bytes (int): Total image bytes kept before LRU eviction
+        """
+        self._blobs = RenderCache(max_bytes=max_bytes)
+        self._digests: Dict[str, str] = {}
+
+    def load(self, source: Union[str, bytes]) -> bytes:
+        """
+        Return the deduplicated bytes for an image source.
+
+        Args:
+            source (Union[str, bytes]): Local image path or encoded bytes
+
+        Returns:
+            bytes: Shared image bytes
+        """
+        file_id = None
+        if isinstance(source, str):
+            file_id = source_id(source)
+            digest = self._digests.get(file_id)
+            if digest is not None:
+                data = self._blobs.get(digest)
+                if data is not None:
+                    return data
+            # The store keeps and hands out bytes, so read them in one call
+            with open(source, 'rb') as f:
+                data = f.read()
+        else:
+            data = bytes(source)
+
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        shared = self._blobs.get(digest)
+        if shared is None:
+            self._blobs.put(digest, data)
+            shared = data
+        if file_id is not None:
+            self._digests[file_id] = digest
+        return shared
+
+    def load_many(self, sources: Sequence[Union[str, bytes]]) -> List[bytes]:
+        """
+        Load several images concurrently on the shared worker pool.
+
+        Args:
+            sources (Sequence[Union[str, bytes]]): Image paths or bytes
+
+        Returns:
+            List[bytes]: Shared image bytes, in source order
+        """
+        return run_concurrently([partial(self.load, source) for source in sources])
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report store counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, distinct images and stored bytes
+        """
+        return self._blobs.stats()
+
+
+class ThumbnailCache:
+    """
+    Downscales images to their display size, caching the encoded output on
+    disk with least-recently-used eviction by total size.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_THUMBNAIL_DIR,
+        max_bytes: int = 512 * 1024 * 1024
+    ):
+        """
+        Initialize the thumbnail cache.
+
+        Args:
+            directory (str): Cache directory, created on first write
+            max_bytes (int): Total size of cached files before evicting
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        """Directory holding the cached thumbnails."""
+        return self._directory
+
+    def thumbnail(
+        self,
+        source: Union[str, bytes],
+        width: int,
+        dpr: float = 1.0,
+        format: Optional[str] = None
+    ) -> bytes:
+        """
+        Return the image re-encoded at width * dpr pixels wide.
+
+        Images already narrower than the target are returned unchanged.
+
+        Args:
+            source (Union[str, bytes]): Image path or encoded image bytes
+            width (int): Display width in CSS pixels
+            dpr (float): Device pixel ratio to render for
+            format (Optional[str]): Output format (e.g. 'WEBP'); defaults to
+                the source format
+
+        Returns:
+            bytes: Encoded image
+
+        Raises:
+            ImportError: If Pillow is not installed
+        """
+        if Image is None:
+            raise ImportError("Image resizing requires Pillow")
+
+        target = max(1, round(width * dpr))
+        name = hashlib.blake2b(
+            f"{source_id(source)}|{target}|{format}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        path = os.path.join(self._directory, name)
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # mark as recently used
+            return data
+        except FileNotFoundError:
+            pass
+
+        original = self._read(source)
+        data = self._resize(original, target, format)
+        if data is not original:
+            self._store(path, data)
+        return data
+
+    def _read(self, source: Union[str, bytes]) -> bytes:
+        """Load the encoded bytes of an image source."""
+        return image_store.load(source)
+
+    def _resize(self, data: bytes, target: int, format: Optional[str]) -> bytes:
+        """
+        Downscale encoded image bytes to the target width.
+
+        Returns:
+            bytes: Re-encoded image, or data itself if no resize is needed
+        """
+        with Image.open(io.BytesIO(data)) as image:
+            if image.width <= target and format is None:
+                return data
+
+            out_format = (format or image.format or 'PNG').upper()
+            if out_format not in _KEEP_FORMATS:
+                out_format = 'PNG'
+
+            height = max(1, round(image.height * target / image.width))
+            if image.width > target:
+                resized = image.resize((target, height), Image.LANCZOS)
+            else:
+                resized = image.copy()
+            if out_format == 'JPEG' and resized.mode not in ('RGB', 'L'):
+                resized = resized.convert('RGB')
+
+            buffer = io.BytesIO()
+            resized.save(buffer, format=out_format, optimize=True)
+            return buffer.getvalue()
+
+    def _store(self, path: str, data: bytes) -> None:
+        """Write a thumbnail atomically and evict old entries if over budget."""
+        os.makedirs(self._directory, exist_ok=True)
+        temp = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+
+        with self._lock:
+            if self._total is None:
+                self._total = self.size()
+            else:
+                self._total += len(data)
+            if self._total > self._max_bytes:
+                self._evict()
+
+    def size(self) -> int:
+        """
+        Total size of the cached thumbnails.
+
+        Returns:
+            int: Bytes on disk
+        """
+        try:
+            with os.scandir(self._directory) as entries:
+                return sum(e.stat().st_size for e in entries if e.is_file())
+        except FileNotFoundError:
+            return 0
+
+    def _evict(self) -> None:
+        """Delete least recently used thumbnails until within budget."""
+        with os.scandir(self._directory) as entries:
+            files = sorted(
+                (e.stat().st_mtime_ns, e.stat().st_size, e.path)
+                for e in entries if e.is_file()
+            )
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total = total
+
+    def clear(self) -> None:
+        """Delete every cached thumbnail."""
+        with self._lock:
+            try:
+                with os.scandir(self._directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+            self._total = 0
+
+
+# Process-wide store and cache used by ImageDisplay and Gallery
+image_store = ImageStore()
+thumbnail_cache = ThumbnailCache()
@@ -1,6 +1,69 @@
+import importlib
+import threading
 import streamlit as st
-from typing import List, Dict, Any, Callable, Optional
-from .base import BaseComponent
+from functools import partial
+from typing import List, Any, Callable, Dict, Optional, Union
+from .actions import render_action_status, start_action
+from .base import BaseComponent, KEY_SEPARATOR
+from .interaction import Throttle
+
+# Page targets resolved so far, shared by every Router in the process
+_resolved_pages: Dict[str, Callable] = {}
+_resolve_lock = threading.Lock()
+
+
+def resolve_page(target: str) -> Callable:
+    """
+    Import a page module on first use and return its render function.
+
+    Args:
+        target (str): 'package.module:function', or 'package.module' to use
+            the module's render function
+
+    Returns:
+        Callable: Page render function
+    """
+    page = _resolved_pages.get(target)
+    if page is None:
+        with _resolve_lock:
+            page = _resolved_pages.get(target)
+            if page is None:
+                module_name, _, attr = target.partition(':')
+                module = importlib.import_module(module_name)
+                page = getattr(module, attr or 'render')
+                _resolved_pages[target] = page
+    return page
+
+
+class SidebarItem:
+    """
+    Compact record for a sidebar navigation section.
+
+    Supports item['title'] style access for code written against the
+    previous dict representation.
+    """
+
+    __slots__ = ('title', 'action', 'background', 'throttle')
+
+    def __init__(
+        self,
+        title: str,
+        action: Optional[Callable] = None,
+        background: bool = False,
+        throttle: Optional[Throttle] = None
+    ):
+        self.title = title
+        self.action = action
+        self.background = background
+        self.throttle = throttle
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __repr__(self) -> str:
+        return f"SidebarItem(title={self.title!r}, action={self.action!r})"
 
 
 class Sidebar(BaseComponent):
@@ -8,15 +71,19 @@ class Sidebar(BaseComponent):
     Advanced sidebar navigation and configuration component.
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self, key: str = 'sidebar'):
         """Initialize sidebar."""
         super().__init__(None, key)
-        self._items: List[Dict[str, Any]] = []
+        self._items: List[SidebarItem] = []
 
     def add_section(
         self,
         title: str,
-        action: Optional[Callable] = None
+        action: Optional[Callable] = None,
+        background: bool = False,
+        throttle: Optional[Throttle] = None
     ) -> 'Sidebar':
         """
         Add a navigation section to sidebar.
@@ -24,14 +91,14 @@ class Sidebar(BaseComponent):
         Args:
             title (str): Section title
             action (Optional[Callable]): Action to trigger on selection
+            background (bool): Run action on the background pool; progress
+                is shown under the section until it finishes
+            throttle (Optional[Throttle]): Rate policy for selections
         
         Returns:
             Sidebar instance
         """
-        self._items.append({
-            'title': title,
-            'action': action
-        })
+        self._items.append(SidebarItem(title, action, background, throttle))
         return self
 
     def render(self) -> Any:
@@ -42,8 +109,110 @@ class Sidebar(BaseComponent):
             Selected sidebar item
         """
         with st.sidebar:
-            for item in self._items:
-                if st.button(item['title'], key=item['title']):
-                    if item['action']:
-                        item['action']()
+            # Key by position so duplicate titles never collide
+            for index, item in enumerate(self._items):
+                item_key = f"{self.key}{KEY_SEPARATOR}{index}"
+                clicked = st.button(item.title, key=item_key)
+                if item.throttle is not None:
+                    clicked = item.throttle.gate(item_key, clicked)
+                    item.throttle.render_pending(item_key)
+                if clicked:
+                    if item.action and item.background:
+                        start_action(item_key, item.action)
+                    elif item.action:
+                        item.action()
+                if item.action and item.background:
+                    render_action_status(item_key, item.title)
         return self
+
+
+class Router(Sidebar):
+    """
+    Sidebar-driven page router that imports page modules on demand.
+
+    Pages are registered by name against a module path; a page's module is
+    imported the first time the page is selected and only the active page
+    is rendered. The selection persists in session state and the URL query
+    string.
+    """
+
+    __slots__ = ('_routes', '_default', '_query_param')
+
+    def __init__(self, key: str = 'router', query_param: str = 'page'):
+        """
+        Initialize the router.
+
+        Args:
+            key (str): Unique key, also the session state key for the selection
+            query_param (str): Query string parameter mirroring the selection
+        """
+        super().__init__(key)
+        self._routes: Dict[str, Union[str, Callable]] = {}
+        self._default: Optional[str] = None
+        self._query_param = query_param
+
+    def add_page(
+        self,
+        name: str,
+        target: Union[str, Callable],
+        default: bool = False
+    ) -> 'Router':
+        """
+        Register a page.
+
+        Args:
+            name (str): Section title shown in the sidebar
+            target (Union[str, Callable]): 'package.module:function' path
+                imported lazily, or an already-loaded render function
+            default (bool): Render this page when nothing is selected
+
+        Returns:
+            Router instance
+        """
+        if name in self._routes:
+            raise ValueError(f"Duplicate page: {name!r}")
+
+        self._routes[name] = target
+        if default or self._default is None:
+            self._default = name
+        return self.add_section(name, action=partial(self.select, name))
+
+    def select(self, name: str) -> None:
+        """
+        Make a page the active one.
+
+        Args:
+            name (str): Registered page name
+        """
+        if name not in self._routes:
+            raise KeyError(name)
+        st.session_state[self.key] = name
+        st.query_params[self._query_param] = name
+
+    @property
+    def active(self) -> Optional[str]:
+        """Name of the active page: session state, then query string, then default."""
+        name = st.session_state.get(self.key)
+        if name not in self._routes:
+            name = st.query_params.get(self._query_param)
+        if name not in self._routes:
+            name = self._default
+        return name
+
+    def render(self) -> Any:
+        """
+        Render the sidebar and the active page.
+
+        Returns:
+            Any: Result of the active page's render function
+        """
+        super().render()
+
+        name = self.active
+        if name is None:
+            return None
+        st.session_state[self.key] = name
+
+        target = self._routes[name]
+        page = resolve_page(target) if isinstance(target, str) else target
+        return page()
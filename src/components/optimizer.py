@@ -0,0 +1,182 @@
+import threading
+import streamlit as st
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .header import Header
+from .text import Text
+
+# Height of one spacer line, matching an empty st.write("") element
+SPACER_LINE_HEIGHT_REM = 2.5
+
+_stats_lock = threading.Lock()
+_stats = {'passes': 0, 'elements_in': 0, 'elements_out': 0}
+
+
+class Markdown:
+    """
+    A single markdown element, usually the result of merging several items.
+    """
+
+    __slots__ = ('body',)
+
+    def __init__(self, body: str):
+        """
+        Initialize a markdown element.
+
+        Args:
+            body (str): Markdown source
+        """
+        self.body = body
+
+    def render(self) -> Any:
+        """
+        Emit the markdown element.
+
+        Returns:
+            Streamlit markdown rendering result
+        """
+        return st.markdown(self.body)
+
+
+class Spacer:
+    """
+    Vertical space emitted as one sized element.
+    """
+
+    __slots__ = ('height',)
+
+    def __init__(self, height: int = 1):
+        """
+        Initialize a spacer.
+
+        Args:
+            height (int): Number of empty lines of space
+        """
+        self.height = height
+
+    def render(self) -> Any:
+        """
+        Emit the spacer; a zero-height spacer emits nothing.
+
+        Returns:
+            Streamlit markdown rendering result, or None
+        """
+        if self.height <= 0:
+            return None
+        return st.markdown(
+            f'<div style="height: {self.height * SPACER_LINE_HEIGHT_REM}rem"></div>',
+            unsafe_allow_html=True
+        )
+
+
+def _classify(item: Any) -> Tuple[Optional[str], Any]:
+    """
+    Describe how an item would render in a vertical container.
+
+    Args:
+        item (Any): Container item
+
+    Returns:
+        Tuple[Optional[str], Any]: ('markdown', source), ('text', text),
+        ('spacer', height), or (None, item) for items that are left alone
+    """
+    if isinstance(item, Spacer):
+        return 'spacer', item.height
+    if isinstance(item, str):
+        # st.write("") is the usual way to add an empty line
+        if not item:
+            return 'spacer', 1
+        return 'markdown', item
+    if isinstance(item, Markdown):
+        return 'markdown', item.body
+    # Exact types only: subclasses may render differently
+    if type(item) is Header:
+        return 'markdown', f"## {item._content}"
+    if type(item) is Text:
+        return 'text', item._content
+    return None, item
+
+
+def _emit(kind: Optional[str], values: List[Any]) -> Optional[Any]:
+    """
+    Build the single element that replaces a run of same-kind items.
+
+    Returns:
+        Optional[Any]: Replacement item, or None if the run renders nothing
+    """
+    if kind == 'spacer':
+        height = sum(values)
+        return Spacer(height) if height > 0 else None
+    if kind == 'markdown':
+        return Markdown('\n\n'.join(map(str, values)))
+    # Text content need not be a string; st.text shows its str()
+    return Text('\n'.join(map(str, values)))
+
+
+def optimize(items: Iterable[Any]) -> Tuple[List[Any], int]:
+    """
+    Coalesce a vertical run of items into as few elements as possible.
+
+    Adjacent markdown-compatible items (strings, Markdown, plain Headers)
+    merge into one markdown element, adjacent plain Texts into one text
+    element, and adjacent spacers (including empty strings) into one sized
+    spacer. Zero-height spacers are dropped. Every other item is kept as is
+    and breaks the run, so order is preserved.
+
+    Args:
+        items (Iterable[Any]): Components or content in render order
+
+    Returns:
+        Tuple[List[Any], int]: Optimized items and the number of elements saved
+    """
+    result: List[Any] = []
+    run_kind: Optional[str] = None
+    run_values: List[Any] = []
+    run_items: List[Any] = []
+    count = 0
+
+    def flush() -> None:
+        if not run_items:
+            return
+        if len(run_items) == 1 and not (run_kind == 'spacer' and run_values[0] <= 0):
+            # Nothing to merge; keep the original item
+            result.append(run_items[0])
+        else:
+            merged = _emit(run_kind, run_values)
+            if merged is not None:
+                result.append(merged)
+        run_values.clear()
+        run_items.clear()
+
+    for item in items:
+        count += 1
+        kind, value = _classify(item)
+        if kind is None or kind != run_kind:
+            flush()
+        if kind is None:
+            result.append(item)
+            run_kind = None
+            continue
+        run_kind = kind
+        run_values.append(value)
+        run_items.append(item)
+    flush()
+
+    saved = count - len(result)
+    with _stats_lock:
+        _stats['passes'] += 1
+        _stats['elements_in'] += count
+        _stats['elements_out'] += len(result)
+    return result, saved
+
+
+def optimizer_stats() -> Dict[str, int]:
+    """
+    Report process-wide optimizer counters.
+
+    Returns:
+        Dict[str, int]: Passes run, elements before and after, and elements saved
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['saved'] = stats['elements_in'] - stats['elements_out']
+    return stats
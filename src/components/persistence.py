@@ -0,0 +1,482 @@
+import atexit
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from .base import KEY_SEPARATOR, fingerprint
+
+# Where cached outputs are kept between restarts
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'streamlit-components', 'cache.sqlite3'
+)
+
+# Bumped when the stored entry format changes; part of every entry's version
+STORE_FORMAT = 1
+
+# Seconds new entries are buffered before being written in one transaction
+FLUSH_INTERVAL = 0.5
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS entries ('
+    ' key TEXT NOT NULL,'
+    ' version TEXT NOT NULL,'
+    ' value BLOB NOT NULL,'
+    ' size INTEGER NOT NULL,'
+    ' expires REAL,'
+    ' used REAL NOT NULL,'
+    ' PRIMARY KEY (key, version))',
+    'CREATE INDEX IF NOT EXISTS entries_used ON entries (used)',
+)
+
+
+class DiskStore:
+    """
+    SQLite-backed store that keeps cached outputs across restarts.
+
+    Entries are pickled and keyed by namespace plus a fingerprint of the
+    in-memory cache key, under a version: entries written by another
+    version are never served, so a deploy that changes output starts from
+    a clean slate. Nothing is read up front; caches backed by the store
+    look entries up one at a time when they miss. New entries and the
+    access times of hits are buffered and written in batches off the
+    render path, with least recently used eviction once the file exceeds
+    its budget. Batches are pickled and written on a separate connection
+    without holding the lock lookups take, so a flush never stalls a render.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_STORE_PATH,
+        version: str = '',
+        max_bytes: int = 1024 * 1024 * 1024
+    ):
+        """
+        Initialize the store. The database is opened on first use.
+
+        Args:
+            path (str): SQLite database file, created on first use
+            version (str): Application version; bump it when cached output
+                changes shape or content
+            max_bytes (int): Total size of stored values before evicting
+        """
+        self._path = path
+        self._version = f"{STORE_FORMAT}{KEY_SEPARATOR}{version}"
+        self._max_bytes = max_bytes
+        self._connection: Optional[sqlite3.Connection] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._pending: Dict[str, Tuple[Any, Optional[float]]] = {}
+        # Batch being written by flush, still served to lookups
+        self._flushing: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._touched: Dict[str, float] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._flush_at_exit = False
+        self._total: Optional[int] = None
+        # _lock guards the buffers and the read connection; _write_lock
+        # serializes writes on the writer connection and the size total.
+        # When both are held, _write_lock is taken first.
+        self._lock = threading.RLock()
+        self._write_lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    @property
+    def path(self) -> str:
+        """Database file holding the entries."""
+        return self._path
+
+    @property
+    def version(self) -> str:
+        """Version entries are read and written under."""
+        return self._version
+
+    def _key(self, namespace: str, key: Hashable) -> str:
+        return f"{namespace}{KEY_SEPARATOR}{fingerprint(key)}"
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a connection to the database, creating it if needed."""
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(
+            self._path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        # WAL lets readers (and other server workers) read while one writes
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the read connection on first use. Call with the lock held."""
+        if self._connection is None:
+            self._connection = self._open()
+        return self._connection
+
+    def _connect_writer(self) -> sqlite3.Connection:
+        """Open the write connection on first use. Call with the write lock held."""
+        if self._writer is None:
+            self._writer = self._open()
+        return self._writer
+
+    def load(self, namespace: str, key: Hashable) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Look up one entry.
+
+        Args:
+            namespace (str): Namespace of the owning cache
+            key (Hashable): In-memory cache key
+
+        Returns:
+            Optional[Tuple[Any, Optional[float]]]: Value and wall-clock
+            expiry time, or None if missing, expired or unreadable
+        """
+        row_key = self._key(namespace, key)
+        with self._lock:
+            pending = self._pending.get(row_key) or self._flushing.get(row_key)
+            if pending is not None:
+                self.hits += 1
+                return pending
+            try:
+                connection = self._connect()
+                row = connection.execute(
+                    'SELECT value, expires FROM entries WHERE key = ? AND version = ?',
+                    (row_key, self._version)
+                ).fetchone()
+            except sqlite3.Error:
+                self.errors += 1
+                return None
+            now = time.time()
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return None
+            # Recorded for eviction order, written with the next batch
+            self._touched[row_key] = now
+            self._schedule_flush()
+
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            # Written by an incompatible library version; drop it
+            self.discard(namespace, key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value, row[1]
+
+    def save(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        expires: Optional[float] = None
+    ) -> None:
+        """
+        Queue an entry to be written.
+
+        Args:
+            namespace (str): Namespace of the owning cache
+            key (Hashable): In-memory cache key
+            value (Any): Picklable value; must not be mutated afterwards
+            expires (Optional[float]): Wall-clock expiry time
+        """
+        with self._lock:
+            self._pending[self._key(namespace, key)] = (value, expires)
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer unless one is running. Call with the lock held."""
+        if self._timer is None:
+            if not self._flush_at_exit:
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+            self._timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> int:
+        """
+        Write queued entries and access times in one transaction.
+
+        The queue is swapped out under the lock; pickling and writing
+        happen outside it, so lookups and saves go on meanwhile. Values
+        that cannot be pickled are skipped.
+
+        Returns:
+            int: Entries written
+        """
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                touched, self._touched = self._touched, {}
+                self._flushing = pending
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not pending and not touched:
+                return 0
+            try:
+                return self._write(pending, touched)
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    def _write(
+        self,
+        pending: Dict[str, Tuple[Any, Optional[float]]],
+        touched: Dict[str, float]
+    ) -> int:
+        """Write one flushed batch. Call with the write lock held."""
+        now = time.time()
+        rows = []
+        for row_key, (value, expires) in pending.items():
+            try:
+                blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                continue
+            if len(blob) <= self._max_bytes:
+                rows.append((row_key, self._version, blob, len(blob), expires, now))
+
+        try:
+            connection = self._connect_writer()
+            with connection:
+                connection.execute('BEGIN')
+                connection.executemany(
+                    'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)', rows
+                )
+                connection.executemany(
+                    'UPDATE entries SET used = ? WHERE key = ? AND version = ?',
+                    [
+                        (used, row_key, self._version)
+                        for row_key, used in touched.items()
+                        if row_key not in pending
+                    ]
+                )
+            if self._total is None:
+                self._total = self._size(connection)
+            else:
+                self._total += sum(row[3] for row in rows)
+            if self._total > self._max_bytes:
+                self._evict(connection)
+        except sqlite3.Error:
+            self.errors += 1
+            return 0
+        self.writes += len(rows)
+        return len(rows)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries down to 90% of the budget."""
+        total = self._size(connection)
+        target = self._max_bytes * 0.9
+        victims = []
+        for key, version, size in connection.execute(
+            'SELECT key, version, size FROM entries ORDER BY used'
+        ):
+            if total <= target:
+                break
+            victims.append((key, version))
+            total -= size
+        with connection:
+            connection.execute('BEGIN')
+            connection.executemany(
+                'DELETE FROM entries WHERE key = ? AND version = ?', victims
+            )
+        self._total = total
+
+    def size(self) -> int:
+        """
+        Total size of the stored values, all versions included.
+
+        Returns:
+            int: Bytes
+        """
+        with self._lock:
+            return self._size(self._connect())
+
+    @staticmethod
+    def _size(connection: sqlite3.Connection) -> int:
+        """Total size of the stored values, read on the given connection."""
+        return connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM entries'
+        ).fetchone()[0]
+
+    def discard(self, namespace: str, key: Hashable) -> None:
+        """
+        Remove one entry.
+
+        Args:
+            namespace (str): Namespace of the owning cache
+            key (Hashable): In-memory cache key
+        """
+        row_key = self._key(namespace, key)
+        with self._write_lock, self._lock:
+            self._pending.pop(row_key, None)
+            self._touched.pop(row_key, None)
+            try:
+                self._connect_writer().execute(
+                    'DELETE FROM entries WHERE key = ? AND version = ?',
+                    (row_key, self._version)
+                )
+            except sqlite3.Error:
+                self.errors += 1
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove this version's entries.
+
+        Args:
+            namespace (Optional[str]): Only remove this namespace's entries
+        """
+        prefix = '' if namespace is None else f"{namespace}{KEY_SEPARATOR}"
+        with self._write_lock, self._lock:
+            self._pending = {
+                key: entry for key, entry in self._pending.items()
+                if not key.startswith(prefix)
+            }
+            self._touched = {
+                key: used for key, used in self._touched.items()
+                if not key.startswith(prefix)
+            }
+            try:
+                self._connect_writer().execute(
+                    'DELETE FROM entries WHERE version = ? AND substr(key, 1, ?) = ?',
+                    (self._version, len(prefix), prefix)
+                )
+            except sqlite3.Error:
+                self.errors += 1
+            self._total = None
+
+    def prune(self) -> int:
+        """
+        Delete expired entries and entries written by other versions.
+
+        Returns:
+            int: Entries deleted
+        """
+        with self._write_lock, self._lock:
+            cursor = self._connect_writer().execute(
+                'DELETE FROM entries WHERE version != ? OR expires <= ?',
+                (self._version, time.time())
+            )
+            self._total = None
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report store counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, writes, errors, queued entries,
+            stored entries and bytes (all versions)
+        """
+        with self._lock:
+            entries, size = self._connect().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+            ).fetchone()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'errors': self.errors,
+                'pending': len(self._pending) + len(self._flushing),
+                'entries': entries,
+                'bytes': size,
+                'max_bytes': self._max_bytes,
+            }
+
+    def close(self) -> None:
+        """Flush queued entries and close the database."""
+        self.flush()
+        with self._write_lock, self._lock:
+            for connection in (self._connection, self._writer):
+                if connection is not None:
+                    connection.close()
+            self._connection = None
+            self._writer = None
+
+
+_active: Optional[DiskStore] = None
+_active_lock = threading.Lock()
+
+
+def enable_persistence(
+    path: str = DEFAULT_STORE_PATH,
+    version: str = '',
+    max_bytes: int = 1024 * 1024 * 1024
+) -> DiskStore:
+    """
+    Back the process-wide render and data caches with a disk store.
+
+    Safe to call on every script run: the store is created once per path
+    and version.
+
+    Args:
+        path (str): SQLite database file
+        version (str): Application version entries are keyed by
+        max_bytes (int): Total size of stored values before evicting
+
+    Returns:
+        DiskStore: The active store
+    """
+    global _active
+    from .base import render_cache
+    from .cache import data_cache
+
+    with _active_lock:
+        if _active is None or (_active.path, _active.version) != (
+            path, f"{STORE_FORMAT}{KEY_SEPARATOR}{version}"
+        ):
+            if _active is not None:
+                _active.close()
+            _active = DiskStore(path, version, max_bytes)
+            render_cache.persist(_active, 'render')
+            data_cache.persist(_active, 'data')
+        return _active
+
+
+def disable_persistence() -> None:
+    """Detach the disk store from the process-wide caches."""
+    global _active
+    from .base import render_cache
+    from .cache import data_cache
+
+    with _active_lock:
+        render_cache.persist(None, 'render')
+        data_cache.persist(None, 'data')
+        if _active is not None:
+            _active.close()
+            _active = None
+
+
+def prewarm(render: Callable[[], Any]) -> Dict[str, float]:
+    """
+    Render a page headlessly to fill the shared caches.
+
+    The page runs outside a Streamlit server, in Streamlit's bare mode,
+    where elements are discarded and no session is needed: every payload,
+    data load and thumbnail it produces is cached, and written to the
+    disk store when persistence is enabled. Run it at deploy time, before
+    the server starts taking sessions, so the first visitors find warm
+    caches.
+
+    Args:
+        render (Callable[[], Any]): Renders the page (e.g. app.main)
+
+    Returns:
+        Dict[str, float]: Entries written to the disk store and seconds
+        taken
+    """
+    store = _active
+    started = time.perf_counter()
+    writes = store.writes if store is not None else 0
+    render()
+    if store is not None:
+        store.flush()
+    return {
+        'written': (store.writes if store is not None else 0) - writes,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
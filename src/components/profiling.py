@@ -0,0 +1,350 @@
+import json
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Columns of a profile row, in report order
+FIELDS = ('calls', 'seconds', 'self_seconds', 'elements', 'bytes')
+
+# Prometheus metric names for each field
+_METRICS = {
+    'calls': ('sc_render_calls_total', 'Render calls'),
+    'seconds': ('sc_render_seconds_total', 'Wall time including child components'),
+    'self_seconds': ('sc_render_self_seconds_total', 'Wall time excluding child components'),
+    'elements': ('sc_render_elements_total', 'Streamlit elements emitted'),
+    'bytes': ('sc_render_bytes_total', 'Serialized element payload bytes'),
+}
+
+Row = Tuple[str, str]
+
+
+class RenderProfiler:
+    """
+    Records per-component render cost, keyed by component class and key.
+
+    Instrumented methods check a single flag while the profiler is off.
+    When on, every call records wall time (inclusive and exclusive of child
+    components), plus the Streamlit elements and payload bytes the component
+    emitted itself.
+    """
+
+    def __init__(self):
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._totals: Dict[Row, List[float]] = {}
+        # Call stack and per-run table of each script thread
+        self._local = threading.local()
+        self._original_enqueue: Optional[Callable] = None
+        self._server: Optional[Any] = None
+
+    def enable(self) -> None:
+        """Start recording and count the elements Streamlit emits."""
+        if self.enabled:
+            return
+        self._install_hook()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; collected totals are kept."""
+        self.enabled = False
+        self._remove_hook()
+
+    def reset(self) -> None:
+        """Discard collected totals."""
+        with self._lock:
+            self._totals.clear()
+
+    def _install_hook(self) -> None:
+        """Wrap Streamlit's element enqueue to count elements and bytes."""
+        from streamlit.delta_generator import DeltaGenerator
+
+        original = DeltaGenerator.__dict__.get('_enqueue')
+        if original is None:
+            # Element counts stay at zero on Streamlit versions without it
+            return
+        local = self._local
+
+        @wraps(original)
+        def _enqueue(dg, delta_type, element_proto, *args, **kwargs):
+            counters = getattr(local, 'counters', None)
+            if counters is not None:
+                counters[0] += 1
+                counters[1] += element_proto.ByteSize()
+            return original(dg, delta_type, element_proto, *args, **kwargs)
+
+        self._original_enqueue = original
+        DeltaGenerator._enqueue = _enqueue
+
+    def _remove_hook(self) -> None:
+        """Restore Streamlit's element enqueue."""
+        if self._original_enqueue is None:
+            return
+        from streamlit.delta_generator import DeltaGenerator
+
+        DeltaGenerator._enqueue = self._original_enqueue
+        self._original_enqueue = None
+
+    def _thread_state(self) -> Tuple[List[List[float]], List[int], Dict[Row, List[float]]]:
+        """Return this thread's call stack, element counters and run table."""
+        local = self._local
+        stack = getattr(local, 'stack', None)
+        if stack is None:
+            stack = local.stack = []
+            local.counters = [0, 0]
+            local.run = {}
+        return stack, local.counters, local.run
+
+    def call(self, label: str, component: Any, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run an instrumented method and record its cost.
+
+        Args:
+            label (str): Component class (and method, if not render)
+            component (Any): Instance whose method is called
+            func (Callable): Unwrapped method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: Result of func
+        """
+        stack, counters, run = self._thread_state()
+        # Time, elements and bytes spent in nested instrumented calls
+        frame = [0.0, 0, 0]
+        elements_before, bytes_before = counters
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return func(component, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            elements = counters[0] - elements_before
+            nbytes = counters[1] - bytes_before
+            if stack:
+                parent = stack[-1]
+                parent[0] += elapsed
+                parent[1] += elements
+                parent[2] += nbytes
+            row = (label, _known_key(component))
+            sample = (1, elapsed, elapsed - frame[0], elements - frame[1], nbytes - frame[2])
+            _add(run, row, sample)
+            with self._lock:
+                _add(self._totals, row, sample)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Totals for every component since the profiler was last reset.
+
+        Returns:
+            List[Dict[str, Any]]: Rows sorted by exclusive time, slowest first
+        """
+        with self._lock:
+            totals = {row: list(values) for row, values in self._totals.items()}
+        return _rows(totals)
+
+    def take_run(self) -> List[Dict[str, Any]]:
+        """
+        Rows recorded on this script thread since the last take_run call.
+
+        Call at the end of a script run to get that run's breakdown.
+
+        Returns:
+            List[Dict[str, Any]]: Rows sorted by exclusive time, slowest first
+        """
+        _, _, run = self._thread_state()
+        rows = _rows(run)
+        run.clear()
+        return rows
+
+    def overlay(self, limit: int = 25) -> List[Dict[str, Any]]:
+        """
+        Show this run's breakdown in a collapsed debug panel.
+
+        Call at the end of the script, after every profiled component.
+
+        Args:
+            limit (int): Rows shown, slowest first
+
+        Returns:
+            List[Dict[str, Any]]: The run's rows
+        """
+        import streamlit as st
+
+        rows = self.take_run()
+        seconds = sum(row['self_seconds'] for row in rows)
+        elements = sum(row['elements'] for row in rows)
+        with st.expander(
+            f"Render profile: {seconds * 1000:.1f} ms, {elements} elements"
+        ):
+            st.dataframe(rows[:limit], use_container_width=True)
+        return rows
+
+    def to_json(self) -> str:
+        """
+        Export the totals as JSON.
+
+        Returns:
+            str: JSON array of rows
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Export the totals in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text
+        """
+        rows = self.snapshot()
+        lines = []
+        for field in FIELDS:
+            name, help_text = _METRICS[field]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for row in rows:
+                labels = (
+                    f'component="{_escape(row["component"])}",'
+                    f'key="{_escape(row["key"])}"'
+                )
+                lines.append(f"{name}{{{labels}}} {row[field]}")
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 9464, host: str = '127.0.0.1') -> Any:
+        """
+        Serve snapshots over HTTP from a background thread.
+
+        /metrics returns Prometheus text and /profile.json returns JSON.
+        Calling serve again returns the running server.
+
+        Args:
+            port (int): Port to listen on
+            host (str): Interface to bind; local only by default
+
+        Returns:
+            ThreadingHTTPServer: Running server
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        with self._lock:
+            if self._server is not None:
+                return self._server
+            profiler = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self) -> None:
+                    if self.path == '/metrics':
+                        body, content_type = profiler.to_prometheus(), 'text/plain; version=0.0.4'
+                    elif self.path == '/profile.json':
+                        body, content_type = profiler.to_json(), 'application/json'
+                    else:
+                        self.send_error(404)
+                        return
+                    data = body.encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', content_type)
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+
+                def log_message(self, format: str, *args: Any) -> None:
+                    pass
+
+            self._server = ThreadingHTTPServer((host, port), Handler)
+            threading.Thread(
+                target=self._server.serve_forever,
+                name='render-profiler',
+                daemon=True
+            ).start()
+            return self._server
+
+
+def _add(table: Dict[Row, List[float]], row: Row, sample: Tuple) -> None:
+    """Accumulate one call sample into a table."""
+    values = table.get(row)
+    if values is None:
+        table[row] = list(sample)
+    else:
+        for index, value in enumerate(sample):
+            values[index] += value
+
+
+def _rows(table: Dict[Row, List[float]]) -> List[Dict[str, Any]]:
+    """Convert a table into report rows, slowest first."""
+    rows = [
+        {'component': component, 'key': key, **dict(zip(FIELDS, values))}
+        for (component, key), values in table.items()
+    ]
+    rows.sort(key=lambda row: row['self_seconds'], reverse=True)
+    return rows
+
+
+def _known_key(component: Any) -> str:
+    """
+    Key of a component as far as it is already known, without assigning one.
+
+    Reading ``component.key`` on an unkeyed root would hand out a per-run
+    root key (see base.root_key) in profiling order rather than render
+    order, so only explicit keys, parent paths and root keys that were
+    already assigned are used.
+
+    Args:
+        component (Any): Profiled component
+
+    Returns:
+        str: Component key, or '' if none is known yet
+    """
+    from .base import KEY_SEPARATOR
+
+    parts = []
+    while component is not None:
+        key = getattr(component, '_key', None)
+        if key:
+            parts.append(str(key))
+            break
+        parent = getattr(component, '_parent', None)
+        if parent is None:
+            key = getattr(component, '_root_key', None)
+            if not key:
+                return ''
+            parts.append(key)
+            break
+        parts.append(str(getattr(component, '_index', 0)))
+        component = parent
+    return KEY_SEPARATOR.join(reversed(parts))
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Process-wide profiler used by the instrumented components
+profiler = RenderProfiler()
+
+
+def profiled(func: Callable) -> Callable:
+    """
+    Instrument a component method with the process-wide profiler.
+
+    Args:
+        func (Callable): Method taking the component as first argument
+
+    Returns:
+        Callable: Wrapped method
+    """
+    if getattr(func, '__profiled__', False):
+        return func
+    owner = func.__qualname__.rpartition('.')[0]
+    label = owner if func.__name__ == 'render' else func.__qualname__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not profiler.enabled:
+            return func(self, *args, **kwargs)
+        return profiler.call(label, self, func, *args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
@@ -0,0 +1,141 @@
+import hashlib
+import threading
+import streamlit as st
+from contextlib import contextmanager
+from typing import Any, Dict, FrozenSet, Iterator, Mapping, Optional, Tuple
+
+
+class StyleRegistry:
+    """
+    Interns style dictionaries as generated CSS classes.
+
+    Inside a page() block components reference classes and the page emits a
+    single <style> block for every class it used. Outside a page block the
+    registry hands out the interned inline declarations instead, so the CSS
+    string for a given style is only ever built once.
+    """
+
+    def __init__(self, prefix: str = 'sc'):
+        """
+        Initialize the registry.
+
+        Args:
+            prefix (str): Prefix for generated class names
+        """
+        self._prefix = prefix
+        self._classes: Dict[FrozenSet[Tuple[str, Any]], Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        # Each script thread renders its own page
+        self._page = threading.local()
+
+    def _intern(self, style: Mapping[str, Any]) -> Tuple[str, str]:
+        """
+        Look up (or create) the class for a style.
+
+        Args:
+            style (Mapping[str, Any]): CSS property/value pairs
+
+        Returns:
+            Tuple[str, str]: Class name and CSS declarations
+        """
+        key = frozenset(style.items())
+        entry = self._classes.get(key)
+        if entry is None:
+            declarations = '; '.join(f"{k}: {v}" for k, v in style.items())
+            digest = hashlib.blake2b(
+                repr(sorted(key, key=repr)).encode('utf-8'),
+                digest_size=5
+            ).hexdigest()
+            with self._lock:
+                entry = self._classes.setdefault(
+                    key, (f"{self._prefix}-{digest}", declarations)
+                )
+        return entry
+
+    def _use(self, name: str, declarations: str) -> bool:
+        """
+        Record a class as used by the page being rendered on this thread.
+
+        Returns:
+            bool: Whether a page block is active
+        """
+        used = getattr(self._page, 'used', None)
+        if used is None:
+            return False
+        used[name] = declarations
+        return True
+
+    def class_name(self, style: Mapping[str, Any]) -> str:
+        """
+        Return the generated class for a style.
+
+        Args:
+            style (Mapping[str, Any]): CSS property/value pairs
+
+        Returns:
+            str: Class name
+        """
+        name, declarations = self._intern(style)
+        self._use(name, declarations)
+        return name
+
+    def attribute(self, style: Mapping[str, Any]) -> str:
+        """
+        Return the HTML attribute that applies a style.
+
+        Args:
+            style (Mapping[str, Any]): CSS property/value pairs
+
+        Returns:
+            str: class="..." inside a page block, style="..." otherwise
+        """
+        name, declarations = self._intern(style)
+        if self._use(name, declarations):
+            return f'class="{name}"'
+        return f'style="{declarations}"'
+
+    def stylesheet(self, classes: Optional[Mapping[str, str]] = None) -> str:
+        """
+        Build a <style> block.
+
+        Args:
+            classes (Optional[Mapping[str, str]]): Class name to declarations;
+                every registered class when omitted
+
+        Returns:
+            str: HTML style element
+        """
+        if classes is None:
+            classes = dict(self._classes.values())
+        rules = '\n'.join(f".{name} {{ {decl} }}" for name, decl in classes.items())
+        return f"<style>\n{rules}\n</style>"
+
+    @contextmanager
+    def page(self) -> Iterator['StyleRegistry']:
+        """
+        Render a page that references classes instead of inline styles.
+
+        On exit, one <style> block with the classes used on the page is
+        emitted. Nested page blocks defer to the outermost one.
+
+        Yields:
+            StyleRegistry instance
+        """
+        outer = getattr(self._page, 'used', None)
+        used: Dict[str, str] = {}
+        self._page.used = used
+        try:
+            yield self
+        finally:
+            self._page.used = outer
+            if outer is not None:
+                outer.update(used)
+            elif used:
+                st.markdown(self.stylesheet(used), unsafe_allow_html=True)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+# Process-wide registry used by the built-in components
+style_registry = StyleRegistry()
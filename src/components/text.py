@@ -1,12 +1,15 @@
 import streamlit as st
 from typing import Any, Optional
 from .base import BaseComponent
+from .styles import style_registry
 
 class Text(BaseComponent):
     """
     Streamlit text component with enhanced text manipulation capabilities.
     """
     
+    __slots__ = ()
+    
     def render(self, style: Optional[dict] = None) -> Any:
         """
         Render the text component in Streamlit.
@@ -19,14 +22,25 @@ class Text(BaseComponent):
         """
         # If style is provided, use markdown for more flexible styling
         if style:
-            # Convert style dict to CSS-like inline styling
-            style_str = '; '.join(f"{k}: {v}" for k, v in style.items())
-            styled_text = f'<span style="{style_str}">{self._content}</span>'
-            return st.markdown(styled_text, unsafe_allow_html=True)
+            attribute = style_registry.attribute(style)
+            return st.markdown(self._payload(attribute=attribute), unsafe_allow_html=True)
         
         # Default rendering
         return st.text(self._content)
     
+    def _prepare(self, attribute: str) -> str:
+        """
+        Wrap the text in a styled span.
+        
+        Args:
+            attribute (str): HTML attribute applying the style (a registry
+                class inside a styled page, inline CSS otherwise).
+        
+        Returns:
+            str: Styled HTML span.
+        """
+        return f'<span {attribute}>{self._content}</span>'
+    
     def upper(self) -> str:
         """
         Convert text to uppercase.
@@ -8,6 +8,8 @@ class Title(BaseComponent):
     Streamlit title component with text transformation capabilities.
     """
 
+    __slots__ = ()
+
     def render(self, style: Optional[dict] = None) -> Any:
         """
         Render the title component in Streamlit.
@@ -0,0 +1,296 @@
+import threading
+import streamlit as st
+from functools import wraps
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from .base import KEY_SEPARATOR, DuplicateKeyError, iter_tree
+from .container import Container
+from .fragments import RunEvery, render_fragment
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Convert mutable render arguments into read-only equivalents.
+
+    Args:
+        value (Any): Render argument
+
+    Returns:
+        Any: Read-only version of the value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze_value(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_value(v) for v in value)
+    return value
+
+
+class Node:
+    """
+    Immutable render step of a frozen component tree.
+
+    Nodes hold no per-session state, so a single tree can be rendered
+    concurrently by every session's script thread.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def components(self) -> Iterable[Any]:
+        """
+        Components referenced by this node and its descendants.
+
+        Returns:
+            Iterable[Any]: Referenced components
+        """
+        return ()
+
+    def render(self) -> Any:
+        """
+        Emit the node into the current Streamlit container.
+
+        Raises:
+            NotImplementedError if not implemented by subclass.
+        """
+        raise NotImplementedError("Subclasses must implement render method")
+
+
+class ComponentNode(Node):
+    """
+    Renders a component with fixed render keyword arguments.
+    """
+
+    __slots__ = ('component', 'kwargs')
+
+    def __init__(self, component: Any, **kwargs):
+        """
+        Initialize a component node.
+
+        Args:
+            component (Any): Component exposing a render method
+            **kwargs: Arguments passed to component.render
+        """
+        object.__setattr__(self, 'component', component)
+        object.__setattr__(self, 'kwargs', _freeze_value(kwargs))
+
+    def components(self) -> Iterable[Any]:
+        return (self.component,)
+
+    def render(self) -> Any:
+        return self.component.render(**self.kwargs)
+
+
+class CallNode(Node):
+    """
+    Calls a render function (or Streamlit element) with fixed arguments.
+    """
+
+    __slots__ = ('func', 'args', 'kwargs')
+
+    def __init__(self, func: Callable, *args, **kwargs):
+        """
+        Initialize a call node.
+
+        Args:
+            func (Callable): Render function, e.g. st.divider
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        object.__setattr__(self, 'func', func)
+        object.__setattr__(self, 'args', _freeze_value(list(args)))
+        object.__setattr__(self, 'kwargs', _freeze_value(kwargs))
+
+    def render(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+
+class ColumnsNode(Node):
+    """
+    Lays out child nodes in Streamlit columns.
+    """
+
+    __slots__ = ('spec', 'columns', 'gap')
+
+    def __init__(
+        self,
+        spec: Union[int, List[int]],
+        columns: Sequence[Sequence[Node]],
+        gap: str = "small"
+    ):
+        """
+        Initialize a columns node.
+
+        Args:
+            spec (Union[int, List[int]]): Column count or width ratios
+            columns (Sequence[Sequence[Node]]): Child nodes for each column;
+                empty columns are created but never entered
+            gap (str): Space between columns ('small', 'medium', 'large')
+        """
+        count = spec if isinstance(spec, int) else len(spec)
+        if len(columns) > count:
+            raise ValueError("More content than columns")
+
+        object.__setattr__(self, 'spec', _freeze_value(spec))
+        object.__setattr__(self, 'columns', tuple(tuple(c) for c in columns))
+        object.__setattr__(self, 'gap', gap)
+
+    def components(self) -> Iterable[Any]:
+        for column in self.columns:
+            for node in column:
+                yield from node.components()
+
+    def render(self) -> Any:
+        cols = st.columns(self.spec, gap=self.gap)
+        for col, nodes in zip(cols, self.columns):
+            if not nodes:
+                continue
+            with col:
+                for node in nodes:
+                    node.render()
+        return cols
+
+
+class FragmentNode(Node):
+    """
+    Renders child nodes as a Streamlit fragment, so interaction inside them
+    reruns only this section of the tree.
+    """
+
+    __slots__ = ('nodes', 'run_every')
+
+    def __init__(self, nodes: Sequence[Node], run_every: Optional[RunEvery] = None):
+        """
+        Initialize a fragment node.
+
+        Args:
+            nodes (Sequence[Node]): Child nodes in render order
+            run_every (Optional[RunEvery]): Also rerun the section on this
+                interval
+        """
+        object.__setattr__(self, 'nodes', tuple(nodes))
+        object.__setattr__(self, 'run_every', run_every)
+
+    def components(self) -> Iterable[Any]:
+        for node in self.nodes:
+            yield from node.components()
+
+    def _render_nodes(self) -> None:
+        for node in self.nodes:
+            node.render()
+
+    def render(self) -> Any:
+        return render_fragment(self._render_nodes, run_every=self.run_every)
+
+
+class FrozenTree:
+    """
+    Immutable, validated sequence of render nodes.
+    """
+
+    __slots__ = ('nodes', 'keys')
+
+    def __init__(self, nodes: Tuple[Node, ...], keys: Tuple[str, ...]):
+        object.__setattr__(self, 'nodes', nodes)
+        object.__setattr__(self, 'keys', keys)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("FrozenTree is immutable")
+
+    def render(self) -> 'FrozenTree':
+        """
+        Render every node in order for the current session.
+
+        Returns:
+            FrozenTree instance
+        """
+        for node in self.nodes:
+            node.render()
+        return self
+
+
+def _seal(component: Any) -> None:
+    """
+    Make a component's child list read-only so it cannot change after freezing.
+
+    Args:
+        component (Any): Component to seal
+    """
+    if isinstance(component, Container):
+        component._content = tuple(component._content)
+
+
+def freeze(nodes: Iterable[Node], key: str = 'tree') -> FrozenTree:
+    """
+    Validate and freeze a sequence of render nodes.
+
+    Unkeyed root components are keyed by their position in the tree, so
+    widget keys are identical for every session sharing it. Each component
+    instance may appear only once: a second placement would render the
+    same widget keys twice.
+
+    Args:
+        nodes (Iterable[Node]): Render nodes in page order
+        key (str): Key prefix for the tree's root components
+
+    Returns:
+        FrozenTree: Tree safe to share between sessions
+
+    Raises:
+        DuplicateKeyError: If two components in the tree share a key, or a
+            component appears more than once
+    """
+    nodes = tuple(nodes)
+    seen: Dict[str, Any] = {}
+    placed = set()
+    for index, node in enumerate(nodes):
+        for position, root in enumerate(node.components()):
+            if getattr(root, '_parent', True) is None and not root._key:
+                root._key = KEY_SEPARATOR.join((key, str(index), str(position)))
+            for component in iter_tree(root):
+                if id(component) in placed:
+                    raise DuplicateKeyError(
+                        f"Component appears more than once in the tree: {component!r}"
+                    )
+                placed.add(id(component))
+                _seal(component)
+                component_key = component.key
+                if component_key is None:
+                    continue
+                if component_key in seen:
+                    raise DuplicateKeyError(
+                        f"Duplicate component key: {component_key!r}"
+                    )
+                seen[component_key] = component
+    return FrozenTree(nodes, tuple(seen))
+
+
+def build_once(builder: Callable[[], Iterable[Node]]) -> Callable[[], FrozenTree]:
+    """
+    Decorate a tree builder so it runs once per process.
+
+    The first caller builds and freezes the tree; every later rerun of every
+    session gets the same shared FrozenTree.
+
+    Args:
+        builder (Callable[[], Iterable[Node]]): Returns the page's render nodes
+
+    Returns:
+        Callable[[], FrozenTree]: Accessor for the shared tree
+    """
+    lock = threading.Lock()
+    tree: List[FrozenTree] = []
+
+    @wraps(builder)
+    def get_tree() -> FrozenTree:
+        if not tree:
+            with lock:
+                if not tree:
+                    tree.append(freeze(builder(), key=builder.__name__))
+        return tree[0]
+
+    return get_tree
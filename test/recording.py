@@ -0,0 +1,314 @@
+import streamlit as st
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Display elements recorded with their payload; all return None
+DISPLAY_ELEMENTS = (
+    'markdown', 'write', 'text', 'title', 'header', 'subheader', 'caption',
+    'code', 'json', 'image', 'divider', 'dataframe', 'table',
+    'success', 'info', 'warning', 'error',
+)
+
+# Streamlit module attributes replaced while a recorder is installed
+PATCHED = (
+    *DISPLAY_ELEMENTS, 'columns', 'container', 'empty', 'expander', 'form',
+    'sidebar', 'button', 'form_submit_button', 'toggle', 'text_input',
+    'selectbox', 'number_input',
+    'fragment', 'session_state', 'query_params',
+)
+
+_MISSING = object()
+
+
+class SessionState(dict):
+    """Dictionary with the attribute access of st.session_state."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self[name] = value
+
+
+class Element:
+    """
+    One element emitted into a recording.
+    """
+
+    __slots__ = ('kind', 'path', 'args', 'kwargs', 'size')
+
+    def __init__(self, kind: str, path: Tuple[Any, ...], args: tuple, kwargs: dict, size: int):
+        self.kind = kind
+        self.path = path
+        self.args = args
+        self.kwargs = kwargs
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"Element({self.kind!r}, path={self.path}, size={self.size})"
+
+
+def payload_bytes(values: Iterable[Any]) -> int:
+    """
+    Approximate the bytes an element sends to the browser.
+
+    Args:
+        values (Iterable[Any]): Element arguments
+
+    Returns:
+        int: Encoded size of the text and binary arguments
+    """
+    size = 0
+    for value in values:
+        if isinstance(value, str):
+            size += len(value.encode('utf-8', 'surrogatepass'))
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            size += len(value)
+        elif value is not None and not callable(value) and not isinstance(value, bool):
+            size += len(repr(value))
+    return size
+
+
+def _display(kind: str) -> Callable:
+    """Build the recording method for a display element."""
+    def element(self, *args, **kwargs) -> None:
+        self._recorder._record(self, kind, args, kwargs)
+    element.__name__ = kind
+    return element
+
+
+class RecordingContainer:
+    """
+    Stand-in for a Streamlit container (main area, sidebar, column, ...).
+
+    Elements written to it, directly or inside a `with` block, are recorded
+    with a path of block indices, like Streamlit delta paths.
+    """
+
+    def __init__(self, recorder: 'RecordingStreamlit', path: Tuple[Any, ...]):
+        """
+        Initialize the container.
+
+        Args:
+            recorder (RecordingStreamlit): Recording this container writes to
+            path (Tuple[Any, ...]): Position of the container
+        """
+        self._recorder = recorder
+        self._path = path
+        self._children = 0
+
+    def _next_path(self) -> Tuple[Any, ...]:
+        """Reserve the position of the next child element or block."""
+        path = self._path + (self._children,)
+        self._children += 1
+        return path
+
+    def __enter__(self) -> 'RecordingContainer':
+        self._recorder._stack.append(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._recorder._stack.pop()
+
+    # Layout blocks
+
+    def _block(self, kind: str, args: tuple = (), kwargs: Optional[dict] = None) -> 'RecordingContainer':
+        path = self._next_path()
+        self._recorder._blocks[kind] += 1
+        return RecordingContainer(self._recorder, path)
+
+    def container(self, **kwargs) -> 'RecordingContainer':
+        return self._block('container', kwargs=kwargs)
+
+    def empty(self) -> 'RecordingContainer':
+        return self._block('empty')
+
+    def expander(self, label: str, expanded: bool = False, **kwargs) -> 'RecordingContainer':
+        return self._block('expander', (label,), kwargs)
+
+    def form(self, key: str, **kwargs) -> 'RecordingContainer':
+        return self._block('form', (key,), kwargs)
+
+    def columns(self, spec: Any, gap: str = "small", **kwargs) -> List['RecordingContainer']:
+        count = spec if isinstance(spec, int) else len(spec)
+        row = self._block('columns')
+        return [row._block('column') for _ in range(count)]
+
+    # Widgets
+
+    def _widget_value(self, key: Optional[str], default: Any) -> Any:
+        state = self._recorder.session_state
+        if key is None:
+            return default
+        return state.setdefault(key, default)
+
+    def _click(
+        self,
+        kind: str,
+        label: str,
+        key: Optional[str],
+        on_click: Optional[Callable],
+        args: tuple,
+        kwargs: Optional[dict],
+        options: dict
+    ) -> bool:
+        self._recorder._record(self, kind, (label,), {'key': key, **options})
+        clicked = (key or label) in self._recorder.clicks
+        if clicked and on_click is not None:
+            on_click(*args, **(kwargs or {}))
+        return clicked
+
+    def button(self, label: str, key: Optional[str] = None, on_click: Optional[Callable] = None,
+               args: tuple = (), kwargs: Optional[dict] = None, **options) -> bool:
+        return self._click('button', label, key, on_click, args, kwargs, options)
+
+    def form_submit_button(self, label: str = "Submit", key: Optional[str] = None,
+                           on_click: Optional[Callable] = None, args: tuple = (),
+                           kwargs: Optional[dict] = None, **options) -> bool:
+        return self._click('form_submit_button', label, key, on_click, args, kwargs, options)
+
+    def toggle(self, label: str, value: bool = False, key: Optional[str] = None, **options) -> bool:
+        self._recorder._record(self, 'toggle', (label,), {'key': key, **options})
+        return bool(self._widget_value(key, value))
+
+    def text_input(self, label: str, value: str = "", key: Optional[str] = None, **options) -> str:
+        self._recorder._record(self, 'text_input', (label, value), {'key': key, **options})
+        return self._widget_value(key, value)
+
+    def selectbox(self, label: str, options: Any, index: int = 0, key: Optional[str] = None, **kwargs) -> Any:
+        options = list(options)
+        self._recorder._record(self, 'selectbox', (label, options), {'key': key, **kwargs})
+        return self._widget_value(key, options[index] if options else None)
+
+    def number_input(self, label: str, min_value: Any = None, max_value: Any = None,
+                     value: Any = None, key: Optional[str] = None, **kwargs) -> Any:
+        self._recorder._record(self, 'number_input', (label,), {'key': key, **kwargs})
+        default = value if value is not None else (min_value if min_value is not None else 0)
+        return self._widget_value(key, default)
+
+
+for _kind in DISPLAY_ELEMENTS:
+    setattr(RecordingContainer, _kind, _display(_kind))
+
+
+class RecordingStreamlit(RecordingContainer):
+    """
+    Headless fake of the Streamlit API that records what a script emits.
+
+    install() swaps the fake into the `streamlit` module, so components
+    render into the recording unchanged. Buttons listed in `clicks` (by key,
+    or label for unkeyed buttons) report a click and run their callback.
+
+    Example:
+        with RecordingStreamlit() as recording:
+            Container(items).render()
+        recording.stats()
+    """
+
+    def __init__(self, clicks: Iterable[str] = ()):
+        """
+        Initialize an empty recording.
+
+        Args:
+            clicks (Iterable[str]): Button keys or labels that are clicked
+        """
+        self._stack: List[RecordingContainer] = []
+        self._blocks: Counter = Counter()
+        self.elements: List[Element] = []
+        self.clicks: Set[str] = set(clicks)
+        self.session_state = SessionState()
+        self.query_params: Dict[str, str] = {}
+        super().__init__(self, ('main',))
+        self.sidebar = RecordingContainer(self, ('sidebar',))
+        self._saved: Dict[str, Any] = {}
+
+    def _record(self, container: RecordingContainer, kind: str, args: tuple, kwargs: dict) -> None:
+        """Append an element emitted into a container."""
+        size = payload_bytes(args) + payload_bytes(kwargs.values())
+        self.elements.append(Element(kind, container._next_path(), args, kwargs, size))
+
+    def _current(self) -> RecordingContainer:
+        """Container that module-level st calls write to."""
+        return self._stack[-1] if self._stack else self
+
+    def _dispatch(self, name: str) -> Callable:
+        """Route a module-level st function to the active container."""
+        def call(*args, **kwargs):
+            return getattr(self._current(), name)(*args, **kwargs)
+        call.__name__ = name
+        return call
+
+    @staticmethod
+    def fragment(func: Optional[Callable] = None, *, run_every: Any = None, **options) -> Callable:
+        """Run fragments inline, as on a full script run."""
+        if func is None:
+            return lambda f: f
+        return func
+
+    def rerun(self) -> 'RecordingStreamlit':
+        """
+        Start a new script run, keeping session state and query params.
+
+        Returns:
+            RecordingStreamlit instance
+        """
+        self.elements = []
+        self._blocks = Counter()
+        self._children = 0
+        self.sidebar._children = 0
+        return self
+
+    def install(self) -> None:
+        """Replace the Streamlit API with this recording."""
+        if self._saved:
+            return
+        for name in PATCHED:
+            self._saved[name] = st.__dict__.get(name, _MISSING)
+            if name in ('sidebar', 'session_state', 'query_params'):
+                value = getattr(self, name)
+            elif name == 'fragment':
+                value = self.fragment
+            else:
+                value = self._dispatch(name)
+            setattr(st, name, value)
+
+    def uninstall(self) -> None:
+        """Restore the real Streamlit API."""
+        for name, value in self._saved.items():
+            if value is _MISSING:
+                delattr(st, name)
+            else:
+                setattr(st, name, value)
+        self._saved = {}
+
+    def __enter__(self) -> 'RecordingStreamlit':
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.uninstall()
+
+    def kinds(self) -> Counter:
+        """
+        Count recorded elements by kind.
+
+        Returns:
+            Counter: Elements per kind, e.g. {'markdown': 3, 'button': 2}
+        """
+        return Counter(element.kind for element in self.elements)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Summarize the recording.
+
+        Returns:
+            Dict[str, int]: Elements, layout blocks and payload bytes emitted
+        """
+        return {
+            'elements': len(self.elements),
+            'blocks': sum(self._blocks.values()),
+            'bytes': sum(element.size for element in self.elements),
+        }
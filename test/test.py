@@ -6,11 +6,50 @@ from ..src.components import \
     Text, 
     Layout, 
     Sidebar,
+    Router,
     ImageDisplay,
-    JSONDisplay
+    Gallery,
+    JSONDisplay,
+    CallNode,
+    ComponentNode,
+    FragmentNode,
+    build_once,
+    freeze
 )
+from ..src.components.data_display import (
+    iter_json,
+    load_json_file,
+    records_frame,
+    table_view,
+    serialize,
+    serialize_cached
+)
+from ..src.components.media import ImageStore, ThumbnailCache
+from ..src.components.styles import StyleRegistry, style_registry
+from ..src.components.container import MAX_GRID_COLUMNS, grid_plan
+from ..src.components.optimizer import Markdown, Spacer, optimize
+from ..src.components.profiling import profiler
+from ..src.components.cache import DataCache, cached
+from ..src.components.persistence import DiskStore, prewarm
+from ..src.components.interaction import (
+    Throttle,
+    debounce,
+    interaction_stats,
+    reset_interaction_stats
+)
+from ..src.components.base import (
+    DuplicateKeyError,
+    RenderCache,
+    check_keys,
+    render_cache
+)
+import contextlib
+import math
+import os
 import pytest
 import streamlit as st
+from streamlit.testing.v1 import AppTest
+from .recording import RecordingStreamlit
 
 
 # Mock streamlit functions to avoid runtime errors
@@ -43,6 +82,11 @@ def mock_streamlit(monkeypatch):
     monkeypatch.setattr(st, "sidebar", mock_sidebar)
     monkeypatch.setattr(st, "image", mock_image)
 
+@pytest.fixture
+def real_streamlit(monkeypatch):
+    """Undo the streamlit mocks so scripts can run under AppTest"""
+    monkeypatch.undo()
+
 class TestButton:
     """Test suite for Button component"""
     
@@ -213,6 +257,1175 @@ class TestImageDisplay:
             width=100,
             use_column_width=True
         )
+    
+    def test_callable_source_resolved_once_per_render(self, monkeypatch):
+        """Test a data source callable runs once per render, cached or not"""
+        monkeypatch.setattr(st, "image", lambda image, **kwargs: None)
+        render_cache.clear()
+        calls = []
+        source = lambda: calls.append(1) or "https://example.com/a.png"
+        ImageDisplay(source).render()
+        assert len(calls) == 1
+        ImageDisplay(source, cache=True).render(width=100)
+        assert len(calls) == 2
+
+class TestRenderCache:
+    """Test suite for the render payload cache"""
+    
+    def test_cache_hit_and_miss_counters(self):
+        """Test that identical content and kwargs reuse the payload"""
+        render_cache.clear()
+        Text("Cached", cache=True).render(style={"color": "red"})
+        Text("Cached", cache=True).render(style={"color": "red"})
+        Text("Cached", cache=True).render(style={"color": "blue"})
+        stats = render_cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 2
+    
+    def test_json_cache_keys_on_source_not_data(self, tmp_path, monkeypatch):
+        """Test JSON payloads are keyed by file stat, text hash or a token"""
+        monkeypatch.setattr(st, "code", lambda *args, **kwargs: None)
+        render_cache.clear()
+        path = tmp_path / "data.json"
+        path.write_text('{"rows": [1, 2, 3]}')
+        JSONDisplay(path, cache=True).render()
+        second = JSONDisplay(path, cache=True)
+        second.render()
+        assert render_cache.stats()['hits'] == 1
+        
+        # JSON text is keyed by its hash, even after the text is released
+        JSONDisplay('{"rows": [4]}', cache=True).render()
+        text = JSONDisplay('{"rows": [4]}', cache=True)
+        assert text._content == {"rows": [4]}
+        text.render()
+        stats = render_cache.stats()
+        assert (stats['hits'], stats['misses']) == (2, 2)
+        
+        # Parsed data is never hashed: it needs an explicit token
+        with pytest.raises(ValueError):
+            JSONDisplay({"rows": [1]}, cache=True)
+        JSONDisplay({"rows": [1]}, cache="rows-v1").render()
+        JSONDisplay({"rows": [1]}, cache="rows-v1").render()
+        stats = render_cache.stats()
+        assert (stats['hits'], stats['misses']) == (3, 3)
+    
+    def test_cache_is_opt_in(self):
+        """Test that components without cache=True bypass the cache"""
+        render_cache.clear()
+        Text("Uncached").render(style={"color": "red"})
+        assert render_cache.stats()['misses'] == 0
+    
+    def test_size_based_eviction(self):
+        """Test LRU eviction once the byte budget is exceeded"""
+        cache = RenderCache(max_bytes=10)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'yyyy')
+        cache.get_or_build('a', lambda: 'rebuilt')
+        cache.put('c', 'zzzz')
+        assert cache.stats()['bytes'] <= 10
+        assert cache.get_or_build('a', lambda: 'rebuilt') == 'xxxx'
+        assert cache.get_or_build('b', lambda: 'rebuilt') == 'rebuilt'
+
+class TestComponentKeys:
+    """Test suite for path-based component keys"""
+    
+    def test_keys_follow_tree_position(self):
+        """Test that unkeyed children derive keys from their position"""
+        outer = Container(key="page")
+        inner = Container()
+        outer.add(Text("First"))
+        outer.add(inner)
+        inner.add(Button("Click"))
+        assert outer._content[0].key == "page/0"
+        assert inner.key == "page/1"
+        assert inner._content[0].key == "page/1/0"
+    
+    def test_keys_stable_across_rebuilds(self):
+        """Test that rebuilding the same tree yields the same keys"""
+        def build():
+            container = Container(key="page")
+            container.add(Text("Hello"))
+            return container
+        assert build()._content[0].key == build()._content[0].key
+    
+    def test_duplicate_sibling_keys_rejected(self):
+        """Test duplicate explicit keys are detected at build time"""
+        container = Container()
+        container.add(Text("A", key="same"))
+        with pytest.raises(DuplicateKeyError):
+            container.add(Text("B", key="same"))
+    
+    def test_check_keys_across_levels(self):
+        """Test tree-wide duplicate detection"""
+        outer = Container(key="page")
+        inner = Container()
+        outer.add(inner)
+        outer.add(Text("Clash", key="page/0/0"))
+        inner.add(Text("Derived"))
+        with pytest.raises(DuplicateKeyError):
+            check_keys(outer)
+    
+    def test_unkeyed_roots_get_distinct_keys(self, real_streamlit):
+        """Test two unkeyed roots of one class render without key clashes"""
+        def script(Container, Button):
+            Container([Button("First")]).render()
+            Container([Button("Second")]).render()
+        
+        app = AppTest.from_function(
+            script, kwargs={'Container': Container, 'Button': Button}
+        ).run()
+        assert not app.exception
+        assert [b.key for b in app.button] == ["container/0", "container-1/0"]
+        # Reruns hand out the same keys again
+        app.run()
+        assert [b.key for b in app.button] == ["container/0", "container-1/0"]
+
+class TestFrozenTree:
+    """Test suite for build-once frozen component trees"""
+    
+    def test_build_once_shares_tree(self):
+        """Test that the builder runs once and the tree is shared"""
+        calls = []
+        
+        @build_once
+        def page():
+            calls.append(1)
+            return [ComponentNode(Text("Static"))]
+        
+        assert page() is page()
+        assert len(calls) == 1
+    
+    def test_nodes_are_immutable(self):
+        """Test that frozen nodes reject mutation"""
+        node = ComponentNode(Text("Static"), style={"color": "red"})
+        with pytest.raises(AttributeError):
+            node.component = None
+        with pytest.raises(TypeError):
+            node.kwargs['style']['color'] = "blue"
+    
+    def test_freeze_keys_and_renders(self):
+        """Test root keys, sealed containers and rendering"""
+        rendered = []
+        container = Container()
+        container.add(Text("Inside"))
+        tree = freeze([
+            ComponentNode(container),
+            CallNode(rendered.append, "called")
+        ], key="page")
+        assert tree.keys == ("page/0/0", "page/0/0/0")
+        with pytest.raises(AttributeError):
+            container.add(Text("Late"))
+        tree.render()
+        assert rendered == ["called"]
+    
+    def test_freeze_rejects_repeated_component(self):
+        """Test one component instance cannot be placed twice"""
+        text = Text("Twice")
+        with pytest.raises(DuplicateKeyError):
+            freeze([ComponentNode(text), ComponentNode(text)])
+        container = Container([Text("Child")])
+        with pytest.raises(DuplicateKeyError):
+            freeze([ComponentNode(container), ComponentNode(container.children()[0])])
+    
+    def test_layout_does_not_mutate_shared_content(self, working_columns):
+        """Test repeated with_columns calls leave shared content unchanged"""
+        container = Container([Text("Shared"), Text("Other")], key="shared")
+        freeze([ComponentNode(container)])
+        sealed = container._content
+        assert isinstance(sealed, tuple)
+        item = sealed[0]
+        content = [container, item]
+        layout = Layout(key="grid")
+        for _ in range(3):
+            layout.columns(2)
+            layout.with_columns(content)
+        assert len(content) == 2
+        assert content[0] is container and content[1] is item
+        assert container._content is sealed
+        assert [child._content for child in sealed] == ["Shared", "Other"]
+        assert item._parent is container
+        assert item.key == "shared/0"
+
+class _CountingItem:
+    """Renderable stub that records render calls"""
+    
+    def __init__(self, log, value):
+        self._log = log
+        self._value = value
+    
+    def render(self):
+        self._log.append(self._value)
+
+@pytest.fixture
+def working_columns(monkeypatch):
+    """Columns that can be entered as context managers"""
+    def columns(spec, *args, **kwargs):
+        count = spec if isinstance(spec, int) else len(spec)
+        return [contextlib.nullcontext() for _ in range(count)]
+    monkeypatch.setattr(st, "columns", columns)
+    monkeypatch.setattr(st, "caption", lambda *args, **kwargs: None)
+
+class TestVirtualContainer:
+    """Test suite for paginated Container rendering"""
+    
+    def test_renders_only_current_page(self, working_columns):
+        """Test that only one page of items is rendered"""
+        log = []
+        container = Container(key="virtual")
+        for i in range(120):
+            container.add(_CountingItem(log, i))
+        container.render(layout='virtual', page_size=50)
+        assert log == list(range(50))
+    
+    def test_cursor_from_session_state(self, working_columns):
+        """Test that the page cursor persists in session state"""
+        log = []
+        container = Container(key="paged")
+        for i in range(120):
+            container.add(_CountingItem(log, i))
+        st.session_state["paged/page"] = 2
+        container.render(page_size=50)
+        assert log == list(range(100, 120))
+    
+    def test_page_size_with_columns_layout(self, working_columns):
+        """Test paging combined with an existing layout"""
+        log = []
+        container = Container(key="grid")
+        for i in range(10):
+            container.add(_CountingItem(log, i))
+        st.session_state["grid/page"] = 0
+        container.render(layout='columns', columns=2, page_size=4)
+        assert sorted(log) == [0, 1, 2, 3]
+    
+    def test_unkeyed_pagers_are_independent(self, real_streamlit):
+        """Test two unkeyed paged containers keep separate controls and cursors"""
+        def script(Container):
+            for label in ("a", "b"):
+                Container([f"{label}{i}" for i in range(4)]).render(page_size=2)
+        
+        app = AppTest.from_function(script, kwargs={'Container': Container}).run()
+        assert not app.exception
+        app.button(key="container/page/next").click().run()
+        assert not app.exception
+        assert app.session_state["container/page"] == 1
+        assert app.session_state["container-1/page"] == 0
+
+class TestGridLayout:
+    """Test suite for the Container grid engine"""
+    
+    def test_grid_plan_rows(self):
+        """Test row-major row plans and their caching"""
+        assert grid_plan(7, 3) == ((0, 3), (3, 6), (6, 7))
+        assert grid_plan(7, 3) is grid_plan(7, 3)
+    
+    def test_columns_layout_is_row_major(self, working_columns, monkeypatch):
+        """Test items render in order, one st.columns call per row"""
+        calls = []
+        columns = st.columns
+        monkeypatch.setattr(st, "columns", lambda spec, *a, **k: calls.append(spec) or columns(spec))
+        log = []
+        container = Container()
+        for i in range(7):
+            container.add(_CountingItem(log, i))
+        container.render(layout='columns', columns=3)
+        assert log == list(range(7))
+        assert calls == [3, 3, 3]
+    
+    def test_horizontal_wraps(self, working_columns, monkeypatch):
+        """Test horizontal layout wraps past the maximum column count"""
+        calls = []
+        columns = st.columns
+        monkeypatch.setattr(st, "columns", lambda spec, *a, **k: calls.append(spec) or columns(spec))
+        container = Container([Text(str(i)) for i in range(MAX_GRID_COLUMNS + 1)])
+        container.render(layout='horizontal')
+        assert calls == [MAX_GRID_COLUMNS, MAX_GRID_COLUMNS]
+
+class TestParallelColumns:
+    """Test suite for two-phase Layout.with_columns"""
+    
+    def test_prepare_runs_concurrently(self, working_columns):
+        """Test prepare callables overlap and feed their render step"""
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def load(value):
+            def prepare():
+                barrier.wait()
+                return value
+            return prepare
+        
+        rendered = []
+        layout = Layout()
+        layout.columns(3)
+        layout.with_columns(
+            [rendered.append, rendered.append, rendered.append],
+            prepare=[load(1), load(2), load(3)]
+        )
+        assert rendered == [1, 2, 3]
+    
+    def test_async_prepare(self, working_columns):
+        """Test coroutine prepare callables"""
+        async def fetch():
+            return "async"
+        
+        rendered = []
+        layout = Layout()
+        layout.columns(2)
+        layout.with_columns(
+            [rendered.append, lambda: rendered.append("plain")],
+            prepare=[fetch, None]
+        )
+        assert rendered == ["async", "plain"]
+
+class TestRouter:
+    """Test suite for the lazy page Router"""
+    
+    @pytest.fixture
+    def pages(self, tmp_path, monkeypatch):
+        """Two page modules on sys.path, recording when they render"""
+        import sys
+        for name in ("lazy_page_home", "lazy_page_reports"):
+            (tmp_path / f"{name}.py").write_text(
+                f"RENDERED = []\ndef render():\n    RENDERED.append('{name}')\n    return '{name}'\n"
+            )
+            sys.modules.pop(name, None)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(st, "sidebar", contextlib.nullcontext())
+        monkeypatch.setattr(st, "button", lambda *args, **kwargs: False)
+        for key in ("router", "page"):
+            st.session_state.pop(key, None)
+        yield
+        st.query_params.clear()
+    
+    def test_imports_only_active_page(self, pages):
+        """Test the default page renders and other pages stay unimported"""
+        import sys
+        router = Router()
+        router.add_page("Home", "lazy_page_home")
+        router.add_page("Reports", "lazy_page_reports:render")
+        assert router.render() == "lazy_page_home"
+        assert "lazy_page_reports" not in sys.modules
+    
+    def test_selection_persists(self, pages, monkeypatch):
+        """Test selecting a page stores it in session state and query params"""
+        monkeypatch.setattr(st, "button", lambda label, key=None, **kwargs: label == "Reports")
+        router = Router()
+        router.add_page("Home", "lazy_page_home")
+        router.add_page("Reports", "lazy_page_reports")
+        assert router.render() == "lazy_page_reports"
+        assert st.session_state["router"] == "Reports"
+        assert st.query_params["page"] == "Reports"
+        
+        monkeypatch.setattr(st, "button", lambda *args, **kwargs: False)
+        rerun = Router()
+        rerun.add_page("Home", "lazy_page_home")
+        rerun.add_page("Reports", "lazy_page_reports")
+        assert rerun.active == "Reports"
+
+class TestLazyImports:
+    """Test suite for lazy package imports"""
+    
+    def _imported_after(self, statement):
+        import subprocess
+        import sys
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            sys.modules[Button.__module__].__file__
+        )))
+        result = subprocess.run(
+            [sys.executable, "-c", f"{statement}; import sys; print(sorted(sys.modules))"],
+            cwd=root, capture_output=True, text=True, check=True
+        )
+        return result.stdout
+    
+    def test_package_import_is_lazy(self):
+        """Test that importing the package loads no component module"""
+        modules = self._imported_after("import src.components")
+        assert "src.components.text" not in modules
+        assert "'streamlit'" not in modules
+    
+    def test_single_component_import(self):
+        """Test that one component only loads its own module"""
+        modules = self._imported_after("from src.components import Text")
+        assert "src.components.text" in modules
+        assert "src.components.image" not in modules
+    
+    def test_json_display_import_skips_pandas(self):
+        """Test that pandas is only imported once table mode needs it"""
+        modules = self._imported_after("from src.components import JSONDisplay")
+        assert "src.components.data_display" in modules
+        assert "'pandas'" not in modules
+    
+    def test_dir_lists_lazy_names(self):
+        """Test that lazy names stay visible to introspection"""
+        import sys
+        components = sys.modules[Button.__module__.rpartition('.')[0]]
+        assert set(components.__all__) <= set(dir(components))
+
+class TestStyleRegistry:
+    """Test suite for the CSS class registry"""
+    
+    def test_styles_are_interned(self):
+        """Test equal style dicts share one class"""
+        registry = StyleRegistry()
+        first = registry.class_name({"color": "red", "padding": "4px"})
+        second = registry.class_name({"padding": "4px", "color": "red"})
+        assert first == second
+        assert len(registry) == 1
+    
+    def test_page_emits_single_style_block(self, monkeypatch):
+        """Test components reference classes and the page emits one <style>"""
+        emitted = []
+        monkeypatch.setattr(st, "markdown", lambda body, **kwargs: emitted.append(body))
+        with style_registry.page():
+            for i in range(3):
+                Text(f"Item {i}").render(style={"color": "red"})
+        assert len(emitted) == 4
+        assert 'class="sc-' in emitted[0]
+        assert emitted[-1].count("<style>") == 1
+        assert emitted[-1].count(".sc-") == 1
+    
+    def test_inline_outside_page(self, monkeypatch):
+        """Test inline styles are used outside a page block"""
+        emitted = []
+        monkeypatch.setattr(st, "markdown", lambda body, **kwargs: emitted.append(body))
+        Text("Plain").render(style={"color": "red"})
+        assert emitted == ['<span style="color: red">Plain</span>']
+
+class TestJSONSources:
+    """Test suite for lazily parsed JSONDisplay sources"""
+    
+    def test_parsing_is_deferred(self):
+        """Test JSON text is not parsed until the data is needed"""
+        display = JSONDisplay('{"key": "value"}')
+        assert display._source == '{"key": "value"}'
+        assert display._content == {"key": "value"}
+        assert display._source is None
+    
+    def test_concurrent_first_access_parses_once(self):
+        """Test threads sharing a display all see data parsed from one read"""
+        import threading
+        import time
+        reads = []
+        
+        class SlowBuffer:
+            def read(self):
+                reads.append(1)
+                time.sleep(0.05)
+                return b'{"rows": [1, 2]}'
+        
+        display = JSONDisplay(SlowBuffer())
+        seen = []
+        threads = [
+            threading.Thread(target=lambda: seen.append(display._content))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(reads) == 1
+        assert seen == [{"rows": [1, 2]}] * 8
+    
+    def test_path_source_cached_by_mtime(self, tmp_path):
+        """Test file sources are parsed once per path and mtime"""
+        path = tmp_path / "data.json"
+        path.write_text('{"version": 1}')
+        first = JSONDisplay(path)._content
+        assert first == {"version": 1}
+        assert JSONDisplay(path)._content is first
+        
+        path.write_text('{"version": 2, "extra": true}')
+        os.utime(path, ns=(0, 10 ** 9))
+        assert load_json_file(path) == {"version": 2, "extra": True}
+    
+    def test_text_parses_like_json_loads(self, tmp_path):
+        """Test NaN and big integers survive text and file sources"""
+        text = '{"nan": NaN, "big": 123456789012345678901234567890}'
+        data = JSONDisplay(text)._content
+        assert data["big"] == 123456789012345678901234567890
+        assert math.isnan(data["nan"])
+        # orjson rejects NaN, so file sources fall back to json.loads
+        path = tmp_path / "nan.json"
+        path.write_text('{"nan": NaN}')
+        assert math.isnan(load_json_file(path)["nan"])
+    
+    def test_buffer_source(self):
+        """Test readable buffers are accepted"""
+        import io
+        assert JSONDisplay(io.BytesIO(b'[1, 2]'))._content == [1, 2]
+
+class TestJSONTable:
+    """Test suite for JSONDisplay table mode"""
+    
+    RECORDS = [
+        {"id": i, "name": f"user{i}", "meta": {"team": "red" if i % 2 else "blue"}}
+        for i in range(120)
+    ]
+    
+    def test_records_flattened_and_memoized(self):
+        """Test nested records become columns and the frame is reused"""
+        frame = records_frame(self.RECORDS)
+        assert list(frame.columns) == ["id", "name", "meta.team"]
+        assert records_frame(self.RECORDS) is frame
+    
+    def test_frame_memo_counts_pinned_records(self):
+        """Test frame entries are sized by the records they keep alive"""
+        import sys
+        memo = sys.modules[records_frame.__module__]._frames
+        memo.clear()
+        records = [{"id": i, "name": "x" * 200} for i in range(100)]
+        frame = records_frame(records)
+        assert memo.stats()['bytes'] > frame.memory_usage(index=True).sum() + 100 * 200
+    
+    def test_filter_and_sort(self):
+        """Test server-side filtering and sorting"""
+        view = table_view(self.RECORDS, query="user1", sort_by="id", descending=True)
+        assert view["id"].iloc[0] == 119
+        assert all("user1" in name for name in view["name"])
+    
+    def test_renders_single_page(self, monkeypatch):
+        """Test only the visible page is handed to Streamlit"""
+        shown = []
+        monkeypatch.setattr(st, "text_input", lambda *a, **k: "")
+        monkeypatch.setattr(st, "selectbox", lambda *a, **k: None)
+        monkeypatch.setattr(st, "toggle", lambda *a, **k: False)
+        monkeypatch.setattr(st, "number_input", lambda *a, **k: 3)
+        monkeypatch.setattr(st, "caption", lambda *a, **k: None)
+        monkeypatch.setattr(st, "dataframe", lambda frame, **k: shown.append(frame))
+        JSONDisplay(self.RECORDS, key="records").render(table=True, page_size=50)
+        assert list(shown[0]["id"]) == list(range(100, 120))
+
+class TestLargeJSON:
+    """Test suite for size-aware JSONDisplay rendering"""
+    
+    DATA = {"users": [{"id": i, "tags": ["a", "b"]} for i in range(50)], "count": 50}
+    
+    def test_incremental_matches_json_dumps(self):
+        """Test the chunked serializer produces standard output"""
+        import json
+        assert "".join(iter_json(self.DATA)) == json.dumps(self.DATA, indent=2)
+    
+    def test_budgets_truncate(self):
+        """Test node and byte budgets stop serialization with markers"""
+        by_nodes = serialize(self.DATA, max_nodes=5)
+        assert "more items truncated" in by_nodes
+        by_bytes = serialize(self.DATA, max_bytes=100)
+        assert by_bytes.endswith("... truncated at 100 bytes ...")
+        assert len(by_bytes) < 150
+    
+    def test_memoized_by_identity(self):
+        """Test repeated serialization of the same object is reused"""
+        assert serialize_cached(self.DATA, max_nodes=10) is serialize_cached(self.DATA, max_nodes=10)
+    
+    def test_memo_budget_counts_pinned_data(self):
+        """Test memo entries are sized by the data they keep alive"""
+        import sys
+        memo = sys.modules[serialize_cached.__module__]._serialized
+        memo.clear()
+        data = {"rows": list(range(10000))}
+        text = serialize_cached(data, max_bytes=100)
+        assert memo.stats()['bytes'] > len(text) + sys.getsizeof(data["rows"])
+    
+    def test_collapsible_serializes_expanded_only(self, monkeypatch):
+        """Test collapsed subtrees are never serialized"""
+        emitted = []
+        monkeypatch.setattr(st, "code", lambda body, **kwargs: emitted.append(body))
+        monkeypatch.setattr(st, "toggle", lambda label, value=False, key=None: value)
+        JSONDisplay(self.DATA, key="payload").render(collapsible=True)
+        assert len(emitted) == 1
+        JSONDisplay(self.DATA, key="payload", expanded=True).render(collapsible=True)
+        assert len(emitted) == 3
+
+class TestThumbnails:
+    """Test suite for the ImageDisplay resize pipeline"""
+    
+    @pytest.fixture
+    def photo(self, tmp_path):
+        """A 400x200 PNG on disk"""
+        from PIL import Image
+        path = tmp_path / "photo.png"
+        Image.new("RGB", (400, 200), "red").save(path)
+        return str(path)
+    
+    def test_downscales_to_width_and_dpr(self, photo, tmp_path):
+        """Test output width is the display width times the pixel ratio"""
+        import io
+        from PIL import Image
+        cache = ThumbnailCache(str(tmp_path / "thumbs"))
+        data = cache.thumbnail(photo, width=50, dpr=2)
+        assert Image.open(io.BytesIO(data)).size == (100, 50)
+        assert cache.thumbnail(photo, width=50, dpr=2) == data
+        assert len(os.listdir(cache.directory)) == 1
+    
+    def test_no_upscaling(self, photo, tmp_path):
+        """Test images narrower than the target are sent unchanged"""
+        cache = ThumbnailCache(str(tmp_path / "thumbs"))
+        with open(photo, "rb") as f:
+            original = f.read()
+        assert cache.thumbnail(photo, width=400, dpr=2) == original
+    
+    def test_evicts_by_total_size(self, photo, tmp_path):
+        """Test least recently used thumbnails are evicted over budget"""
+        sizing = ThumbnailCache(str(tmp_path / "sizing"))
+        small = len(sizing.thumbnail(photo, width=10))
+        large = len(sizing.thumbnail(photo, width=20))
+        
+        cache = ThumbnailCache(str(tmp_path / "thumbs"), max_bytes=small + large - 1)
+        cache.thumbnail(photo, width=10)
+        for name in os.listdir(cache.directory):
+            os.utime(os.path.join(cache.directory, name), ns=(0, 0))
+        cache.thumbnail(photo, width=20)
+        assert cache.size() == large
+    def test_image_display_sends_resized(self, photo, monkeypatch):
+        """Test ImageDisplay hands the resized bytes to st.image"""
+        from ..src.components import media
+        sent = []
+        monkeypatch.setattr(media, "thumbnail_cache", ThumbnailCache(os.path.dirname(photo) + "/thumbs"))
+        monkeypatch.setattr(st, "image", lambda image, **kwargs: sent.append(image))
+        ImageDisplay(photo).render(width=100, dpr=1)
+        import io
+        from PIL import Image
+        assert Image.open(io.BytesIO(sent[0])).width == 100
+
+class TestImageStore:
+    """Test suite for the content-addressed image store and Gallery"""
+    
+    def test_identical_bytes_deduplicated(self, tmp_path):
+        """Test identical images share one bytes object"""
+        store = ImageStore()
+        for name in ("a.png", "b.png"):
+            (tmp_path / name).write_bytes(b"same-image-bytes")
+        first, second, third = store.load_many([
+            str(tmp_path / "a.png"), str(tmp_path / "b.png"), b"same-image-bytes"
+        ])
+        assert first is second is third
+        assert store.stats()['entries'] == 1
+    
+    def test_gallery_renders_grid(self, tmp_path, working_columns, monkeypatch):
+        """Test Gallery loads every tile and emits one image per tile"""
+        from PIL import Image
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"img{i}.png"
+            Image.new("RGB", (300, 300), (i * 40, 0, 0)).save(path)
+            paths.append(str(path))
+        sent = []
+        monkeypatch.setattr(st, "image", lambda image, **kwargs: sent.append(kwargs.get("caption")))
+        gallery = Gallery(paths, key="photos", columns=2)
+        gallery.render(captions=[f"#{i}" for i in range(5)])
+        assert sent == ["#0", "#1", "#2", "#3", "#4"]
+        assert gallery.children()[4].key == "photos/4"
+
+class TestOptimizer:
+    """Test suite for the render-pass optimizer"""
+    
+    def test_merges_adjacent_elements(self):
+        """Test headers/markdown, texts and spacers coalesce in order"""
+        log = []
+        marker = _CountingItem(log, 0)
+        items, saved = optimize([
+            Header("Title"), "Intro", "", "", Spacer(2),
+            Text("a"), Text("b"), marker, Spacer(0)
+        ])
+        assert saved == 5
+        assert [type(item) for item in items] == [Markdown, Spacer, Text, _CountingItem]
+        assert items[0].body == "## Title\n\nIntro"
+        assert items[1].height == 4
+        assert items[2]._content == "a\nb"
+        assert items[3] is marker
+    
+    def test_merges_non_string_text(self):
+        """Test Text runs with non-string content merge by their str()"""
+        items, saved = optimize([Text(1), Text(2.5), Text(None)])
+        assert saved == 2
+        assert items[0]._content == "1\n2.5\nNone"
+    
+    def test_container_emits_fewer_elements(self, monkeypatch):
+        """Test an optimized vertical container sends one markdown element"""
+        sent = []
+        monkeypatch.setattr(st, "markdown", lambda body, **kwargs: sent.append(body))
+        Container([Header("A"), "b", "c"]).render(optimize=True)
+        assert sent == ["## A\n\nb\n\nc"]
+    
+    def test_spacer_and_empty_columns(self, working_columns, monkeypatch):
+        """Test spacer emits one element and None columns are not entered"""
+        sent = []
+        monkeypatch.setattr(st, "markdown", lambda body, **kwargs: sent.append(body))
+        monkeypatch.setattr(st, "write", lambda *args, **kwargs: sent.append(args))
+        layout = Layout()
+        layout.spacer(3)
+        assert len(sent) == 1
+        entered = []
+        layout.columns(3)
+        layout.with_columns([None, lambda: entered.append("middle"), None])
+        assert entered == ["middle"]
+
+class TestFragments:
+    """Test suite for fragment-scoped sections"""
+    
+    @pytest.fixture
+    def fragments(self, monkeypatch):
+        """Record st.fragment calls and run the fragment body immediately"""
+        calls = []
+        
+        def fake_fragment(func, run_every=None):
+            def wrap(*args, **kwargs):
+                calls.append({'run_every': run_every, 'rerun': lambda: func(*args, **kwargs)})
+                return func(*args, **kwargs)
+            return wrap
+        
+        monkeypatch.setattr(st, "fragment", fake_fragment)
+        return calls
+    
+    def test_container_fragment_rerenders_current_content(self, fragments):
+        """Test a fragment container reruns against its current items"""
+        log = []
+        container = Container([_CountingItem(log, 0)])
+        container.render(run_every=5)
+        assert log == [0]
+        assert fragments[0]['run_every'] == 5
+        container.add(_CountingItem(log, 1))
+        fragments[0]['rerun']()
+        assert log == [0, 0, 1]
+    
+    def test_layout_and_tree_fragments(self, fragments):
+        """Test Layout.fragment and FragmentNode render through st.fragment"""
+        log = []
+        Layout().fragment(_CountingItem(log, "component"))
+        Layout().fragment(lambda: log.append("callable"), run_every="10s")
+        freeze([FragmentNode([ComponentNode(_CountingItem(log, "node"))])]).render()
+        assert log == ["component", "callable", "node"]
+        assert [call['run_every'] for call in fragments] == [None, "10s", None]
+
+class TestLiveView:
+    """Test suite for placeholder-based incremental container updates"""
+    
+    @pytest.fixture
+    def slots(self, monkeypatch):
+        """Placeholders that record what is drawn into them"""
+        drawn = []
+        
+        class Slot:
+            def container(self):
+                return contextlib.nullcontext()
+            
+            def empty(self):
+                drawn.append("cleared")
+        
+        class Outer:
+            def empty(self):
+                return Slot()
+            
+            def columns(self, count):
+                return [Outer() for _ in range(count)]
+        
+        monkeypatch.setattr(st, "container", Outer)
+        monkeypatch.setattr(st, "text", lambda body, **kwargs: drawn.append(body))
+        monkeypatch.setattr(st, "session_state", {})
+        return drawn
+    
+    def test_update_redraws_changed_items_only(self, slots):
+        """Test one changed cell out of many is the only redraw"""
+        container = Container([Text(str(i)) for i in range(400)], key="metrics")
+        view = container.live(columns=20)
+        assert len(slots) == 400
+        slots.clear()
+        
+        container.children()[123]._content = "changed"
+        assert view.update() == 1
+        assert slots == ["changed"]
+        assert view.update() == 0
+        assert view._previous[123][0] == "metrics/123"
+        assert st.session_state == {}
+    
+    def test_items_added_and_removed(self, slots):
+        """Test appended items are drawn and removed items are cleared"""
+        container = Container([Text("a"), Text("b")], key="feed")
+        view = container.live()
+        slots.clear()
+        container.add(Text("c"))
+        assert view.update() == 1
+        assert slots == ["c"]
+        slots.clear()
+        container._content.pop(0)
+        view.update()
+        assert slots == ["b", "c", "cleared"]
+
+class TestProfiler:
+    """Test suite for the render profiler"""
+    
+    @pytest.fixture
+    def profiling(self):
+        """Enable the process-wide profiler for one test"""
+        profiler.reset()
+        profiler.enable()
+        yield profiler
+        profiler.disable()
+        profiler.reset()
+        profiler.take_run()
+    
+    def test_disabled_records_nothing(self):
+        """Test instrumented renders are not recorded while disabled"""
+        profiler.reset()
+        Container([Text("a")]).render()
+        assert profiler.snapshot() == []
+    
+    def test_unkeyed_root_is_not_assigned_a_key(self, profiling):
+        """Test profiling reads known keys without calling root_key"""
+        text = Text("a")
+        text.render()
+        assert text._root_key is None
+        assert [row['key'] for row in profiling.snapshot()] == ['']
+    
+    def test_records_time_elements_and_bytes(self, profiling):
+        """Test per-component rows with exclusive elements and payload bytes"""
+        container = Container([Header("A"), Button("Go"), "**plain**"], key="page")
+        container.render()
+        container.render()
+        rows = {(row['component'], row['key']): row for row in profiling.snapshot()}
+        assert rows[('Container', 'page')]['calls'] == 2
+        assert rows[('Header', 'page/0')]['calls'] == 2
+        assert rows[('Button', 'page/1')]['calls'] == 2
+        # st.write of the plain string is the container's own element
+        assert rows[('Container', 'page')]['elements'] == 2
+        assert rows[('Container', 'page')]['bytes'] > 0
+        assert rows[('Container', 'page')]['seconds'] >= rows[('Container', 'page')]['self_seconds']
+        assert len(profiling.take_run()) == 3
+        assert profiling.take_run() == []
+    
+    def test_prometheus_export(self, profiling, working_columns):
+        """Test Prometheus text contains one sample per row and field"""
+        layout = Layout(key='grid')
+        layout.columns(2)
+        layout.with_columns([lambda: None, lambda: None])
+        text = profiling.to_prometheus()
+        assert '# TYPE sc_render_calls_total counter' in text
+        assert 'sc_render_calls_total{component="Layout.with_columns",key="grid"} 1' in text
+
+class TestRecordingStreamlit:
+    """Test suite for the recording Streamlit fake"""
+    
+    def test_records_elements_blocks_and_bytes(self):
+        """Test a grid render is recorded element by element"""
+        with RecordingStreamlit() as recording:
+            Container([Text("ab"), Text("cd"), Text("ef")], key="grid").render(
+                layout='columns', columns=2
+            )
+        assert recording.kinds() == {'text': 3}
+        assert recording.stats() == {'elements': 3, 'blocks': 6, 'bytes': 6}
+        assert [element.path for element in recording.elements] == [
+            ('main', 0, 0, 0), ('main', 0, 1, 0), ('main', 1, 0, 0)
+        ]
+        # The real API is restored on exit
+        assert not isinstance(st.session_state, dict)
+    
+    def test_clicks_run_callbacks_and_rerun_resets(self):
+        """Test scripted clicks, sidebar routing and rerun bookkeeping"""
+        clicked = []
+        sidebar = Sidebar()
+        sidebar.add_section("Home", action=lambda: clicked.append("home"))
+        with RecordingStreamlit(clicks={"sidebar/0"}) as recording:
+            sidebar.render()
+            assert clicked == ["home"]
+            assert recording.elements[0].path == ('sidebar', 0)
+            recording.session_state["seen"] = True
+            recording.rerun()
+            assert recording.elements == []
+            assert st.session_state.seen is True
+
+class TestBackgroundActions:
+    """Test suite for background Button and Sidebar actions"""
+    
+    def test_button_action_runs_once_off_thread(self):
+        """Test a slow action is submitted once and its result picked up later"""
+        import threading
+        release = threading.Event()
+        threads = []
+        
+        def export():
+            threads.append(threading.current_thread())
+            release.wait(5)
+            return "export.csv"
+        
+        button = Button("Export", action=export, key="export", background=True)
+        with RecordingStreamlit(clicks={"export"}) as recording:
+            button.render()
+            # A second click while running is deduplicated
+            recording.rerun()
+            button.render()
+            assert recording.kinds()['caption'] == 1
+            assert button.result is None
+            
+            release.set()
+            st.session_state["export/task"].result(timeout=5)
+            recording.clicks.clear()
+            recording.rerun()
+            button.render()
+            assert 'caption' not in recording.kinds()
+            assert button.result.value == "export.csv"
+        assert len(threads) == 1 and threads[0] is not threading.current_thread()
+    
+    def test_sidebar_action_error_is_shown(self):
+        """Test a failing background sidebar action reports its error"""
+        def fail():
+            raise RuntimeError("boom")
+        
+        sidebar = Sidebar()
+        sidebar.add_section("Rebuild", action=fail, background=True)
+        with RecordingStreamlit(clicks={"sidebar/0"}) as recording:
+            sidebar.render()
+            st.session_state["sidebar/0/task"].exception(timeout=5)
+            recording.clicks.clear()
+            recording.rerun()
+            sidebar.render()
+            errors = [e.args[0] for e in recording.elements if e.kind == 'error']
+        assert errors == ["Rebuild failed: boom"]
+
+class TestInteractionThrottling:
+    """Test suite for click throttling, debouncing and form batching"""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable monotonic clock"""
+        import time
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        reset_interaction_stats()
+        yield now
+        reset_interaction_stats()
+    
+    def test_throttle_suppresses_rapid_clicks(self, clock):
+        """Test only the first click per window runs the action"""
+        calls = []
+        button = Button("Save", action=lambda: calls.append(1), key="save",
+                        throttle=Throttle(interval=1.0))
+        with RecordingStreamlit(clicks={"save"}) as recording:
+            results = []
+            for step in (0.0, 0.3, 0.6, 1.2):
+                clock[0] = 100.0 + step
+                recording.rerun()
+                results.append(button.render())
+        assert results == [True, False, False, True]
+        assert calls == [1, 1]
+        assert interaction_stats()["save"] == {'allowed': 2, 'suppressed': 2}
+    
+    def test_debounce_fires_once_after_quiet_period(self, clock):
+        """Test a burst of sidebar clicks runs the action once, afterwards"""
+        calls = []
+        sidebar = Sidebar()
+        sidebar.add_section("Refresh", action=lambda: calls.append(1), throttle=debounce(0.5))
+        with RecordingStreamlit(clicks={"sidebar/0"}) as recording:
+            for step in (0.0, 0.2, 0.4):
+                clock[0] = 100.0 + step
+                recording.rerun()
+                sidebar.render()
+            assert calls == []
+            recording.clicks.clear()
+            clock[0] = 101.0
+            recording.rerun()
+            sidebar.render()
+        assert calls == [1]
+        assert interaction_stats()['total'] == {'allowed': 1, 'suppressed': 2}
+    
+    def test_container_form_batches_inputs(self):
+        """Test form mode wraps the items in one form with a submit button"""
+        submitted = []
+        container = Container([
+            lambda: st.text_input("Name", key="name"),
+            lambda: st.text_input("Email", key="email")
+        ], key="signup")
+        with RecordingStreamlit(clicks={"Join"}) as recording:
+            container.render(form=True, submit_label="Join", on_submit=lambda: submitted.append(1))
+        assert [e.kind for e in recording.elements] == ['text_input', 'text_input', 'form_submit_button']
+        assert all(e.path[:2] == ('main', 0) for e in recording.elements)
+        assert submitted == [1]
+        with pytest.raises(ValueError):
+            container.render(form=True, page_size=1)
+    
+    def test_fragment_container_keeps_form(self):
+        """Test form mode survives rendering the container as a fragment"""
+        submitted = []
+        container = Container([lambda: st.text_input("Name", key="name")], key="signup")
+        with RecordingStreamlit(clicks={"Join"}) as recording:
+            container.render(
+                fragment=True, form=True, submit_label="Join",
+                on_submit=lambda: submitted.append(1)
+            )
+        assert recording.stats()['blocks'] == 1
+        assert [e.kind for e in recording.elements] == ['text_input', 'form_submit_button']
+        assert all(e.path[:2] == ('main', 0) for e in recording.elements)
+        assert submitted == [1]
+
+class TestDataCache:
+    """Test suite for the shared data cache"""
+    
+    def test_ttl_expires_entries(self, monkeypatch):
+        """Test entries are reloaded once their TTL has passed"""
+        import time
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache = DataCache(ttl=10)
+        loads = []
+        load = lambda: loads.append(1) or len(loads)
+        assert cache.get_or_load("k", load) == 1
+        now[0] = 105.0
+        assert cache.get_or_load("k", load) == 1
+        now[0] = 111.0
+        assert cache.get_or_load("k", load) == 2
+        assert cache.stats()['expired'] == 1
+    
+    def test_lru_eviction_within_budget(self):
+        """Test the least recently used entries go once over budget"""
+        cache = DataCache(max_bytes=3000)
+        for name in ("a", "b", "c"):
+            cache.put(name, "x" * 900)
+        cache.get("a")
+        cache.put("d", "x" * 900)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()['bytes'] <= 3000
+    
+    def test_concurrent_misses_load_once(self):
+        """Test simultaneous misses share one load"""
+        import threading
+        import time
+        cache = DataCache()
+        loads = []
+        
+        def load():
+            loads.append(1)
+            time.sleep(0.05)
+            return "data"
+        
+        start = threading.Barrier(8)
+        results = []
+        
+        def worker():
+            start.wait()
+            results.append(cache.get_or_load("k", load))
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ["data"] * 8
+        assert len(loads) == 1
+        assert cache.stats()['deduplicated'] + cache.stats()['hits'] == 7
+    
+    def test_cached_decorator_as_component_source(self):
+        """Test a cached function feeds JSONDisplay and can be invalidated"""
+        cache = DataCache()
+        calls = []
+        
+        @cached(cache=cache)
+        def orders(region):
+            calls.append(region)
+            return [{"region": region, "total": len(calls)}]
+        
+        display = JSONDisplay(lambda: orders("eu"))
+        with RecordingStreamlit() as recording:
+            display.render()
+            display.render()
+        assert calls == ["eu"]
+        assert '"total": 1' in recording.elements[-1].args[0]
+        orders.invalidate("eu")
+        assert orders("eu")[0]["total"] == 2
+
+class TestPersistence:
+    """Test suite for the disk-backed cache store"""
+    
+    def test_entries_survive_restart(self, tmp_path):
+        """Test a fresh cache backed by the same file restores entries lazily"""
+        path = str(tmp_path / "cache.sqlite3")
+        before = DataCache()
+        before.persist(DiskStore(path, version="1"))
+        before.get_or_load("orders", lambda: [1, 2, 3])
+        before._backing[0].close()
+        
+        after = DataCache()
+        store = DiskStore(path, version="1")
+        after.persist(store)
+        assert len(after) == 0
+        assert after.get_or_load("orders", lambda: pytest.fail("reloaded")) == [1, 2, 3]
+        assert store.stats()['hits'] == 1
+    
+    def test_other_versions_are_ignored_and_pruned(self, tmp_path):
+        """Test entries are keyed by version"""
+        path = str(tmp_path / "cache.sqlite3")
+        old = DiskStore(path, version="1")
+        old.save("render", "key", "old payload")
+        old.flush()
+        new = DiskStore(path, version="2")
+        assert new.load("render", "key") is None
+        assert old.load("render", "key") == ("old payload", None)
+        assert new.prune() == 1
+    
+    def test_expired_and_unpicklable_entries(self, tmp_path):
+        """Test expired entries miss and unpicklable values are skipped"""
+        import time
+        store = DiskStore(str(tmp_path / "cache.sqlite3"))
+        store.save("data", "stale", "value", expires=time.time() - 1)
+        store.save("data", "class", contextlib.nullcontext)
+        store.save("data", "lambda", lambda: None)
+        assert store.flush() == 2
+        assert store.load("data", "stale") is None
+        assert store.load("data", "lambda") is None
+    
+    def test_hits_record_access_time_on_flush(self, tmp_path):
+        """Test a hit only queues its access time for the next batch write"""
+        store = DiskStore(str(tmp_path / "cache.sqlite3"))
+        store.save("data", "key", "value")
+        store.flush()
+        
+        def used():
+            return store._connect().execute('SELECT used FROM entries').fetchone()[0]
+        
+        written = used()
+        assert store.load("data", "key") == ("value", None)
+        assert used() == written
+        store.flush()
+        assert used() > written
+    
+    def test_flush_does_not_block_lookups(self, tmp_path):
+        """Test loads and saves go on while a batch is being pickled"""
+        import threading
+        store = DiskStore(str(tmp_path / "cache.sqlite3"))
+        started, release = threading.Event(), threading.Event()
+        
+        class Slow:
+            def __reduce__(self):
+                started.set()
+                release.wait(5)
+                return (str, ("slow",))
+        
+        store.save("data", "slow", Slow())
+        flusher = threading.Thread(target=store.flush)
+        flusher.start()
+        assert started.wait(5)
+        # The batch in flight is still served from memory
+        assert isinstance(store.load("data", "slow")[0], Slow)
+        store.save("data", "other", 1)
+        assert not release.is_set()
+        release.set()
+        flusher.join()
+        assert store.load("data", "slow") == ("slow", None)
+        assert store.flush() == 1
+    
+    def test_render_cache_write_through_and_prewarm(self, tmp_path):
+        """Test prewarm renders headlessly and persists cached payloads"""
+        cache = RenderCache()
+        store = DiskStore(str(tmp_path / "cache.sqlite3"))
+        cache.persist(store, "render")
+        report = prewarm(lambda: st.markdown(cache.get_or_build("html", lambda: "<b>hi</b>")))
+        assert report['written'] == 0   # only the enabled store is flushed
+        assert store.flush() == 1
+        
+        restarted = RenderCache()
+        restarted.persist(store, "render")
+        assert restarted.get("html") == "<b>hi</b>"
+        restarted.clear()
+        assert store.load("render", "html") is None
 
 def test_component_integration():
     """Test integration between multiple components"""